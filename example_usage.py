@@ -20,8 +20,8 @@ import os
 import dotenv
 import time
 import random
-from investment_recommendation_agent import create_investment_recommendation_agent, Runner, APP_NAME, USER_ID, SESSION_ID
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from investment_recommendation_agent import start_session, start_async_init, answer_from_cache, USER_ID, SESSION_ID, STREAMING_RUN_CONFIG, run_main
+from google.adk.agents.run_config import RunConfig
 from google.genai.types import UserContent
 from google.genai.errors import ClientError
 
@@ -31,7 +31,7 @@ INITIAL_DELAY = 2.0
 BACKOFF_FACTOR = 2.0
 JITTER_FACTOR = 0.1
 
-async def run_with_rate_limit(runner, user_id, session_id, new_message):
+async def run_with_rate_limit(runner, user_id, session_id, new_message, run_config=None):
     """
     Run the agent with rate limiting and retry logic for RESOURCE_EXHAUSTED errors and network errors.
 
@@ -40,6 +40,7 @@ async def run_with_rate_limit(runner, user_id, session_id, new_message):
         user_id: The user ID
         session_id: The session ID
         new_message: The message to send
+        run_config: Optional RunConfig, e.g. to stream the response
 
     Yields:
         Events from the runner
@@ -54,7 +55,8 @@ async def run_with_rate_limit(runner, user_id, session_id, new_message):
             run_generator = runner.run_async(
                 user_id=user_id,
                 session_id=session_id,
-                new_message=new_message
+                new_message=new_message,
+                run_config=run_config or RunConfig()
             )
 
             # Process events from the generator
@@ -165,25 +167,12 @@ async def run_example():
     print("=" * 80)
 
     try:
-        # Create the agent using the simplified function
-        agent = create_investment_recommendation_agent()
-
-        # Create a session service
-        session_service = InMemorySessionService()
-
-        # Create a runner for the agent
-        runner = Runner(
-            app_name=APP_NAME,
-            agent=agent,
-            session_service=session_service
-        )
-
-        # Create a session using the constants from investment_recommendation_agent
-        session = session_service.create_session(
-            app_name=APP_NAME,
-            user_id=USER_ID,
-            session_id=SESSION_ID
-        )
+        # Warm up the data provider connections while the agent is built
+        start_async_init()
+
+        # Build the agent and create a session (using the constants from
+        # investment_recommendation_agent) at the same time
+        runner, session = await start_session()
 
         # Display a welcome message from the agent
         print("\n[Investment-Recommendation-Agent]: Hello! I'm the Investment Recommendation Agent. My primary purpose is to provide BUY, HOLD, or SELL recommendations for stocks based on comprehensive analysis of SEC filings, market data, and investor meeting transcripts. When you ask about a company or stock, I'll automatically gather all necessary information by working with my specialized sub-agents. You don't need to guide me through the process - just ask about a company, and I'll do the rest! How can I assist you today?")
@@ -201,12 +190,20 @@ async def run_example():
                 print("\n[Investment-Recommendation-Agent]: Thank you for using the Investment Recommendation Agent. Goodbye!")
                 break
 
+            # Answer simple recommendation requests from a fresh cached analysis when possible
+            cached_answer = answer_from_cache(user_message)
+            if cached_answer:
+                print(f"\n[Investment-Recommendation-Agent]: {cached_answer}")
+                continue
+
             # Create a new message from user input
             new_message = UserContent(user_message)
 
             print("\n[Investment-Recommendation-Agent]: ", end="")
             # Track if we've started printing the response
             response_started = False
+            # Track whether the current model response has been streamed in partial chunks
+            streamed_text = False
 
             # Add a fallback message in case the agent doesn't respond
             fallback_message = None
@@ -220,8 +217,16 @@ async def run_example():
                     runner=runner,
                     user_id=USER_ID,
                     session_id=SESSION_ID,
-                    new_message=new_message
+                    new_message=new_message,
+                    run_config=STREAMING_RUN_CONFIG
                 ):
+                    # The final text event repeats the chunks already streamed, so skip it
+                    if not event.partial and streamed_text:
+                        streamed_text = False
+                        continue
+                    elif event.partial:
+                        streamed_text = True
+
                     # Process the event to extract meaningful content
                     if hasattr(event, 'content') and event.content and event.content.parts:
                         for part in event.content.parts:
@@ -232,10 +237,10 @@ async def run_example():
 
                                 # If this is the first text part, don't add a newline
                                 if not response_started:
-                                    print(part.text, end="")
+                                    print(part.text, end="", flush=True)
                                     response_started = True
                                 else:
-                                    print(part.text, end="")
+                                    print(part.text, end="", flush=True)
 
                             # Handle function calls (show what the agent is doing)
                             elif hasattr(part, 'function_call') and part.function_call:
@@ -267,6 +272,9 @@ async def run_example():
                                         print(f"[Transcript-Summarization-Agent]: Retrieving transcript text...", end="")
                                     elif func_call.name == "summarize_transcript":
                                         print(f"[Transcript-Summarization-Agent]: Summarizing transcript...", end="")
+                                    # Evidence gathering runs all three research agents at once
+                                    elif func_call.name == "gather_evidence":
+                                        print(f"[Investment-Recommendation-Agent]: Researching SEC filings, market data and investor meetings in parallel...", end="")
                                     # Default for any other functions
                                     else:
                                         print(f"[Investment-Recommendation-Agent]: Processing your request...", end="")
@@ -449,6 +457,9 @@ async def run_example():
                                             print(f"[Transcript-Summarization-Agent]: Retrieving transcript text...", end="")
                                         elif func_call.name == "summarize_transcript":
                                             print(f"[Transcript-Summarization-Agent]: Summarizing transcript...", end="")
+                                        # Evidence gathering runs all three research agents at once
+                                        elif func_call.name == "gather_evidence":
+                                            print(f"[Investment-Recommendation-Agent]: Researching SEC filings, market data and investor meetings in parallel...", end="")
                                         # Default for any other functions
                                         else:
                                             print(f"[Investment-Recommendation-Agent]: Processing your request...", end="")
@@ -553,4 +564,4 @@ async def run_example():
 
 if __name__ == "__main__":
     # Run the example
-    asyncio.run(run_example())
+    run_main(run_example())
@@ -0,0 +1,124 @@
+"""
+Agent Runtime
+
+Shared command-line runtime for the agents. Each agent module's main() hands its factory to
+run_agent(), which builds the agent, opens a session, sends the request given on the command
+line (or typed at the prompt) and streams the response to standard output.
+"""
+
+import sys
+import asyncio
+from typing import Any, Callable, Coroutine, Optional
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.runners import Runner
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+
+from filingsResearch.sessions import create_session_async
+
+# Define constants
+USER_ID = "user1234"
+SESSION_ID = "1234"
+
+# Stream model output as server-sent events, so the response can be printed as it is generated
+STREAMING_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+def run_main(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a command-line entry point to completion, on uvloop's event loop if it is installed.
+
+    uvloop schedules coroutines and handles socket I/O with less overhead than the default
+    asyncio loop, which adds up over the many concurrent HTTP requests of a recommendation.
+    It isn't available on Windows, where the default loop is used.
+
+    Args:
+        main (coroutine): The entry point, e.g. main()
+
+    Returns:
+        The entry point's result
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+def read_prompt() -> str:
+    """
+    Get the user's request from the command line arguments, or from standard input if none are given.
+
+    Returns:
+        str: The request text
+    """
+    return " ".join(sys.argv[1:]) or input("You: ")
+
+async def stream_response(runner: Runner, session_id: str, prompt: str, user_id: str = USER_ID) -> str:
+    """
+    Send a request to an agent and write its response to standard output as it is generated.
+
+    Args:
+        runner (Runner): The agent's runner
+        session_id (str): The session to run in
+        prompt (str): The user's request
+        user_id (str, optional): The user the session belongs to. Defaults to USER_ID.
+
+    Returns:
+        str: The text of the agent's final response
+    """
+    final_text = ""
+    streamed = False
+    async for event in runner.run_async(
+        user_id=user_id,
+        session_id=session_id,
+        new_message=types.Content(role="user", parts=[types.Part(text=prompt)]),
+        run_config=STREAMING_RUN_CONFIG
+    ):
+        if not (event.content and event.content.parts):
+            continue
+        text = "".join(part.text or "" for part in event.content.parts)
+        if event.partial:
+            # Write each streamed chunk as soon as it arrives
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            streamed = True
+        elif event.is_final_response():
+            # The final event repeats the streamed text in full
+            print("" if streamed else text)
+            streamed = False
+            final_text = text
+
+    return final_text
+
+async def run_agent(factory: Callable[[], Agent], app_name: Optional[str] = None,
+                    session_service: Optional[BaseSessionService] = None) -> None:
+    """
+    Run an agent on a single request from the command line.
+
+    Configuration errors raised by the factory (such as a missing API key) are printed
+    instead of propagated.
+
+    Args:
+        factory (callable): Builds the agent to run
+        app_name (str, optional): The application name for the runner. Defaults to the agent's name.
+        session_service (BaseSessionService, optional): The session service to use.
+                                                        Defaults to a new InMemorySessionService.
+    """
+    try:
+        agent = factory()
+    except ValueError as e:
+        # The detailed instructions are already included in the error message from the factory
+        print(f"Error: {e}")
+        return
+
+    session_service = session_service or InMemorySessionService()
+    app_name = app_name or agent.name
+    runner = Runner(app_name=app_name, agent=agent, session_service=session_service)
+    await create_session_async(session_service, app_name=app_name, user_id=USER_ID, session_id=SESSION_ID)
+
+    await stream_response(runner, SESSION_ID, read_prompt())
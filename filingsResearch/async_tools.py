@@ -0,0 +1,31 @@
+"""
+Threaded Agent Tools
+
+google-adk runs synchronous function tools directly on the event loop thread, so a tool
+that waits on the network or a rate limiter (TokenBucket.acquire sleeps) would freeze every
+other agent, the streamed output and the evidence timeouts while it runs. run_in_thread()
+turns such a tool into an async one whose body runs in a worker thread.
+"""
+
+import asyncio
+import functools
+from typing import Any, Callable, Coroutine
+
+def run_in_thread(func: Callable) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    Wrap a synchronous tool so ADK awaits it in a worker thread instead of calling it on
+    the event loop.
+
+    The wrapper keeps the tool's name, docstring and signature, so the model sees the same
+    function declaration.
+
+    Args:
+        func (callable): The synchronous tool
+
+    Returns:
+        callable: An async tool with the same name, docstring and parameters
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
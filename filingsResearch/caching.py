@@ -0,0 +1,382 @@
+"""
+Persistent Tool Response Cache
+
+This module provides a small file-based cache for the research tools. SEC filings, company
+profiles, prices and transcripts are requested over and over for the same tickers, so the
+results of each tool call are stored on disk as JSON and reused until their TTL expires.
+
+Entries live under {cache_dir}/{tool_name}/{md5(arguments)}.json and carry a timestamp and
+TTL header. Error responses are never cached, so a failed request is retried next time.
+
+When REDIS_URL is set (and the redis package is installed), entries are kept in Redis
+instead, so several processes or machines share one cache; keys are
+{tool_name}:{md5(arguments)} and Redis expires them after their TTL.
+"""
+
+import os
+import json
+import math
+import time
+import hashlib
+import inspect
+import asyncio
+import functools
+from typing import Any, Callable, Optional, Tuple, Union
+
+from filingsResearch.config import Config
+
+# orjson is optional; when installed it serializes cache entries and tool payloads faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# redis is optional; it is only needed when REDIS_URL is set
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Common TTLs, in seconds
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Leading text of the error messages returned by the string-valued tools
+ERROR_PREFIXES = ("Error", "Failed", "Could not", "Invalid", "# No Transcript Found")
+
+def dumps_json(value: Any) -> str:
+    """
+    Serialize a value to compact JSON, using orjson when it is installed.
+
+    Values JSON doesn't support natively (dates, numpy scalars, ...) are converted with str().
+
+    Args:
+        value (Any): The value to serialize
+
+    Returns:
+        str: The compact JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+def loads_json(text: Any) -> Any:
+    """
+    Parse JSON text or bytes, using orjson when it is installed.
+
+    Args:
+        text (str or bytes): The JSON to parse
+
+    Returns:
+        Any: The parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+class FileCache:
+    """
+    A JSON file cache with a per-entry time-to-live.
+
+    Each entry is a single file, written atomically, so concurrent agents can share
+    the cache without locking.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str, optional): Root directory for cache files. Defaults to Config.get_cache_dir().
+        """
+        self.cache_dir = cache_dir or Config.get_cache_dir()
+
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(self.cache_dir, namespace, f"{key}.json")
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            namespace (str): The cache namespace, usually the tool name
+            key (str): The entry key within the namespace
+
+        Returns:
+            tuple: (hit, value) where hit is False if the entry is missing, expired or unreadable
+        """
+        path = self._path(namespace, key)
+        try:
+            with open(path, "rb") as cache_file:
+                entry = loads_json(cache_file.read())
+        except (OSError, ValueError):
+            return False, None
+
+        if time.time() - entry.get("timestamp", 0) > entry.get("ttl", 0):
+            return False, None
+
+        return True, entry.get("value")
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value in the cache.
+
+        Values that can't be serialized to JSON, and write failures, are silently skipped;
+        the cache is only an optimization.
+
+        Args:
+            namespace (str): The cache namespace, usually the tool name
+            key (str): The entry key within the namespace
+            value (Any): The JSON-serializable value to store
+            ttl (float): How long the entry stays valid, in seconds
+        """
+        path = self._path(namespace, key)
+        try:
+            payload = dumps_json({"timestamp": time.time(), "ttl": ttl, "value": value})
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                cache_file.write(payload)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def delete(self, namespace: str, key: str) -> None:
+        """
+        Remove an entry from the cache, if it exists.
+
+        Args:
+            namespace (str): The cache namespace, usually the tool name
+            key (str): The entry key within the namespace
+        """
+        try:
+            os.remove(self._path(namespace, key))
+        except OSError:
+            pass
+
+# Seconds to wait for the Redis server before falling back to the file cache
+REDIS_TIMEOUT = 2
+
+class RedisCache:
+    """
+    A cache with the same interface as FileCache, stored in Redis.
+
+    Redis expires entries itself, so a lookup is a single GET. Connection errors are treated
+    as cache misses; like the file cache, Redis is only an optimization.
+    """
+
+    def __init__(self, client: "redis.Redis"):
+        """
+        Initialize the cache.
+
+        Args:
+            client (redis.Redis): The Redis client to store entries with
+        """
+        self.client = client
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            namespace (str): The cache namespace, usually the tool name
+            key (str): The entry key within the namespace
+
+        Returns:
+            tuple: (hit, value) where hit is False if the entry is missing, expired or unreadable
+        """
+        try:
+            payload = self.client.get(f"{namespace}:{key}")
+        except redis.RedisError:
+            return False, None
+        if payload is None:
+            return False, None
+        try:
+            return True, loads_json(payload)
+        except ValueError:
+            return False, None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            namespace (str): The cache namespace, usually the tool name
+            key (str): The entry key within the namespace
+            value (Any): The JSON-serializable value to store
+            ttl (float): How long the entry stays valid, in seconds
+        """
+        try:
+            self.client.setex(f"{namespace}:{key}", max(1, math.ceil(ttl)), dumps_json(value))
+        except (redis.RedisError, TypeError, ValueError):
+            pass
+
+    def delete(self, namespace: str, key: str) -> None:
+        """
+        Remove an entry from the cache, if it exists.
+
+        Args:
+            namespace (str): The cache namespace, usually the tool name
+            key (str): The entry key within the namespace
+        """
+        try:
+            self.client.delete(f"{namespace}:{key}")
+        except redis.RedisError:
+            pass
+
+def _create_cache() -> Union[FileCache, RedisCache]:
+    """
+    Create the cache selected by the configuration: Redis if REDIS_URL is set and the
+    server can be reached, the file cache otherwise.
+
+    Returns:
+        FileCache or RedisCache: The new cache
+    """
+    redis_url = Config.get_redis_url()
+    if redis_url and redis is not None:
+        client = redis.Redis.from_url(
+            redis_url, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT
+        )
+        try:
+            client.ping()
+            return RedisCache(client)
+        except redis.RedisError as e:
+            print(f"Could not connect to Redis, caching on disk instead: {str(e)}")
+    return FileCache()
+
+# Shared cache used by the @cached decorator
+_default_cache: Optional[Union[FileCache, RedisCache]] = None
+
+def get_cache() -> Union[FileCache, RedisCache]:
+    """
+    Get the shared cache instance, creating it on first use.
+
+    Returns:
+        FileCache or RedisCache: The shared cache
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = _create_cache()
+    return _default_cache
+
+# Parameters naming a company, ticker or other identifier that is not case-sensitive. Their
+# values are case-folded in cache keys; other strings (URLs, transcript text) keep their case.
+CASE_INSENSITIVE_PARAMETERS = frozenset({
+    "ticker", "ticker_symbol", "company_name", "name", "cik", "filing_type", "period", "interval",
+})
+
+def _normalize_argument(value: Any, casefold: bool = False) -> Any:
+    """
+    Normalize an argument so trivially different calls share a cache entry.
+
+    Strings are stripped, and case-folded if asked, so "apple " and "Apple" hit the same entry.
+
+    Args:
+        value (Any): The argument value
+        casefold (bool, optional): Whether to case-fold strings. Defaults to False.
+
+    Returns:
+        Any: The normalized value
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        return value.casefold() if casefold else value
+    if isinstance(value, dict):
+        return {str(k): _normalize_argument(v, casefold) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_argument(v, casefold) for v in value]
+    return value
+
+def make_cache_key(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """
+    Build the cache key for a call from its normalized arguments.
+
+    Args:
+        signature (inspect.Signature): The signature of the cached function
+        args (tuple): Positional arguments of the call
+        kwargs (dict): Keyword arguments of the call
+
+    Returns:
+        str: The MD5 hex digest of the normalized arguments
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    normalized = {
+        name: _normalize_argument(value, name in CASE_INSENSITIVE_PARAMETERS)
+        for name, value in bound.arguments.items()
+    }
+    encoded = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.md5(encoded.encode("utf-8")).hexdigest()
+
+def is_error_response(result: Any) -> bool:
+    """
+    Check whether a tool result is an error that should not be cached.
+
+    Args:
+        result (Any): The value returned by a tool
+
+    Returns:
+        bool: True for error dicts, empty or error-carrying lists, and error message strings
+    """
+    if result is None:
+        return True
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list):
+        return not result or any(isinstance(item, dict) and "error" in item for item in result)
+    if isinstance(result, str):
+        text = result.lstrip()
+        # Chunked filing text is prefixed with "[Chunk i of n] "
+        if text.startswith("[Chunk "):
+            text = text.split("] ", 1)[-1]
+        return not text or text.startswith(ERROR_PREFIXES)
+    return False
+
+def cached(ttl: Union[float, Callable[..., float]], namespace: Optional[str] = None) -> Callable:
+    """
+    Decorator that caches a tool's results on disk for a given time-to-live.
+
+    Works on both regular and async functions, and keeps the wrapped function's name,
+    docstring and signature so it can still be registered as an agent tool.
+
+    Args:
+        ttl (float or callable): How long results stay valid, in seconds, or a function that
+                                 takes the call's arguments and returns the TTL for its result
+        namespace (str, optional): Cache namespace. Defaults to the function name.
+
+    Returns:
+        callable: The decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cache_namespace = namespace or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache = get_cache()
+                key = make_cache_key(signature, args, kwargs)
+                hit, value = cache.get(cache_namespace, key)
+                if hit:
+                    return value
+                result = await func(*args, **kwargs)
+                if not is_error_response(result):
+                    cache.set(cache_namespace, key, result, ttl(*args, **kwargs) if callable(ttl) else ttl)
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            key = make_cache_key(signature, args, kwargs)
+            hit, value = cache.get(cache_namespace, key)
+            if hit:
+                return value
+            result = func(*args, **kwargs)
+            if not is_error_response(result):
+                cache.set(cache_namespace, key, result, ttl(*args, **kwargs) if callable(ttl) else ttl)
+            return result
+        return wrapper
+
+    return decorator
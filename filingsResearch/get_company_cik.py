@@ -1,8 +1,11 @@
-import requests
 from bs4 import BeautifulSoup
 import re
 from filingsResearch.config import Config
+from filingsResearch.http_session import get_http_session
+from filingsResearch.rate_limit import SEC_LIMITER
+from filingsResearch.caching import cached, DAY
 
+@cached(ttl=30 * DAY)
 def find_cik(company_name: str) -> list:
     """
     Find the CIK (Central Index Key) for a company using the SEC's CIK lookup tool.
@@ -26,8 +29,9 @@ def find_cik(company_name: str) -> list:
         'company': company_name
     }
 
-    # Make the POST request
-    response = requests.post(url, headers=headers, data=data)
+    # Make the POST request, staying within the SEC's request rate
+    SEC_LIMITER.acquire()
+    response = get_http_session().post(url, headers=headers, data=data)
 
     # Check if the request was successful
     if response.status_code != 200:
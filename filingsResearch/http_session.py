@@ -0,0 +1,106 @@
+"""
+Shared HTTP Session
+
+This module provides a single connection-pooled requests.Session for the SEC EDGAR, Yahoo
+Finance and Alpha Vantage tools. Reusing pooled keep-alive connections avoids a DNS lookup
+and TLS handshake on every tool call, and prewarm_connections() opens them ahead of the
+first request. Rate-limited and transient server errors are retried with backoff, requests
+that don't set a timeout get REQUEST_TIMEOUT, and the pooled connections are closed when the
+process exits.
+"""
+
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from filingsResearch.config import Config
+
+# Connection pool sizing: pools are kept per host, each holding up to POOL_MAXSIZE connections
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 100
+
+# Idempotent requests that hit a rate limit or a transient server error are retried with
+# exponential backoff (0.3s, 0.6s, 1.2s), honouring any Retry-After header. After the last
+# retry the error response is returned as usual instead of raising.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False,
+)
+
+# Timeout in seconds for requests that don't set their own, so a stalled connection can't
+# hold up a tool call indefinitely
+REQUEST_TIMEOUT = 15
+
+# Hosts contacted by the research tools, opened by prewarm_connections()
+PREWARM_URLS = (
+    "https://www.sec.gov/",
+    "https://query1.finance.yahoo.com/",
+    "https://www.alphavantage.co/",
+)
+
+class _PooledSession(requests.Session):
+    """
+    A requests.Session that applies REQUEST_TIMEOUT to requests made without a timeout.
+    """
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session: The shared, connection-pooled session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = _PooledSession()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+                atexit.register(session.close)
+    return _session
+
+def _prewarm(url: str, timeout: float) -> bool:
+    try:
+        get_http_session().head(url, headers={"User-Agent": Config.get_sec_user_agent()}, timeout=timeout)
+        return True
+    except requests.RequestException:
+        return False
+
+def prewarm_connections(urls: Iterable[str] = PREWARM_URLS, timeout: float = 5.0) -> Dict[str, bool]:
+    """
+    Open pooled connections to the data providers before the first tool call.
+
+    Each host is contacted once, in parallel, so the DNS lookup and TLS handshake are done
+    up front. Failures are reported but otherwise ignored; the tools connect normally later.
+
+    Args:
+        urls (iterable, optional): URLs of the hosts to connect to. Defaults to PREWARM_URLS.
+        timeout (float, optional): Timeout for each request in seconds. Defaults to 5.0.
+
+    Returns:
+        dict: Whether each URL was reached, keyed by URL
+    """
+    urls = list(urls)
+    with ThreadPoolExecutor(max_workers=max(1, len(urls))) as executor:
+        results = executor.map(lambda url: _prewarm(url, timeout), urls)
+        return dict(zip(urls, results))
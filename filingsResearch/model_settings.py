@@ -0,0 +1,32 @@
+"""
+Agent Model Settings
+
+Generation settings shared by every agent, so the root agent and the research agents ask
+Gemini for responses the same way.
+"""
+
+from google.genai import types
+
+def agent_content_config(**overrides) -> types.GenerateContentConfig:
+    """
+    Build the generate_content_config for an agent.
+
+    Function calling is set to AUTO mode, so Gemini may return several independent function
+    calls in a single turn (one planning step instead of one per call) and still answer in
+    text once it has what it needs. A single candidate is requested so responses can be
+    streamed as they are generated.
+
+    Args:
+        **overrides: Additional GenerateContentConfig fields (e.g. temperature)
+
+    Returns:
+        types.GenerateContentConfig: The generation settings
+    """
+    settings = dict(
+        candidate_count=1,
+        tool_config=types.ToolConfig(
+            function_calling_config=types.FunctionCallingConfig(mode=types.FunctionCallingConfigMode.AUTO)
+        ),
+    )
+    settings.update(overrides)
+    return types.GenerateContentConfig(**settings)
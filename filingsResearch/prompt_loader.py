@@ -0,0 +1,27 @@
+"""
+Prompt Loader
+
+Agent instructions and prompt templates are kept as text files in the prompts/ directory at
+the project root rather than as string literals in the agent modules. load_prompt() reads a
+prompt the first time an agent factory asks for it and keeps it in memory afterwards, so
+importing an agent module doesn't pay for prompts it never uses.
+"""
+
+import functools
+from pathlib import Path
+
+# The prompts/ directory next to the agent packages
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+@functools.lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """
+    Read a prompt file from the prompts/ directory.
+
+    Args:
+        name (str): The file name, e.g. "market_data.md"
+
+    Returns:
+        str: The prompt text
+    """
+    return (PROMPTS_DIR / name).read_text(encoding="utf-8")
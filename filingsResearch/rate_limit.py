@@ -0,0 +1,154 @@
+"""
+Provider Rate Limiting
+
+This module keeps the agents within the request rates of the services they call. Each provider
+has a shared token bucket that every tool and agent draws from, so bursty fan-out (parallel
+research agents, batch recommendations) is smoothed out instead of triggering 429 errors and
+slow retry loops.
+
+It also provides rate_limited_model(), a Gemini model for ADK agents that waits for the Gemini
+limiter before each request and retries RESOURCE_EXHAUSTED errors with exponential backoff.
+"""
+
+import time
+import random
+import asyncio
+import threading
+from typing import AsyncGenerator
+
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai.errors import ClientError
+
+from filingsResearch.config import Config
+
+# Retry parameters for rate-limited Gemini requests
+MAX_RETRIES = 5
+INITIAL_DELAY = 1.0
+MAX_DELAY = 30.0
+JITTER_FACTOR = 0.1
+
+class TokenBucket:
+    """
+    A thread-safe token bucket allowing `rate` requests per `period` seconds.
+
+    Tokens refill continuously, so up to `rate` requests can go out at once and the rest are
+    spread evenly. acquire() blocks the calling thread (for tools running in worker threads);
+    acquire_async() waits without blocking the event loop.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate (float): Number of requests allowed per period
+            period (float, optional): Length of the period in seconds. Defaults to 60.0.
+        """
+        self.capacity = rate
+        self.refill_per_second = rate / period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token, going into debt if none is available.
+
+        Returns:
+            float: How long the caller must wait before its request may go out, in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def acquire(self) -> None:
+        """
+        Wait, blocking the current thread, until a request may be sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Wait, without blocking the event loop, until a request may be sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+# Shared limiters, one per provider
+GEMINI_LIMITER = TokenBucket(500, 60)        # Gemini API requests per minute
+ALPHA_VANTAGE_LIMITER = TokenBucket(Config.get_alpha_vantage_requests_per_minute(), 60)
+SEC_LIMITER = TokenBucket(10, 1)             # SEC EDGAR fair-access limit
+
+def is_rate_limit_error(exception: Exception) -> bool:
+    """
+    Check whether an exception is a Gemini rate-limit (429 / RESOURCE_EXHAUSTED) error.
+
+    Args:
+        exception (Exception): The exception to check
+
+    Returns:
+        bool: True if the request should be retried after backing off
+    """
+    return isinstance(exception, ClientError) and (
+        getattr(exception, "code", None) == 429 or "RESOURCE_EXHAUSTED" in str(exception)
+    )
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Get the exponential backoff delay, with jitter, for a retry attempt.
+
+    Args:
+        attempt (int): The retry attempt, starting at 0
+
+    Returns:
+        float: The delay in seconds
+    """
+    delay = min(MAX_DELAY, INITIAL_DELAY * (2 ** attempt))
+    return delay * (1 + random.random() * JITTER_FACTOR)
+
+class RateLimitedGemini(Gemini):
+    """
+    A Gemini model that waits for GEMINI_LIMITER before each request and retries
+    rate-limit errors with exponential backoff.
+    """
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        attempt = 0
+        while True:
+            await GEMINI_LIMITER.acquire_async()
+            started = False
+            try:
+                async for response in super().generate_content_async(llm_request, stream):
+                    started = True
+                    yield response
+                return
+            except ClientError as e:
+                # A partially streamed response can't be retried
+                if started or attempt >= MAX_RETRIES or not is_rate_limit_error(e):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+                attempt += 1
+
+def rate_limited_model(model: str = "gemini-2.0-flash") -> RateLimitedGemini:
+    """
+    Create a rate-limited Gemini model for an ADK agent.
+
+    Args:
+        model (str, optional): The Gemini model name. Defaults to "gemini-2.0-flash".
+
+    Returns:
+        RateLimitedGemini: The model, for an agent's `model` parameter
+    """
+    return RateLimitedGemini(model=model)
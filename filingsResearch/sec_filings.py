@@ -17,12 +17,27 @@ import re
 import os
 import json
 import warnings
+from dataclasses import dataclass, field
 import time
 import random
-from typing import List, Dict, Any, Optional, Callable
+import asyncio
+import bisect
+import functools
+import inspect
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Callable, Union
 import json
 
 from filingsResearch.config import Config
+from filingsResearch.http_session import get_http_session
+from filingsResearch.rate_limit import SEC_LIMITER
+from filingsResearch.caching import cached, dumps_json, get_cache, make_cache_key, DAY
+
+# Hyperscan is optional; when installed it scans for all keywords in a single pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # Filter the XMLParsedAsHTMLWarning
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
@@ -30,6 +45,100 @@ warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 # Import the existing find_cik function
 from filingsResearch.get_company_cik import find_cik
 
+# Number of parsed filings kept in memory so repeated chunk requests don't re-download them
+FILING_TEXT_CACHE_SIZE = 32
+
+# Prefixes of the error messages extract_filing_text returns instead of filing content
+FILING_TEXT_ERROR_PREFIXES = (
+    "Failed to retrieve",
+    "Could not find",
+    "Error extracting",
+)
+
+@dataclass
+class _FilingCacheEntry:
+    """
+    A parsed filing held in the in-memory cache.
+
+    The text is stored as UTF-8 bytes so chunks can be sliced through the memoryview
+    without copying, and the length is recorded once so chunk requests don't recompute it.
+    """
+    text: bytes = field(repr=False)
+    length: int
+    view: memoryview = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.view = memoryview(self.text)
+
+_filing_text_cache: "OrderedDict[str, _FilingCacheEntry]" = OrderedDict()
+
+# Background tasks used by summarize_filing_async: filing loads in flight (so concurrent
+# requests for the same URL share one download) and the next chunk prefetched per URL
+_filing_load_tasks: Dict[str, "asyncio.Task"] = {}
+_chunk_prefetch_tasks: Dict[str, tuple] = {}
+
+# Limits for the condensed digest built by summarize_filing_all
+DIGEST_CHUNK_SIZE = 200000
+DIGEST_MAX_CONTEXTS_PER_KEYWORD = 3
+DIGEST_MAX_GROWTH_TRENDS = 15
+DIGEST_SECTION_CHARS = 4000
+
+# Patterns used by extract_filing_information, compiled once at import time.
+# Order matters for filing types: the first match wins.
+_FILING_TYPE_PATTERNS = [
+    ("10-K (Annual Report)", re.compile(r'Form\s+10-K', re.IGNORECASE)),
+    ("10-Q (Quarterly Report)", re.compile(r'Form\s+10-Q', re.IGNORECASE)),
+    ("8-K (Current Report)", re.compile(r'Form\s+8-K', re.IGNORECASE)),
+    ("DEF 14A (Proxy Statement)", re.compile(r'Form\s+DEF\s+14A|Proxy\s+Statement', re.IGNORECASE)),
+    ("S-1 (IPO Filing)", re.compile(r'Form\s+S-1', re.IGNORECASE)),
+    ("S-3 (Shelf Registration)", re.compile(r'Form\s+S-3', re.IGNORECASE)),
+    ("Form 4 (Insider Transactions)", re.compile(r'Form\s+4', re.IGNORECASE)),
+]
+
+_METRIC_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE) for name, pattern in {
+        'Revenue': r'(?:total\s+revenue|revenue)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
+        'Net Income': r'(?:net\s+income|net\s+earnings|net\s+profit)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
+        'EPS': r'(?:earnings\s+per\s+share|EPS)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)',
+        'Operating Income': r'(?:operating\s+income|income\s+from\s+operations)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
+        'Gross Margin': r'(?:gross\s+margin)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:%|percent)?',
+        'Total Assets': r'(?:total\s+assets)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
+        'Total Debt': r'(?:total\s+debt|long-term\s+debt)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?'
+    }.items()
+}
+
+_GROWTH_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'(?:revenue|sales)\s+(?:increased|decreased|grew|declined)\s+by\s+(?:approximately\s+)?([\d,]+(?:\.\d+)?)\s*(?:%|percent)',
+        r'(?:profit|income|earnings)\s+(?:increased|decreased|grew|declined)\s+by\s+(?:approximately\s+)?([\d,]+(?:\.\d+)?)\s*(?:%|percent)',
+        r'(?:margin|margins)\s+(?:increased|decreased|improved|declined)\s+by\s+(?:approximately\s+)?([\d,]+(?:\.\d+)?)\s*(?:%|percent|basis\s+points|bps)'
+    ]
+]
+
+# Common section headers in SEC filings, with the aliases tried for each section
+_SECTION_HEADERS = {
+    'Business Description': ['Item 1', 'Business', 'Description of Business'],
+    'Risk Factors': ['Item 1A', 'Risk Factors', 'Risks'],
+    'MD&A': ['Item 7', 'Management\'s Discussion', 'MD&A'],
+    'Financial Statements': ['Item 8', 'Financial Statements'],
+    'Executive Compensation': ['Executive Compensation', 'Compensation Discussion'],
+    'Material Events': ['Material Events', 'Recent Developments']
+}
+
+# All header aliases in one pattern, each in its own named group. Wrapping the union in a
+# lookahead reports every position where an alias starts, even inside another alias
+# (e.g. "Business" within "Description of Business"), in a single scan of the text.
+_SECTION_ALIASES = [(section_name, header) for section_name, headers in _SECTION_HEADERS.items() for header in headers]
+_SECTION_HEADER_UNION = re.compile(
+    r'(?i)(?=' + '|'.join(
+        f'(?P<h{index}>' + re.escape(header) + r'[:\.\s])' for index, (_, header) in enumerate(_SECTION_ALIASES)
+    ) + ')'
+)
+
+# A section runs until the next "Item N" or "PART X" heading. Matching this as a
+# zero-width lookahead finds every heading start, including overlapping ones.
+_SECTION_END = re.compile(r'(?i)(?=Item\s+\d|PART\s+[IVX])')
+
 def retry_with_backoff(max_retries: int = 5, initial_delay: float = 1.0, 
                       backoff_factor: float = 2.0, jitter: bool = True,
                       retry_on: Callable[[Exception], bool] = None) -> Callable:
@@ -144,6 +253,7 @@ def get_company_info(cik: str) -> Dict[str, Any]:
     except json.JSONDecodeError:
         return {"error": "Failed to parse company information JSON"}
 
+@cached(ttl=1 * DAY)
 def find_filings(cik: str, filing_type: Optional[str], count: int) -> List[Dict[str, Any]]:
     """
     Find the company's most recent filings from the CIK.
@@ -403,7 +513,8 @@ def make_request(url: str, headers: Dict[str, str]) -> requests.Response:
     Returns:
         requests.Response: The response from the server
     """
-    response = requests.get(url, headers=headers, timeout=30)
+    SEC_LIMITER.acquire()
+    response = get_http_session().get(url, headers=headers, timeout=30)
     response.raise_for_status()  # Raise an exception for 4xx/5xx status codes
     return response
 
@@ -1107,6 +1218,201 @@ def extract_filing_text(filing_url: str) -> str:
         # Catch any unexpected errors
         return f"Error extracting filing text: {str(e)}"
 
+def _get_filing_entry(filing_url: str) -> Union[_FilingCacheEntry, str]:
+    """
+    Get the parsed text of an SEC filing, reusing a cached copy if available.
+
+    Parsed filings are kept in a small in-memory LRU cache keyed by URL, so fetching
+    chunks 0..N-1 of the same filing downloads and parses it only once. Error messages
+    returned by extract_filing_text are passed through as str and never cached.
+
+    Args:
+        filing_url (str): The URL of the SEC filing index page
+
+    Returns:
+        _FilingCacheEntry | str: The cached filing, or an error message string
+    """
+    if filing_url in _filing_text_cache:
+        _filing_text_cache.move_to_end(filing_url)
+        return _filing_text_cache[filing_url]
+
+    filing_text = extract_filing_text(filing_url)
+    if filing_text.startswith(FILING_TEXT_ERROR_PREFIXES):
+        return filing_text
+
+    filing_bytes = filing_text.encode('utf-8', errors='replace')
+    entry = _FilingCacheEntry(text=filing_bytes, length=len(filing_bytes))
+    _filing_text_cache[filing_url] = entry
+    if len(_filing_text_cache) > FILING_TEXT_CACHE_SIZE:
+        _filing_text_cache.popitem(last=False)
+
+    return entry
+
+def _utf8_boundary(buffer: memoryview, pos: int) -> int:
+    """
+    Move a byte offset back so it does not fall inside a multi-byte UTF-8 character.
+
+    Args:
+        buffer (memoryview): The UTF-8 encoded text
+        pos (int): The candidate byte offset
+
+    Returns:
+        int: The nearest offset at or before pos that starts a character
+    """
+    while 0 < pos < len(buffer) and (buffer[pos] & 0xC0) == 0x80:
+        pos -= 1
+    return pos
+
+@functools.lru_cache(maxsize=8)
+def _compile_keyword_database(keywords: tuple):
+    """
+    Compile a Hyperscan database matching every keyword as a whole word, case-insensitively.
+
+    Args:
+        keywords (tuple): The literal keywords; match ids are their positions in the tuple
+
+    Returns:
+        hyperscan.Database: The compiled block-mode database
+    """
+    expressions = []
+    for keyword in keywords:
+        # Escape everything that isn't alphanumeric so the keyword is matched literally
+        escaped = ''.join(char if char.isalnum() else f'\\x{ord(char):02x}' for char in keyword)
+        expressions.append(f'\\b{escaped}\\b'.encode('ascii'))
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(keywords))),
+        elements=len(keywords),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(keywords)
+    )
+    return database
+
+def _scan_keywords_hyperscan(filing_text: str, keywords: List[str]) -> Optional[Dict[str, List[tuple]]]:
+    """
+    Find all keywords in one Hyperscan pass over the filing text.
+
+    Only used for ASCII text and keywords, where byte offsets equal character offsets.
+    Overlapping hits are dropped so the results match re.finditer.
+
+    Args:
+        filing_text (str): The filing text
+        keywords (list): The literal keywords to search for
+
+    Returns:
+        dict: keyword -> list of (start, end) offsets, or None if Hyperscan can't be used
+    """
+    if hyperscan is None or not filing_text.isascii() or not all(keyword and keyword.isascii() for keyword in keywords):
+        return None
+
+    try:
+        database = _compile_keyword_database(tuple(keywords))
+        hits = []
+
+        def on_match(match_id, start, end, flags, context):
+            hits.append((match_id, start, end))
+
+        database.scan(filing_text.encode('ascii'), match_event_handler=on_match)
+    except Exception as e:
+        print(f"Hyperscan keyword scan failed, falling back to str.find: {str(e)}")
+        return None
+
+    spans = {keyword: [] for keyword in keywords}
+    last_end = [-1] * len(keywords)
+    for match_id, start, end in sorted(hits, key=lambda hit: (hit[0], hit[1])):
+        if start >= last_end[match_id]:
+            spans[keywords[match_id]].append((start, end))
+            last_end[match_id] = end
+    return spans
+
+def _collapse_ws(text: str) -> str:
+    """
+    Collapse every run of whitespace to a single space and trim the ends.
+
+    Used to clean the short context windows cut around keyword and growth-trend matches.
+    str.split() with no arguments splits on the same Unicode whitespace as the regex \\s,
+    without going through the regex engine.
+
+    Args:
+        text (str): The text to normalize
+
+    Returns:
+        str: The normalized text
+    """
+    return ' '.join(text.split())
+
+def _context_windows(text: str, spans: List[tuple], radius: int) -> List[str]:
+    """
+    Cut a cleaned-up context window around each match.
+
+    Args:
+        text (str): The text the spans refer to
+        spans (list): (start, end) offsets of the matches
+        radius (int): Number of characters to keep on either side of each match
+
+    Returns:
+        list: One whitespace-normalized context string per span
+    """
+    text_length = len(text)
+    return [
+        _collapse_ws(text[max(0, start - radius):min(text_length, end + radius)])
+        for start, end in spans
+    ]
+
+def _is_word_char(char: str) -> bool:
+    """
+    Check whether a character counts as a word character for regex word-boundary purposes.
+
+    Args:
+        char (str): A single character
+
+    Returns:
+        bool: True if the character is alphanumeric or an underscore
+    """
+    return char.isalnum() or char == '_'
+
+def _find_keyword_spans(filing_text: str, lowered_text: Optional[str], keyword: str) -> List[tuple]:
+    """
+    Find whole-word, case-insensitive occurrences of a literal keyword.
+
+    Uses str.find on the pre-lowered filing text instead of running the regex engine
+    for every keyword, checking word boundaries by hand. Falls back to a regex search
+    when the lowered text or keyword no longer lines up with the original offsets.
+
+    Args:
+        filing_text (str): The original filing text
+        lowered_text (str, optional): filing_text.lower(), or None if offsets would not match
+        keyword (str): The literal keyword to search for
+
+    Returns:
+        list: (start, end) offsets of each match in filing_text
+    """
+    needle = keyword.lower()
+    if lowered_text is None or not needle or len(needle) != len(keyword):
+        pattern = r'\b' + re.escape(keyword) + r'\b'
+        return [match.span() for match in re.finditer(pattern, filing_text, re.IGNORECASE)]
+
+    text_length = len(lowered_text)
+    needle_length = len(needle)
+    starts_with_word = _is_word_char(needle[0])
+    ends_with_word = _is_word_char(needle[-1])
+
+    spans = []
+    pos = lowered_text.find(needle)
+    while pos != -1:
+        end = pos + needle_length
+        # \b holds where the word-ness of the characters on either side differs
+        before_is_word = pos > 0 and _is_word_char(lowered_text[pos - 1])
+        after_is_word = end < text_length and _is_word_char(lowered_text[end])
+        if before_is_word != starts_with_word and after_is_word != ends_with_word:
+            spans.append((pos, end))
+            pos = lowered_text.find(needle, end)
+        else:
+            pos = lowered_text.find(needle, pos + 1)
+
+    return spans
+
 def extract_filing_information(filing_text: str, keywords: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Extract key information from an SEC filing text.
@@ -1156,55 +1462,34 @@ def extract_filing_information(filing_text: str, keywords: Optional[List[str]] =
         return extracted_info
 
     # Determine the filing type based on content
-    if re.search(r'Form\s+10-K', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "10-K (Annual Report)"
-    elif re.search(r'Form\s+10-Q', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "10-Q (Quarterly Report)"
-    elif re.search(r'Form\s+8-K', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "8-K (Current Report)"
-    elif re.search(r'Form\s+DEF\s+14A|Proxy\s+Statement', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "DEF 14A (Proxy Statement)"
-    elif re.search(r'Form\s+S-1', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "S-1 (IPO Filing)"
-    elif re.search(r'Form\s+S-3', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "S-3 (Shelf Registration)"
-    elif re.search(r'Form\s+4', filing_text, re.IGNORECASE):
-        extracted_info['filing_type'] = "Form 4 (Insider Transactions)"
+    for filing_type, pattern in _FILING_TYPE_PATTERNS:
+        if pattern.search(filing_text):
+            extracted_info['filing_type'] = filing_type
+            break
 
     # Extract context around keywords (not just count)
     if keywords:
-        for keyword in keywords:
-            # Find all occurrences of the keyword
-            keyword_matches = re.finditer(r'\b' + re.escape(keyword) + r'\b', filing_text, re.IGNORECASE)
-            contexts = []
+        # Lower-case the text once so every keyword can use a plain substring search.
+        # Offsets only line up with the original text when lowering preserves length.
+        lowered_text = filing_text.lower()
+        if len(lowered_text) != len(filing_text):
+            lowered_text = None
 
-            for match in keyword_matches:
-                # Get the position of the match
-                start_pos = max(0, match.start() - 100)
-                end_pos = min(len(filing_text), match.end() + 100)
+        # With Hyperscan installed, locate every keyword in a single pass up front
+        scanned_spans = _scan_keywords_hyperscan(filing_text, keywords)
 
-                # Extract the context (100 characters before and after)
-                context = filing_text[start_pos:end_pos]
-
-                # Clean up the context
-                context = re.sub(r'\s+', ' ', context).strip()
-                contexts.append(context)
-
-            extracted_info['keyword_context'][keyword] = contexts
-
-    # Extract key financial metrics using regex patterns
-    metric_patterns = {
-        'Revenue': r'(?:total\s+revenue|revenue)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
-        'Net Income': r'(?:net\s+income|net\s+earnings|net\s+profit)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
-        'EPS': r'(?:earnings\s+per\s+share|EPS)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)',
-        'Operating Income': r'(?:operating\s+income|income\s+from\s+operations)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
-        'Gross Margin': r'(?:gross\s+margin)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:%|percent)?',
-        'Total Assets': r'(?:total\s+assets)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?',
-        'Total Debt': r'(?:total\s+debt|long-term\s+debt)[^\n.]*?[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:million|billion|m|b)?'
-    }
+        for keyword in keywords:
+            # Find all occurrences of the keyword
+            if scanned_spans is not None:
+                keyword_matches = scanned_spans[keyword]
+            else:
+                keyword_matches = _find_keyword_spans(filing_text, lowered_text, keyword)
+            # Extract the context (100 characters before and after each match)
+            extracted_info['keyword_context'][keyword] = _context_windows(filing_text, keyword_matches, 100)
 
-    for metric_name, pattern in metric_patterns.items():
-        matches = re.findall(pattern, filing_text, re.IGNORECASE)
+    # Extract key financial metrics using the precompiled regex patterns
+    for metric_name, pattern in _METRIC_PATTERNS.items():
+        matches = pattern.findall(filing_text)
         if matches:
             # Clean up the matches (remove commas, convert to float)
             cleaned_matches = []
@@ -1229,50 +1514,36 @@ def extract_filing_information(filing_text: str, keywords: Optional[List[str]] =
                     extracted_info['financial_metrics'][metric_name] = f"${value:,.2f}"
 
     # Extract growth trends
-    growth_patterns = [
-        r'(?:revenue|sales)\s+(?:increased|decreased|grew|declined)\s+by\s+(?:approximately\s+)?([\d,]+(?:\.\d+)?)\s*(?:%|percent)',
-        r'(?:profit|income|earnings)\s+(?:increased|decreased|grew|declined)\s+by\s+(?:approximately\s+)?([\d,]+(?:\.\d+)?)\s*(?:%|percent)',
-        r'(?:margin|margins)\s+(?:increased|decreased|improved|declined)\s+by\s+(?:approximately\s+)?([\d,]+(?:\.\d+)?)\s*(?:%|percent|basis\s+points|bps)'
-    ]
-
-    for pattern in growth_patterns:
-        matches = re.findall(pattern, filing_text, re.IGNORECASE)
-        if matches:
-            # Find the surrounding context for each match
-            for match in matches:
-                # Find the sentence containing this match
-                match_pos = filing_text.lower().find(match.lower())
-                if match_pos >= 0:
-                    # Get the surrounding text (200 characters before and after)
-                    start_pos = max(0, match_pos - 200)
-                    end_pos = min(len(filing_text), match_pos + 200)
-                    context = filing_text[start_pos:end_pos]
-
-                    # Clean up the context and add it to the trends
-                    context = re.sub(r'\s+', ' ', context).strip()
-                    extracted_info['growth_trends'].append(context)
-
-    # Extract key sections based on common section headers in SEC filings
-    section_headers = {
-        'Business Description': ['Item 1', 'Business', 'Description of Business'],
-        'Risk Factors': ['Item 1A', 'Risk Factors', 'Risks'],
-        'MD&A': ['Item 7', 'Management\'s Discussion', 'MD&A'],
-        'Financial Statements': ['Item 8', 'Financial Statements'],
-        'Executive Compensation': ['Executive Compensation', 'Compensation Discussion'],
-        'Material Events': ['Material Events', 'Recent Developments']
-    }
-
-    for section_name, headers in section_headers.items():
-        for header in headers:
-            pattern = re.compile(r'(?i)(' + re.escape(header) + r'[:\.\s])(.*?)(?=Item\s+\d|PART\s+[IVX]|\Z)', re.DOTALL)
-            match = pattern.search(filing_text)
-            if match:
-                extracted_info['sections'][section_name] = match.group(2).strip()
-                break
+    for pattern in _GROWTH_PATTERNS:
+        # Get the surrounding text (200 characters before and after the reported figure)
+        figure_positions = [(match.start(1), match.start(1)) for match in pattern.finditer(filing_text)]
+        extracted_info['growth_trends'].extend(_context_windows(filing_text, figure_positions, 200))
+
+    # Extract key sections based on common section headers in SEC filings.
+    # Heading positions are found in one pass; each section is then sliced from the
+    # end of its header to the next heading, found by binary search.
+    section_ends = [match.start() for match in _SECTION_END.finditer(filing_text)]
+
+    # Record where the first occurrence of each header alias ends
+    header_ends = {}
+    for match in _SECTION_HEADER_UNION.finditer(filing_text):
+        if match.lastgroup not in header_ends:
+            header_ends[match.lastgroup] = match.end(match.lastgroup)
+
+    # Aliases are tried in order for each section, as before
+    for index, (section_name, _) in enumerate(_SECTION_ALIASES):
+        content_start = header_ends.get(f'h{index}')
+        if content_start is None or section_name in extracted_info['sections']:
+            continue
+        next_heading = bisect.bisect_left(section_ends, content_start)
+        end_pos = section_ends[next_heading] if next_heading < len(section_ends) else len(filing_text)
+        extracted_info['sections'][section_name] = filing_text[content_start:end_pos].strip()
 
     return extracted_info
 
-def summarize_filing(filing_url: str, chunk_index: int, max_chunk_size: int) -> str:
+@cached(ttl=90 * DAY)
+def summarize_filing(filing_url: str, chunk_index: int = 0, max_chunk_size: int = 200000,
+                     include_header: bool = True) -> str:
     """
     Extract and summarize the text content from an SEC filing.
 
@@ -1315,17 +1586,25 @@ def summarize_filing(filing_url: str, chunk_index: int, max_chunk_size: int) ->
 
     Args:
         filing_url (str): The URL of the SEC filing
-        chunk_index (int): Index of the chunk to return (0-based). Use -1 to get information about total chunks.
-        max_chunk_size (int): Maximum size of each chunk in characters.
+        chunk_index (int, optional): Index of the chunk to return (0-based).
+                                    Use -1 to get information about total chunks. Defaults to 0.
+        max_chunk_size (int, optional): Maximum size of each chunk in bytes of UTF-8 text
+                                        (characters for plain ASCII). Defaults to 200000.
+        include_header (bool, optional): Whether to prefix the chunk with "[Chunk i of n]".
+                                         Programmatic callers can pass False to get the raw
+                                         chunk text. Defaults to True.
 
     Returns:
         str: A chunk of the filing text, or information about the total number of chunks
     """
-    # Extract the text content from the filing
-    filing_text = extract_filing_text(filing_url)
+    # Get the text content of the filing (cached per URL across chunk requests)
+    entry = _get_filing_entry(filing_url)
+    if isinstance(entry, str):
+        # Pass extraction errors through unchanged
+        return f"[Chunk 1 of 1] {entry}"
 
     # Calculate the total number of chunks
-    total_length = len(filing_text)
+    total_length = entry.length
     total_chunks = (total_length + max_chunk_size - 1) // max_chunk_size  # Ceiling division
 
     # If chunk_index is -1, return information about the total number of chunks
@@ -1336,12 +1615,18 @@ def summarize_filing(filing_url: str, chunk_index: int, max_chunk_size: int) ->
     if chunk_index < 0 or chunk_index >= total_chunks:
         return f"Invalid chunk_index. Filing has {total_chunks} chunks. Use chunk_index=0 to {total_chunks-1}."
 
-    # Calculate the start and end positions for the requested chunk
-    start_pos = chunk_index * max_chunk_size
-    end_pos = min(start_pos + max_chunk_size, total_length)
+    # Calculate the start and end positions for the requested chunk, keeping
+    # multi-byte characters whole so adjacent chunks line up exactly
+    buffer = entry.view
+    start_pos = _utf8_boundary(buffer, chunk_index * max_chunk_size)
+    end_pos = _utf8_boundary(buffer, min((chunk_index + 1) * max_chunk_size, total_length))
+
+    # Extract the requested chunk without copying the rest of the filing
+    chunk_text = str(buffer[start_pos:end_pos], 'utf-8', 'replace')
 
-    # Extract the requested chunk
-    chunk_text = filing_text[start_pos:end_pos]
+    # Return the raw chunk when the caller doesn't need the header
+    if not include_header:
+        return chunk_text
 
     # Add information about the chunk
     chunk_info = f"[Chunk {chunk_index+1} of {total_chunks}] "
@@ -1349,6 +1634,212 @@ def summarize_filing(filing_url: str, chunk_index: int, max_chunk_size: int) ->
     # Return the chunk with information
     return chunk_info + chunk_text
 
+def _task_for_current_loop(task: Optional["asyncio.Task"]) -> Optional["asyncio.Task"]:
+    """
+    Return the task only if it belongs to the running event loop.
+
+    Tasks left over from a previous asyncio.run() call can't be awaited again.
+
+    Args:
+        task (asyncio.Task, optional): A stored background task
+
+    Returns:
+        asyncio.Task or None: The task, or None if it is missing or from another loop
+    """
+    if task is not None and task.get_loop() is asyncio.get_running_loop():
+        return task
+    return None
+
+async def _load_filing_entry_async(filing_url: str) -> Union[_FilingCacheEntry, str]:
+    """
+    Load a filing into the cache without blocking the event loop.
+
+    Concurrent callers asking for the same URL wait on a single background load.
+
+    Args:
+        filing_url (str): The URL of the SEC filing
+
+    Returns:
+        _FilingCacheEntry | str: The cached filing, or an error message string
+    """
+    if filing_url in _filing_text_cache:
+        return _get_filing_entry(filing_url)
+
+    task = _task_for_current_loop(_filing_load_tasks.get(filing_url))
+    if task is None:
+        task = asyncio.create_task(asyncio.to_thread(_get_filing_entry, filing_url))
+        _filing_load_tasks[filing_url] = task
+        task.add_done_callback(lambda _: _filing_load_tasks.pop(filing_url, None))
+
+    return await task
+
+_SUMMARIZE_FILING_SIGNATURE = inspect.signature(summarize_filing)
+
+def _get_cached_chunk(filing_url: str, chunk_index: int, max_chunk_size: int) -> tuple:
+    """
+    Look up a chunk in summarize_filing's persistent cache without loading the filing.
+
+    Args:
+        filing_url (str): The URL of the SEC filing
+        chunk_index (int): Index of the chunk (0-based), or -1 for the chunk count
+        max_chunk_size (int): Maximum size of each chunk in bytes
+
+    Returns:
+        tuple: (hit, chunk) where hit is False if the chunk isn't cached
+    """
+    key = make_cache_key(_SUMMARIZE_FILING_SIGNATURE, (filing_url, chunk_index, max_chunk_size), {})
+    return get_cache().get("summarize_filing", key)
+
+async def summarize_filing_async(filing_url: str, chunk_index: int = 0, max_chunk_size: int = 200000) -> str:
+    """
+    Extract the text content from an SEC filing, one chunk at a time.
+
+    Behaves like summarize_filing, but downloads and parses the filing in a background
+    thread so other agents keep running, and prepares the next chunk while the current
+    one is being read. A chunk already in summarize_filing's persistent cache is returned
+    without downloading the filing. Use chunk_index=-1 to get information about the total number of chunks.
+
+    Args:
+        filing_url (str): The URL of the SEC filing
+        chunk_index (int, optional): Index of the chunk to return (0-based).
+                                    Use -1 to get information about total chunks. Defaults to 0.
+        max_chunk_size (int, optional): Maximum size of each chunk in bytes of UTF-8 text
+                                        (characters for plain ASCII). Defaults to 200000.
+
+    Returns:
+        str: A chunk of the filing text, or information about the total number of chunks
+    """
+    # Use the prefetched chunk if this is the one that was prepared
+    prefetched = _chunk_prefetch_tasks.pop(filing_url, None)
+    if prefetched is not None:
+        prefetched_key, prefetched_task = prefetched
+        prefetched_task = _task_for_current_loop(prefetched_task)
+        if prefetched_task is not None and prefetched_key == (chunk_index, max_chunk_size):
+            chunk = await prefetched_task
+        else:
+            # A different chunk was requested (or the loop changed); drop the prefetch
+            if prefetched_task is not None:
+                prefetched_task.cancel()
+            chunk = None
+    else:
+        chunk = None
+
+    if chunk is None:
+        # The cache may be on disk or in Redis, so it is read in a worker thread too
+        hit, chunk = await asyncio.to_thread(_get_cached_chunk, filing_url, chunk_index, max_chunk_size)
+        if hit:
+            return chunk
+
+        entry = await _load_filing_entry_async(filing_url)
+        if isinstance(entry, str):
+            return f"[Chunk 1 of 1] {entry}"
+        chunk = await asyncio.to_thread(summarize_filing, filing_url, chunk_index, max_chunk_size)
+
+    # Prepare the following chunk in the background while the agent reads this one
+    if filing_url in _filing_text_cache:
+        total_chunks = (_filing_text_cache[filing_url].length + max_chunk_size - 1) // max_chunk_size
+        next_index = chunk_index + 1
+        if 0 <= next_index < total_chunks:
+            next_task = asyncio.create_task(
+                asyncio.to_thread(summarize_filing, filing_url, next_index, max_chunk_size)
+            )
+            _chunk_prefetch_tasks[filing_url] = ((next_index, max_chunk_size), next_task)
+
+    return chunk
+
+@cached(ttl=90 * DAY)
+def summarize_filing_all(filing_url: str, max_total_chars: int = 60000) -> str:
+    """
+    Build a condensed digest of an entire SEC filing in a single call.
+
+    Instead of returning raw text chunk by chunk, this tool walks every chunk of the
+    filing, runs the extractive pre-summarizer (extract_filing_information) on each one
+    and merges the results: filing type, key financial metrics, growth trends, excerpts
+    of the main sections and short keyword contexts. Prefer this tool over repeatedly
+    calling summarize_filing; fall back to summarize_filing only when verbatim passages
+    are needed that the digest does not contain.
+
+    Args:
+        filing_url (str): The URL of the SEC filing
+        max_total_chars (int, optional): Upper bound on the size of the returned JSON. Defaults to 60000.
+
+    Returns:
+        str: Compact JSON with filing_type, financial_metrics, growth_trends, sections,
+             keyword_context, total_chunks, filing_length and a truncated flag, or an
+             error message
+    """
+    entry = _get_filing_entry(filing_url)
+    if isinstance(entry, str):
+        return entry
+
+    buffer = entry.view
+    total_length = entry.length
+    total_chunks = max(1, (total_length + DIGEST_CHUNK_SIZE - 1) // DIGEST_CHUNK_SIZE)
+
+    digest = {
+        'filing_type': "Unknown",
+        'financial_metrics': {},
+        'growth_trends': [],
+        'sections': {},
+        'keyword_context': {},
+        'total_chunks': total_chunks,
+        'filing_length': total_length,
+        'truncated': False
+    }
+
+    for chunk_index in range(total_chunks):
+        start_pos = _utf8_boundary(buffer, chunk_index * DIGEST_CHUNK_SIZE)
+        end_pos = _utf8_boundary(buffer, min((chunk_index + 1) * DIGEST_CHUNK_SIZE, total_length))
+        chunk_info = extract_filing_information(str(buffer[start_pos:end_pos], 'utf-8', 'replace'))
+        if 'error' in chunk_info:
+            continue
+
+        if digest['filing_type'] == "Unknown":
+            digest['filing_type'] = chunk_info['filing_type']
+
+        # Keep the first value found for each metric and section
+        for metric_name, value in chunk_info['financial_metrics'].items():
+            digest['financial_metrics'].setdefault(metric_name, value)
+
+        for section_name, section_text in chunk_info['sections'].items():
+            if section_name not in digest['sections']:
+                digest['sections'][section_name] = section_text[:DIGEST_SECTION_CHARS]
+
+        for trend in chunk_info['growth_trends']:
+            if len(digest['growth_trends']) >= DIGEST_MAX_GROWTH_TRENDS:
+                break
+            if trend not in digest['growth_trends']:
+                digest['growth_trends'].append(trend)
+
+        for keyword, contexts in chunk_info['keyword_context'].items():
+            keyword_entry = digest['keyword_context'].setdefault(keyword, {'count': 0, 'contexts': []})
+            keyword_entry['count'] += len(contexts)
+            room = DIGEST_MAX_CONTEXTS_PER_KEYWORD - len(keyword_entry['contexts'])
+            if room > 0:
+                keyword_entry['contexts'].extend(contexts[:room])
+
+    # Drop keywords that never matched
+    digest['keyword_context'] = {
+        keyword: keyword_entry for keyword, keyword_entry in digest['keyword_context'].items() if keyword_entry['count']
+    }
+
+    result = dumps_json(digest)
+
+    # Shrink section excerpts, then keyword contexts, until the digest fits the budget
+    section_chars = DIGEST_SECTION_CHARS
+    while len(result) > max_total_chars and section_chars > 0:
+        section_chars //= 2
+        digest['truncated'] = True
+        digest['sections'] = {name: text[:section_chars] for name, text in digest['sections'].items()}
+        result = dumps_json(digest)
+
+    if len(result) > max_total_chars:
+        for keyword_entry in digest['keyword_context'].values():
+            keyword_entry['contexts'] = keyword_entry['contexts'][:1]
+        result = dumps_json(digest)
+
+    return result
+
 def analyze_filing(filing_text: str, keywords: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Analyze the content of an SEC filing by extracting information and generating a summary.
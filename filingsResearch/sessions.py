@@ -0,0 +1,50 @@
+"""
+Session Helpers
+
+ADK's session services expose a synchronous API in some versions and an async one in others.
+These helpers create and delete sessions from async code without blocking the event loop,
+whichever API the installed version provides.
+"""
+
+import asyncio
+import inspect
+
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+
+async def create_session_async(session_service: BaseSessionService, **kwargs) -> Session:
+    """
+    Create a session without blocking the event loop.
+
+    ADK versions with an async create_session are awaited directly. With the synchronous
+    API, the in-memory service is called inline (it does no I/O) and other backends, such
+    as the database service, run in a worker thread.
+
+    Args:
+        session_service (BaseSessionService): The session service
+        **kwargs: Arguments for create_session (app_name, user_id, optional session_id)
+
+    Returns:
+        Session: The new session
+    """
+    if inspect.iscoroutinefunction(session_service.create_session):
+        return await session_service.create_session(**kwargs)
+    if isinstance(session_service, InMemorySessionService):
+        return session_service.create_session(**kwargs)
+    return await asyncio.to_thread(session_service.create_session, **kwargs)
+
+async def delete_session_async(session_service: BaseSessionService, **kwargs) -> None:
+    """
+    Delete a session without blocking the event loop; see create_session_async.
+
+    Args:
+        session_service (BaseSessionService): The session service
+        **kwargs: Arguments for delete_session (app_name, user_id, session_id)
+    """
+    if inspect.iscoroutinefunction(session_service.delete_session):
+        await session_service.delete_session(**kwargs)
+    elif isinstance(session_service, InMemorySessionService):
+        session_service.delete_session(**kwargs)
+    else:
+        await asyncio.to_thread(session_service.delete_session, **kwargs)
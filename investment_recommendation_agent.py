@@ -11,46 +11,958 @@ The agent can:
 4. Analyze data from all sources to identify key metrics, trends, and signals
 5. Provide holistic BUY, HOLD, or SELL recommendations with supporting rationale
 
+The three research agents are independent of each other, so they are run concurrently by
+the gather_evidence tool rather than being consulted one after another.
+
 The agent is designed to function as a comprehensive equity research assistant that helps
 users make informed investment decisions by integrating fundamental analysis from SEC filings,
 technical analysis from current market data, and insights from recent investor meetings.
 """
 
+import re
+import json
 import asyncio
+import inspect
+import functools
+from datetime import date, datetime
+from string import Template
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Import Google ADK components
 from google.adk.agents.llm_agent import Agent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_response import LlmResponse
 from google.adk.runners import Runner
+from google.adk.sessions.base_session_service import BaseSessionService
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+from google.adk.tools.tool_context import ToolContext
+from google import genai
+from google.genai import types
 
 # Import our SEC filings research agent
 from filingsResearch.sec_filings_research_agent import create_sec_filings_research_agent
 
 # Import our market data agent
-from marketData.market_data_agent import create_market_data_agent
+from marketData.market_data_agent import create_market_data_agent, MARKET_TOOLS
 
 # Import our transcript summarization agent
-from transcriptResearch.transcript_summarization_agent import create_transcript_summarization_agent
+from transcriptResearch.transcript_summarization_agent import create_transcript_summarization_agent, TRANSCRIPT_TOOLS
+
+# Data tools, used by the root agent for quick lookups and by the single-call synthesis path
+from filingsResearch.get_company_cik import find_cik
+from filingsResearch.async_tools import run_in_thread
+from filingsResearch.sec_filings import find_filings, summarize_filing, summarize_filing_all, _task_for_current_loop
+from marketData.market_data import (
+    get_stock_price,
+    get_stock_prices,
+    calculate_technical_indicators,
+    get_company_info_from_yahoo,
+    get_market_news
+)
+from transcriptResearch.transcript_tools import get_most_recent_transcript, summarize_transcript
+from marketData.tickers import resolve_ticker
+from marketData.helper_functions import warm_up_kernels
 
-# Import configuration
+# Import configuration and the shared HTTP session
 from filingsResearch.config import Config
+from filingsResearch.rate_limit import rate_limited_model, GEMINI_LIMITER, is_rate_limit_error, backoff_delay, MAX_RETRIES
+from filingsResearch.http_session import prewarm_connections
+from filingsResearch.prompt_loader import load_prompt
+from filingsResearch.model_settings import agent_content_config
+from filingsResearch.sessions import create_session_async, delete_session_async
+from filingsResearch._runtime import USER_ID, SESSION_ID, STREAMING_RUN_CONFIG, read_prompt, stream_response, run_main
+from filingsResearch.caching import get_cache, dumps_json, HOUR
 
 # Define constants
 APP_NAME = "investment_recommendation_agent"
-USER_ID = "user1234"
-SESSION_ID = "1234"
+
+# Single-call synthesis: model, evidence size limits and the structured output it returns
+SYNTHESIS_MODEL = "gemini-2.0-flash"
+SYNTHESIS_FILING_CHARS = 30000
+SYNTHESIS_TRANSCRIPT_CHARS = 30000
+_RECOMMENDATION_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "filings_summary": types.Schema(type=types.Type.STRING),
+        "market_summary": types.Schema(type=types.Type.STRING),
+        "transcript_summary": types.Schema(type=types.Type.STRING),
+        "rating": types.Schema(type=types.Type.STRING, enum=["BUY", "HOLD", "SELL"]),
+        "recommendation": types.Schema(type=types.Type.STRING),
+    },
+    required=["filings_summary", "market_summary", "transcript_summary", "rating", "recommendation"],
+)
+_genai_client = None
+
+# Structured recommendations are cached per ticker, so a plain "recommendation for <TICKER>"
+# request can be answered without running any agent while the cached analysis is fresh
+RECOMMENDATION_TTL = 1 * HOUR
+# The whole message must be the request ("recommendation for AAPL", "Buy MSFT?"); anything
+# more (a second ticker, a follow-up question) is left to the agent
+_RECOMMENDATION_REQUEST = re.compile(
+    r'^\s*(?i:buy|hold|sell|recommendation)(?:\s+(?i:for|on))?\s+([A-Z]{1,5})\s*[?.!]?\s*$'
+)
+
+# Research agents consulted for every recommendation, keyed by the evidence they provide
+EVIDENCE_SOURCES = {
+    "sec_filings": create_sec_filings_research_agent,
+    "market_data": create_market_data_agent,
+    "transcripts": create_transcript_summarization_agent,
+}
+DEFAULT_SOURCES = frozenset(EVIDENCE_SOURCES)
+
+# Data tools the root agent calls directly, without handing off to a research agent, by source.
+# These are the research agents' own tools (with the synchronous filing reader for SEC filings).
+SOURCE_TOOLS = {
+    "sec_filings": (find_cik, find_filings, summarize_filing),
+    "market_data": MARKET_TOOLS,
+    "transcripts": TRANSCRIPT_TOOLS,
+}
+LOOKUP_TOOLS = tuple(tool for tools in SOURCE_TOOLS.values() for tool in tools)
+_LOOKUP_TOOLS_BY_NAME = {tool.__name__: tool for tool in LOOKUP_TOOLS}
+
+# Session state key recording whether the root agent's latest function calls named an unknown tool
+UNKNOWN_TOOL_STATE_KEY = "unknown_tool_called"
+
+# Lookups started ahead of ADK's one-at-a-time tool dispatch, by invocation ID and then by
+# _tool_call_key. Each invocation only reuses its own lookups, and any left unused are cancelled.
+_started_lookups: Dict[str, Dict[str, "asyncio.Task"]] = {}
+
+# Instruction sections for each evidence source, filled into the root agent's instruction and
+# tool reference templates (prompts/investment_recommender*.md) for the sources it is built with
+_SOURCE_PROMPT_SECTIONS = {
+    "sec_filings": {
+        "name": "SEC filings",
+        "label": "SEC filings",
+        "evidence": "  * sec_filings - financial metrics, growth trends, business developments, risk factors, and management's outlook from the latest 10-K/10-Q",
+        "reference": "  * sec_filings - the company's most recent 10-K and 10-Q filings, summarized",
+        "analysis": "",
+        "contents": "- Key financial metrics, trends, business developments, and risk factors from the SEC filings",
+    },
+    "market_data": {
+        "name": "market data",
+        "label": "Market data",
+        "evidence": "  * market_data - current price, technical indicators (moving averages, RSI, MACD, Bollinger Bands), company information, and recent news",
+        "reference": "  * market_data - the current stock price, historical data, technical indicators, company information, and news",
+        "analysis": "",
+        "contents": "- Relevant market data, technical analysis, and significant recent news",
+    },
+    "transcripts": {
+        "name": "investor meeting transcripts",
+        "label": "Transcripts",
+        "evidence": "  * transcripts - summary of the latest investor meeting: meeting_type, financial_highlights, strategic_initiatives, outlook, key_quotes, full_summary",
+        "reference": "  * transcripts - the most recent earnings call transcript, summarized",
+        "analysis": ", using every component of the transcript summary (especially financial_highlights, strategic_initiatives, and outlook), not just full_summary",
+        "contents": "- Specific transcript insights: financial highlights, strategic initiatives, guidance, and notable executive quotes",
+    },
+}
+
+# Session service for the research agent runs started by gather_evidence
+_evidence_session_service = InMemorySessionService()
+
+# Runners are built once and reused: one per research agent, plus the root runner
+_research_runners: Dict[str, Runner] = {}
+_RUNNER_SINGLETON = None
+_SESSION_SERVICE: Optional[BaseSessionService] = None
+
+def _build_evidence_query(source: str, company_name: str, ticker_symbol: str) -> str:
+    """
+    Build the request sent to one research agent.
+
+    Args:
+        source (str): The evidence source key from EVIDENCE_SOURCES
+        company_name (str): The name of the company
+        ticker_symbol (str): The ticker symbol of the company
+
+    Returns:
+        str: The request text for that agent
+    """
+    if source == "sec_filings":
+        return (f"Find the CIK and the most recent 10-K and 10-Q filings for {company_name} ({ticker_symbol}) "
+                f"and provide a comprehensive summary of the company's financial metrics, growth trends, "
+                f"business developments, risk factors and management's outlook.")
+    if source == "market_data":
+        return (f"Provide the current stock price, technical indicators, company information and recent news "
+                f"for {company_name} (ticker symbol {ticker_symbol}).")
+    # Name the exact lookup, so the agent goes straight to the ticker's latest transcript
+    # instead of searching meetings by company name
+    return (f"Call get_most_recent_transcript with company_name=\"{company_name}\" and "
+            f"ticker_symbol=\"{ticker_symbol}\", summarize the transcript with summarize_transcript, "
+            f"and provide the complete transcript summary.")
+
+async def _run_research_agent(agent: Agent, query: str) -> str:
+    """
+    Run a research agent on a single request in its own session and return its final answer.
+
+    Args:
+        agent (Agent): The research agent to run
+        query (str): The request to send to the agent
+
+    Returns:
+        str: The text of the agent's final response
+    """
+    runner = _research_runners.get(agent.name)
+    if runner is None or runner.agent is not agent:
+        runner = Runner(
+            app_name=agent.name,
+            agent=agent,
+            session_service=_evidence_session_service
+        )
+        _research_runners[agent.name] = runner
+    session = await create_session_async(_evidence_session_service, app_name=agent.name, user_id=USER_ID)
+
+    final_text = ""
+    try:
+        async for event in runner.run_async(
+            user_id=USER_ID,
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text=query)])
+        ):
+            if event.is_final_response() and event.content and event.content.parts:
+                final_text = "".join(part.text or "" for part in event.content.parts)
+    finally:
+        # Research sessions are single-use; don't let them accumulate in memory
+        await delete_session_async(_evidence_session_service, app_name=agent.name, user_id=USER_ID, session_id=session.id)
+
+    return final_text
+
+async def _query_source(source: str, query: str) -> str:
+    """
+    Send a request to the research agent for one evidence source.
+
+    The run is limited to Config.get_evidence_timeout() seconds.
+
+    Args:
+        source (str): The evidence source key from EVIDENCE_SOURCES
+        query (str): The request to send to the agent
+
+    Returns:
+        str: The agent's findings, or an error message if the agent failed
+    """
+    timeout = Config.get_evidence_timeout()
+    try:
+        findings = await asyncio.wait_for(_run_research_agent(EVIDENCE_SOURCES[source](), query), timeout)
+    except asyncio.TimeoutError:
+        return f"Error gathering {source} evidence: no findings within {timeout:g} seconds"
+    except Exception as e:
+        return f"Error gathering {source} evidence: {str(e)}"
+
+    return findings or f"No {source} findings were returned."
+
+async def _gather_source(source: str, company_name: str, ticker_symbol: str) -> Tuple[str, str]:
+    """
+    Run the research agent for one evidence source.
+
+    The run is limited to Config.get_evidence_timeout() seconds, so one slow source can't
+    hold up the whole recommendation.
+
+    Args:
+        source (str): The evidence source key from EVIDENCE_SOURCES
+        company_name (str): The name of the company
+        ticker_symbol (str): The ticker symbol of the company
+
+    Returns:
+        tuple: (source, findings), where findings is an error message if the agent failed
+    """
+    return source, await _query_source(source, _build_evidence_query(source, company_name, ticker_symbol))
+
+async def _gather_evidence(company_name: str, ticker_symbol: str, sources: List[str],
+                           tool_context: Optional[ToolContext] = None) -> Dict[str, str]:
+    """
+    Run the research agents for the given sources concurrently and collect their findings.
+
+    Once the first source has returned, the others get Config.get_evidence_grace_period()
+    more seconds; any still running then are cancelled and reported as unavailable, so the
+    recommendation isn't held up by a straggler.
+
+    Args:
+        company_name (str): The name of the company
+        ticker_symbol (str): The ticker symbol of the company
+        sources (list): The evidence source keys from EVIDENCE_SOURCES, in result order
+        tool_context (ToolContext, optional): Used to record each source's findings in the session state
+
+    Returns:
+        dict: The findings keyed by source
+    """
+    tasks = {asyncio.create_task(_gather_source(source, company_name, ticker_symbol)): source for source in sources}
+    grace_period = Config.get_evidence_grace_period()
+    loop = asyncio.get_running_loop()
+
+    evidence = {}
+    pending = set(tasks)
+    deadline = None
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+
+            for task in done:
+                source, findings = task.result()
+                evidence[source] = findings
+                if tool_context is not None:
+                    tool_context.state[f"evidence_{source}"] = findings
+
+            if deadline is None:
+                deadline = loop.time() + grace_period
+    finally:
+        # Stop the stragglers, and don't leave research agents running if the request is cancelled
+        for task in tasks:
+            task.cancel()
+
+    for task in pending:
+        evidence[tasks[task]] = (
+            f"Error gathering {tasks[task]} evidence: no findings within {grace_period:g} seconds "
+            "of the first source"
+        )
+
+    return {source: evidence[source] for source in sources}
+
+async def gather_evidence(company_name: str, ticker_symbol: str,
+                          tool_context: Optional[ToolContext] = None) -> Dict[str, str]:
+    """
+    Gather SEC filing, market data and investor meeting evidence for a company in parallel.
+
+    This tool runs the SEC Filings Research Agent, the Market Data Agent and the Transcript
+    Summarization Agent at the same time and returns each agent's complete findings. Call it
+    once per company; it already covers all three sources.
+
+    Each agent's findings are recorded as soon as that agent finishes, under the session
+    state key "evidence_<source>", rather than after the slowest one.
+
+    Args:
+        company_name (str): The name of the company (e.g., "Apple", "Robinhood")
+        ticker_symbol (str): The stock ticker symbol of the company (e.g., "AAPL", "HOOD")
+        tool_context (ToolContext, optional): Supplied by the agent framework; used to record
+                                              findings in the session state
+
+    Returns:
+        dict: The findings keyed by source:
+            - sec_filings: Summary of the company's recent SEC filings
+            - market_data: Current price, technical indicators, company information and news
+            - transcripts: Summary of the most recent investor meeting transcript
+    """
+    return await _gather_evidence(company_name, ticker_symbol, list(EVIDENCE_SOURCES), tool_context)
+
+def _evidence_tool(sources: frozenset) -> Callable:
+    """
+    Get the gather_evidence tool for an agent built with a subset of the evidence sources.
+
+    Args:
+        sources (frozenset): The enabled evidence source keys
+
+    Returns:
+        callable: gather_evidence itself for all sources, otherwise a tool with the same name
+                  and parameters that only runs the enabled research agents
+    """
+    if sources == DEFAULT_SOURCES:
+        return gather_evidence
+
+    ordered_sources = [source for source in EVIDENCE_SOURCES if source in sources]
+
+    @functools.wraps(gather_evidence)
+    async def gather_enabled_evidence(company_name: str, ticker_symbol: str,
+                                      tool_context: Optional[ToolContext] = None) -> Dict[str, str]:
+        return await _gather_evidence(company_name, ticker_symbol, ordered_sources, tool_context)
+
+    # The docstring is the tool description the model sees
+    gather_enabled_evidence.__doc__ = f"""
+    Gather {_join_source_names(sources)} evidence for a company in parallel.
+
+    Call it once per company; it already covers every source.
+
+    Args:
+        company_name (str): The name of the company (e.g., "Apple", "Robinhood")
+        ticker_symbol (str): The stock ticker symbol of the company (e.g., "AAPL", "HOOD")
+
+    Returns:
+        dict: The findings keyed by source ({", ".join(ordered_sources)})
+    """
+    return gather_enabled_evidence
+
+def _research_tool(source: str) -> Callable:
+    """
+    Wrap the research agent for one evidence source as a tool the root agent can call.
+
+    The root agent uses these tools for follow-up questions about a single source. Unlike
+    a sub-agent transfer, the call returns the research agent's answer to the root agent,
+    and calls for several sources in the same turn run concurrently (see
+    _start_parallel_lookups).
+
+    Args:
+        source (str): The evidence source key from EVIDENCE_SOURCES
+
+    Returns:
+        callable: An async tool named ask_<source>_agent taking the question to ask
+    """
+    async def ask_research_agent(question: str) -> str:
+        return await _query_source(source, question)
+
+    ask_research_agent.__name__ = ask_research_agent.__qualname__ = f"ask_{source}_agent"
+    # The docstring is the tool description the model sees
+    ask_research_agent.__doc__ = f"""
+    Ask the {_SOURCE_PROMPT_SECTIONS[source]['name']} research agent a specific question.
+
+    Use it to follow up on gather_evidence findings.
+
+    Args:
+        question (str): The question, naming the company and ticker symbol (e.g., "Apple (AAPL)")
+
+    Returns:
+        str: The research agent's answer
+    """
+    return ask_research_agent
+
+# The research agents as tools, by source; their calls start in parallel like the data tools
+RESEARCH_TOOLS = {source: _research_tool(source) for source in EVIDENCE_SOURCES}
+_LOOKUP_TOOLS_BY_NAME.update((tool.__name__, tool) for tool in RESEARCH_TOOLS.values())
+
+def _start_lookup(func: Callable, args: Dict[str, Any]) -> "asyncio.Task":
+    """
+    Start a tool call without waiting for it.
+
+    Args:
+        func (callable): The data tool or research tool
+        args (dict): The call arguments
+
+    Returns:
+        asyncio.Task: The running call; synchronous data tools run in a background thread
+    """
+    if not inspect.iscoroutinefunction(func):
+        func = run_in_thread(func)
+    return asyncio.create_task(func(**args))
+
+def _tool_call_key(name: str, args: Dict[str, Any]) -> str:
+    """
+    Build the key identifying one tool call by its name and arguments.
+
+    Args:
+        name (str): The tool name
+        args (dict): The call arguments
+
+    Returns:
+        str: The key
+    """
+    return f"{name}:{json.dumps(args, sort_keys=True, default=str)}"
+
+def _cancel_started_lookups(invocation_id: str) -> None:
+    """
+    Cancel and forget the lookups an invocation started but did not use.
+
+    Args:
+        invocation_id (str): The invocation's ID
+    """
+    for task in _started_lookups.pop(invocation_id, {}).values():
+        task.cancel()
+
+def _start_parallel_lookups(callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+    """
+    Start every lookup in a multi-call model response at once.
+
+    Gemini can return several function calls in one turn, but ADK executes them one after
+    another. When a response has more than one lookup call (data tools or research agent
+    tools), all of them are started here; each tool then picks up its already-running result.
+    Lookups from the invocation's previous model response that no tool call picked up (e.g.
+    because an earlier call raised) are cancelled first.
+
+    Args:
+        callback_context (CallbackContext): The callback context of the current invocation
+        llm_response (LlmResponse): The model response
+
+    Returns:
+        None: The response is passed through unchanged
+    """
+    invocation_id = callback_context.invocation_id
+    _cancel_started_lookups(invocation_id)
+    if not llm_response.content or not llm_response.content.parts:
+        return None
+
+    lookup_calls = [
+        part.function_call for part in llm_response.content.parts
+        if part.function_call and part.function_call.name in _LOOKUP_TOOLS_BY_NAME
+    ]
+    if len(lookup_calls) < 2:
+        return None
+
+    lookups = _started_lookups[invocation_id] = {}
+    for call in lookup_calls:
+        args = call.args or {}
+        key = _tool_call_key(call.name, args)
+        if key not in lookups:
+            lookups[key] = _start_lookup(_LOOKUP_TOOLS_BY_NAME[call.name], args)
+
+    return None
+
+def _finish_parallel_lookups(callback_context: CallbackContext) -> Optional[types.Content]:
+    """
+    Cancel any lookups the invocation started but never used, once the agent's turn ends.
+
+    Args:
+        callback_context (CallbackContext): The callback context of the finished invocation
+
+    Returns:
+        None: The agent's response is left unchanged
+    """
+    _cancel_started_lookups(callback_context.invocation_id)
+    return None
+
+def _after_root_model_response(callback_context: CallbackContext, llm_response: LlmResponse,
+                               known_tools: frozenset) -> Optional[LlmResponse]:
+    """
+    Handle each root agent model response: record in the session state whether its function
+    calls named a tool the agent doesn't have (read by _recommendation_instruction), and
+    start its lookups in parallel. The agent factory binds known_tools with functools.partial.
+
+    Args:
+        callback_context (CallbackContext): The callback context of the current invocation
+        llm_response (LlmResponse): The model response
+        known_tools (frozenset): Names of the agent's tools
+
+    Returns:
+        None: The response is passed through unchanged
+    """
+    if llm_response.content and llm_response.content.parts:
+        function_calls = [part.function_call for part in llm_response.content.parts if part.function_call]
+        if function_calls:
+            callback_context.state[UNKNOWN_TOOL_STATE_KEY] = any(
+                call.name not in known_tools for call in function_calls
+            )
+    return _start_parallel_lookups(callback_context, llm_response)
+
+def _parallel_lookup(func: Callable) -> Callable:
+    """
+    Wrap a data tool so it reuses a lookup started by _start_parallel_lookups.
+
+    Only lookups started in the same invocation, on the running event loop, are reused.
+    Synchronous lookups that weren't started ahead run in a background thread, so they
+    don't block the event loop either.
+
+    Args:
+        func (callable): The data tool or research tool
+
+    Returns:
+        callable: An async tool with the same name, docstring and parameters, plus the
+                  tool_context ADK passes in (which is not shown to the model)
+    """
+    @functools.wraps(func)
+    async def wrapper(tool_context: ToolContext, **kwargs):
+        lookups = _started_lookups.get(tool_context.invocation_id, {})
+        started = _task_for_current_loop(lookups.pop(_tool_call_key(func.__name__, kwargs), None))
+        if started is not None:
+            return await started
+        return await _start_lookup(func, kwargs)
+
+    # ADK passes tool_context to tools whose signature asks for it
+    signature = inspect.signature(func)
+    wrapper.__signature__ = signature.replace(parameters=[
+        *signature.parameters.values(),
+        inspect.Parameter("tool_context", inspect.Parameter.KEYWORD_ONLY, annotation=ToolContext),
+    ])
+    return wrapper
+
+def _join_source_names(sources: frozenset) -> str:
+    """
+    Describe a set of evidence sources in words, e.g. "SEC filings and market data".
+
+    Args:
+        sources (frozenset): The evidence source keys
+
+    Returns:
+        str: The source names joined into a phrase
+    """
+    names = [_SOURCE_PROMPT_SECTIONS[source]["name"] for source in EVIDENCE_SOURCES if source in sources]
+    if len(names) > 2:
+        return f"{', '.join(names[:-1])}, and {names[-1]}"
+    return " and ".join(names)
+
+def _render_prompts(sources: frozenset) -> Tuple[str, str]:
+    """
+    Render the root agent's instruction and tool reference for the enabled evidence sources.
+
+    Args:
+        sources (frozenset): The enabled evidence source keys
+
+    Returns:
+        tuple: (instruction, tool_reference)
+    """
+    enabled = [source for source in EVIDENCE_SOURCES if source in sources]
+    sections = [_SOURCE_PROMPT_SECTIONS[source] for source in enabled]
+
+    instruction = Template(load_prompt("investment_recommender.md")).substitute(
+        source_names=_join_source_names(sources),
+        evidence_entries="\n".join(section["evidence"] for section in sections),
+        data_tools="\n".join(
+            f"- {_SOURCE_PROMPT_SECTIONS[source]['label']}: {', '.join(tool.__name__ for tool in SOURCE_TOOLS[source])}"
+            for source in enabled
+        ),
+        research_tools="\n".join(
+            f"- {RESEARCH_TOOLS[source].__name__}(question): asks the {_SOURCE_PROMPT_SECTIONS[source]['name']} research agent"
+            for source in enabled
+        ),
+        analysis_notes="".join(section["analysis"] for section in sections),
+        recommendation_contents="\n".join(section["contents"] for section in sections),
+    )
+    tool_reference = Template(load_prompt("investment_recommender_tool_reference.md")).substitute(
+        tool_names=", ".join(tool.__name__ for source in enabled for tool in SOURCE_TOOLS[source]),
+        research_tool_names=", ".join(RESEARCH_TOOLS[source].__name__ for source in enabled),
+        reference_entries="\n".join(section["reference"] for section in sections),
+    )
+    return instruction, tool_reference
+
+def _recommendation_instruction(context: ReadonlyContext, instruction: str, tool_reference: str) -> str:
+    """
+    Build the root agent's instruction for the current turn.
+
+    The concise core instruction is always used. If the agent's most recent function calls
+    in this session named a tool it doesn't have (as recorded in the session state by
+    _after_root_model_response), the expanded tool reference is appended. The agent factory
+    binds everything but the context with functools.partial.
+
+    Args:
+        context (ReadonlyContext): The context of the current invocation
+        instruction (str): The rendered core instruction
+        tool_reference (str): The rendered tool reference
+
+    Returns:
+        str: The instruction text
+    """
+    if context.state.get(UNKNOWN_TOOL_STATE_KEY):
+        return f"{instruction}\n{tool_reference}"
+    return instruction
+
+def _get_filing_text(company_name: str) -> str:
+    """
+    Get the extracted content of a company's latest 10-K and 10-Q filings, without an LLM.
+
+    Args:
+        company_name (str): The company name or ticker symbol
+
+    Returns:
+        str: The extracted filing content, or an error message
+    """
+    companies = find_cik(company_name)
+    if not companies:
+        return f"Error: Could not find a CIK for {company_name}."
+
+    cik = companies[0]["CIK"]
+    filing_texts = []
+    for filing_type in ("10-K", "10-Q"):
+        filings = find_filings(cik, filing_type, 1)
+        if filings and "error" not in filings[0] and filings[0].get("link"):
+            content = summarize_filing_all(filings[0]["link"], max_total_chars=SYNTHESIS_FILING_CHARS // 2)
+            filing_texts.append(f"{filing_type} ({filings[0].get('filing_date', 'unknown date')}): {content}")
+
+    return "\n\n".join(filing_texts) or f"Error: No 10-K or 10-Q filings found for {company_name}."
+
+def _get_market_json(ticker_symbol: str) -> str:
+    """
+    Get a company's price, technical indicators, profile and news as JSON, without an LLM.
+
+    Args:
+        ticker_symbol (str): The stock ticker symbol
+
+    Returns:
+        str: The market data as a JSON string
+    """
+    market_data = {
+        "price": get_stock_price(ticker_symbol),
+        "technical_indicators": calculate_technical_indicators(ticker_symbol),
+        "company_info": get_company_info_from_yahoo(ticker_symbol),
+        "news": get_market_news(ticker_symbol),
+    }
+    return dumps_json(market_data)
+
+def _get_genai_client() -> genai.Client:
+    """
+    Get the shared Gemini client used for direct (non-agent) model calls.
+
+    Returns:
+        genai.Client: The client, created on first use
+    """
+    global _genai_client
+    if _genai_client is None:
+        _genai_client = genai.Client(api_key=Config.get_google_api_key())
+    return _genai_client
+
+def _synthesis_contents(filings_text: str, market_json: str, transcript_text: str) -> str:
+    """
+    Build the evidence message for a single-call recommendation.
+
+    Args:
+        filings_text (str): Extracted content of the company's recent SEC filings
+        market_json (str): Market data as a JSON string
+        transcript_text (str): The most recent investor meeting transcript
+
+    Returns:
+        str: The evidence, one section per source
+    """
+    return (
+        f"## SEC filings\n{filings_text[:SYNTHESIS_FILING_CHARS]}\n\n"
+        f"## Market data\n{market_json}\n\n"
+        f"## Investor meeting transcript\n{transcript_text[:SYNTHESIS_TRANSCRIPT_CHARS]}"
+    )
+
+def _synthesis_config() -> types.GenerateContentConfig:
+    """
+    Build the generation settings for a single-call recommendation.
+
+    Returns:
+        types.GenerateContentConfig: The synthesis prompt and the structured output schema
+    """
+    return types.GenerateContentConfig(
+        system_instruction=load_prompt("recommendation_synthesis.md"),
+        response_mime_type="application/json",
+        response_schema=_RECOMMENDATION_SCHEMA,
+    )
+
+async def synthesize_recommendation(filings_text: str, market_json: str, transcript_text: str) -> Dict[str, Any]:
+    """
+    Summarize raw evidence and produce a recommendation in a single structured LLM call.
+
+    Instead of three research agents each summarizing their source before a final synthesis,
+    the raw filing content, market data and transcript are sent together in one request that
+    returns all three summaries and the recommendation.
+
+    Args:
+        filings_text (str): Extracted content of the company's recent SEC filings
+        market_json (str): Market data as a JSON string
+        transcript_text (str): The most recent investor meeting transcript
+
+    Returns:
+        dict: A dictionary with filings_summary, market_summary, transcript_summary,
+              rating (BUY/HOLD/SELL) and recommendation, or a dictionary with an "error" key
+    """
+    client = _get_genai_client()
+    evidence = _synthesis_contents(filings_text, market_json, transcript_text)
+
+    attempt = 0
+    while True:
+        try:
+            await GEMINI_LIMITER.acquire_async()
+            response = await client.aio.models.generate_content(
+                model=SYNTHESIS_MODEL,
+                contents=evidence,
+                config=_synthesis_config(),
+            )
+            return json.loads(response.text)
+        except Exception as e:
+            # Back off and retry when Gemini reports a rate limit
+            if is_rate_limit_error(e) and attempt < MAX_RETRIES:
+                await asyncio.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+            return {"error": f"Failed to synthesize recommendation: {str(e)}"}
+
+async def _gather_raw_evidence(company_name: str, ticker_symbol: str) -> Tuple[str, str, str]:
+    """
+    Retrieve a company's filing, market and transcript data concurrently with the data tools.
+
+    Args:
+        company_name (str): The name of the company (e.g., "Apple")
+        ticker_symbol (str): The stock ticker symbol of the company (e.g., "AAPL")
+
+    Returns:
+        tuple: The filing text, market data JSON and transcript text
+    """
+    return tuple(await asyncio.gather(
+        asyncio.to_thread(_get_filing_text, company_name),
+        asyncio.to_thread(_get_market_json, ticker_symbol),
+        asyncio.to_thread(get_most_recent_transcript, company_name, ticker_symbol),
+    ))
+
+def _cache_recommendation(company_name: str, ticker_symbol: str, recommendation: Dict[str, Any]) -> None:
+    """
+    Cache a structured recommendation so answer_from_cache can serve it.
+
+    Args:
+        company_name (str): The name of the company
+        ticker_symbol (str): The stock ticker symbol of the company
+        recommendation (dict): The result of synthesize_recommendation
+    """
+    cached_recommendation = dict(
+        recommendation,
+        company_name=company_name,
+        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+    )
+    get_cache().set("recommendation", ticker_symbol.strip().upper(), cached_recommendation, RECOMMENDATION_TTL)
+
+async def recommend_from_raw_evidence(company_name: str, ticker_symbol: str) -> Dict[str, Any]:
+    """
+    Produce a structured recommendation with one LLM call.
+
+    The filing, market and transcript data are retrieved concurrently with the data tools
+    directly (no research agents), then passed to synthesize_recommendation.
+
+    Args:
+        company_name (str): The name of the company (e.g., "Apple")
+        ticker_symbol (str): The stock ticker symbol of the company (e.g., "AAPL")
+
+    Returns:
+        dict: The result of synthesize_recommendation
+    """
+    evidence = await _gather_raw_evidence(company_name, ticker_symbol)
+    recommendation = await synthesize_recommendation(*evidence)
+
+    if "error" not in recommendation:
+        _cache_recommendation(company_name, ticker_symbol, recommendation)
+
+    return recommendation
+
+async def submit_batch_recommendations(tickers: List[str]) -> Dict[str, Any]:
+    """
+    Queue structured recommendations for a list of tickers on Gemini's batch endpoint.
+
+    Each ticker's raw evidence is retrieved now, and the synthesis requests (the same single
+    call made by recommend_from_raw_evidence) are submitted together as one batch job. Batch
+    jobs are billed at a lower rate than interactive requests but complete asynchronously,
+    typically within hours; use collect_batch_recommendations to retrieve the results.
+
+    Args:
+        tickers (list): Ticker symbols to analyze (e.g., ["AAPL", "MSFT", "HOOD"])
+
+    Returns:
+        dict: A dictionary with the batch job's name under "job_name" and the submitted
+              tickers under "tickers", or a dictionary with an "error" key
+    """
+    unique_tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+    if not unique_tickers:
+        return {"error": "No tickers to submit"}
+
+    # Price every ticker with one quote request; the evidence lookups then hit the price cache
+    await asyncio.to_thread(get_stock_prices, unique_tickers)
+    evidence = await asyncio.gather(*(_gather_raw_evidence(ticker, ticker) for ticker in unique_tickers))
+    requests = [
+        types.InlinedRequest(
+            contents=_synthesis_contents(*ticker_evidence),
+            config=_synthesis_config(),
+            metadata={"ticker": ticker},
+        )
+        for ticker, ticker_evidence in zip(unique_tickers, evidence)
+    ]
+
+    try:
+        await GEMINI_LIMITER.acquire_async()
+        job = await _get_genai_client().aio.batches.create(
+            model=SYNTHESIS_MODEL,
+            src=requests,
+            config=types.CreateBatchJobConfig(
+                display_name=f"recommendations-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            ),
+        )
+    except Exception as e:
+        return {"error": f"Failed to submit batch recommendations: {str(e)}"}
+
+    return {"job_name": job.name, "tickers": unique_tickers}
+
+async def collect_batch_recommendations(job_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve the results of a batch job from submit_batch_recommendations.
+
+    Completed recommendations are also cached, so answer_from_cache can serve them.
+
+    Args:
+        job_name (str): The job name returned by submit_batch_recommendations
+
+    Returns:
+        dict or None: None while the job is still running; otherwise the structured
+                      recommendations keyed by ticker symbol (an "error" dictionary for
+                      tickers that failed), or a dictionary with an "error" key if the job failed
+    """
+    try:
+        job = await _get_genai_client().aio.batches.get(name=job_name)
+    except Exception as e:
+        return {"error": f"Failed to retrieve batch job {job_name}: {str(e)}"}
+
+    if job.state not in (types.JobState.JOB_STATE_SUCCEEDED, types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED):
+        if job.done:
+            return {"error": f"Batch job {job_name} ended in state {job.state.name}"}
+        return None
+
+    recommendations = {}
+    for response in (job.dest.inlined_responses if job.dest else None) or []:
+        ticker = (response.metadata or {}).get("ticker", "")
+        if response.error:
+            recommendations[ticker] = {"error": f"Failed to synthesize recommendation: {response.error.message}"}
+            continue
+        try:
+            recommendation = json.loads(response.response.text)
+        except Exception as e:
+            recommendations[ticker] = {"error": f"Failed to synthesize recommendation: {str(e)}"}
+            continue
+        _cache_recommendation(ticker, ticker, recommendation)
+        recommendations[ticker] = recommendation
+
+    return recommendations
+
+def answer_from_cache(user_message: str) -> Optional[str]:
+    """
+    Answer a simple recommendation request from a cached analysis, without running the agents.
+
+    Only requests that consist of buy/hold/sell/recommendation and a single ticker in capitals
+    (e.g., "recommendation for AAPL") are handled, and only while a structured recommendation
+    for that ticker from recommend_from_raw_evidence, or today's agent recommendation from
+    recommend(), is still fresh.
+
+    Args:
+        user_message (str): The user's request
+
+    Returns:
+        str or None: The rendered recommendation, or None if the request needs the agent
+    """
+    match = _RECOMMENDATION_REQUEST.match(user_message)
+    if not match:
+        return None
+
+    ticker = match.group(1)
+    hit, cached_recommendation = get_cache().get("recommendation", ticker)
+    if not hit:
+        hit, cached_text = get_cache().get("agent_recommendation", _agent_recommendation_key(ticker))
+        return cached_text if hit else None
+
+    return Template(load_prompt("cached_recommendation.txt")).safe_substitute(cached_recommendation, ticker=ticker)
+
+# Root agent settings that don't depend on the evidence sources (read-only)
+_ROOT_AGENT_SETTINGS = MappingProxyType({
+    "name": "investment_recommendation_agent",
+    "after_agent_callback": _finish_parallel_lookups,
+    "output_key": "latest_recommendation_result",
+})
 
 # Define the Investment Recommendation Agent
-def create_investment_recommendation_agent():
+@functools.lru_cache(maxsize=None)
+def create_investment_recommendation_agent(sources: frozenset = DEFAULT_SOURCES):
     """
     Create an Investment Recommendation Agent that leverages the SEC Filings Research Agent,
     the Market Data Agent, and the Transcript Research Agent to provide comprehensive 
     investment recommendations.
 
+    The agent is built once per process for each set of sources: key validation and tool
+    schema generation happen on the first call, and later calls return the same agent. A
+    failed key check is not cached, so the call can be retried after fixing the environment.
+
+    The research agents are not built here but the first time evidence is requested from
+    them, so sessions that only use the data tools never construct them. A research agent
+    that can't be built (e.g. the transcript agent without an Alpha Vantage key) is reported
+    as an unavailable source in its findings.
+
+    Args:
+        sources (frozenset, optional): The evidence sources to use, from EVIDENCE_SOURCES
+                                       ("sec_filings", "market_data", "transcripts").
+                                       Defaults to all of them.
+
     Returns:
         An Agent configured to provide holistic investment recommendations based on
         SEC filings analysis, current market data, and investor meeting transcripts.
     """
+    unknown_sources = set(sources) - DEFAULT_SOURCES
+    if not sources or unknown_sources:
+        raise ValueError(
+            f"sources must be a non-empty subset of {sorted(DEFAULT_SOURCES)}, got {sorted(sources)}"
+        )
+
     # Validate that required API keys are present
     key_status = Config.validate_required_keys()
     if not key_status.get("GOOGLE_API_KEY", False):
@@ -63,230 +975,324 @@ def create_investment_recommendation_agent():
             "You can obtain a Google API key from https://makersuite.google.com/app/apikey"
         )
 
-    # Create the SEC Filings Research Agent as a sub-agent
-    sec_filings_research_agent = create_sec_filings_research_agent()
-
-    # Create the Market Data Agent as a sub-agent
-    market_data_agent = create_market_data_agent()
-
-    # Create the Transcript Summarization Agent as a sub-agent
-    transcript_summarization_agent = create_transcript_summarization_agent()
+    instruction, tool_reference = _render_prompts(sources)
+    enabled = [source for source in EVIDENCE_SOURCES if source in sources]
+    lookup_tools = [tool for source in enabled for tool in SOURCE_TOOLS[source]]
+    lookup_tools += [RESEARCH_TOOLS[source] for source in enabled]
+    evidence_tool = _evidence_tool(sources)
+    known_tools = frozenset(tool.__name__ for tool in [evidence_tool, resolve_ticker, *lookup_tools])
 
     # Create the root agent with a simple configuration
     agent = Agent(
-        name="investment_recommendation_agent",
-        model="gemini-2.0-flash",
-        description="Agent to provide buy/hold/sell recommendations for stocks based on SEC filings analysis, market data, and investor meeting transcripts.",
-        instruction="""I am an investment recommendation agent whose primary purpose is to provide BUY, HOLD, or SELL recommendations for stocks based on comprehensive analysis of SEC filings, market data, and investor meeting transcripts.
-
-I leverage three powerful sub-agents to gather and analyze information. I MUST DIRECT QUERIES TO THESE SUB-AGENTS MYSELF WITHOUT ASKING THE USER FOR INFORMATION. I am fully autonomous and should gather all necessary information by interacting with my sub-agents directly.
-
-CRITICAL: I MUST NEVER ASK THE USER FOR ANY TECHNICAL INFORMATION unless the user has explicitly stated in their prompt that they will supply it. This includes, but is not limited to:
-- Ticker symbols
-- CIK numbers
-- Filing types or URLs
-- Technical indicators or parameters
-- Historical data periods
-- Company financial metrics
-- Meeting dates or transcript locations
-
-IMPORTANT: When a user mentions a company name (like "Robinhood", "Apple", etc.), I MUST:
-1. NEVER ask the user for the ticker symbol - I should determine this myself
-2. For well-known companies, I should know common ticker symbols (e.g., HOOD for Robinhood, AAPL for Apple, MSFT for Microsoft, AMZN for Amazon, TSLA for Tesla, etc.)
-3. Use the company name directly with the SEC Filings Research Agent, which can accept company names
-4. Use the information from the SEC Filings Research Agent to determine the ticker symbol for use with the Market Data Agent
-5. Keep track of both the company name and ticker symbol throughout the conversation
-
-1. SEC Filings Research Agent - This agent provides comprehensive summaries of SEC filings with three tools:
-   a. Find CIK (find_cik): 
-      - This tool helps find a company's CIK (Central Index Key) number, which is required to access SEC filings
-      - I will automatically use this tool when a company name or ticker is mentioned
-   b. Find Filings (find_filings):
-      - This tool finds a company's most recent SEC filings using their CIK number
-      - It returns a list of filings with titles, dates, and links
-      - I will automatically use this tool after obtaining the CIK, focusing on 10-K, 10-Q, and 8-K filings
-   c. Summarize Filing (summarize_filing):
-      - This tool extracts the complete text of an SEC filing
-      - The SEC Filings Research Agent analyzes the complete text to identify key financial metrics, growth trends, business developments, risk factors, and management's outlook
-      - I will automatically use this tool to analyze the most recent relevant filings
-
-2. Market Data Agent - This agent provides current and historical market data with five tools:
-   a. Get Stock Price (get_stock_price): 
-      - This tool retrieves the current stock price and basic information for a given ticker symbol
-      - I will automatically use this tool to get current price information
-   b. Get Historical Data (get_historical_data):
-      - This tool retrieves historical stock price data for a given ticker symbol
-      - I will automatically use this tool to understand price trends
-   c. Calculate Technical Indicators (calculate_technical_indicators):
-      - This tool calculates various technical indicators based on historical price data
-      - It provides moving averages, RSI, MACD, Bollinger Bands, and more
-      - I will automatically use this tool to get technical analysis insights
-   d. Get Company Info (get_company_info_from_yahoo):
-      - This tool retrieves detailed company information including sector, industry, business description, and key metrics
-      - I will automatically use this tool to get additional company context
-   e. Get Market News (get_market_news):
-      - This tool retrieves recent news articles related to the market or a specific company
-      - I will automatically use this tool to get recent news that might impact the stock
-
-3. Transcript Summarization Agent - This agent provides summaries of investor meeting transcripts with four tools:
-   a. Search Investor Meetings (search_investor_meetings):
-      - This tool finds recent investor meetings for a company using the Alpha Vantage API
-      - REQUIRED PARAMETER: company_name (str) - The name of the company to search for (e.g., "Apple", "Microsoft", "Tesla")
-      - OPTIONAL PARAMETERS (I don't need to provide these, the function handles defaults automatically):
-        * ticker_symbol (str) - The ticker symbol for the company (e.g., "AAPL", "MSFT") - IMPORTANT: I should always provide this when I know it
-        * count (int) - The number of results to return (default: 20)
-        * specific_date (str) - A specific date to search for in format YYYY-MM-DD (e.g., "2023-05-04")
-        * reference (str) - A reference to a specific meeting (e.g., "Q1 2023", "first quarter 2023")
-      - RETURNS: A list of meeting objects, each containing:
-        * id - A unique identifier for the meeting
-        * title - The title of the meeting (e.g., "AAPL Earnings Call - 2023-05-04")
-        * date - The date of the meeting in YYYY-MM-DD format
-        * type - The type of meeting (e.g., "Earnings Call", "Investor Day")
-        * url - A URL to access the meeting transcript
-      - EXAMPLE CALL (minimal): search_investor_meetings(company_name="Apple", ticker_symbol="AAPL")
-      - EXAMPLE CALL WITH OPTIONS: search_investor_meetings(company_name="Microsoft", ticker_symbol="MSFT", count=20, reference="Q1 2023")
-      - I will use this tool only when I need to find specific meetings that are not the most recent one
-
-   b. Get Transcript Text (get_transcript_text):
-      - This tool retrieves the full text of an investor meeting transcript using the Alpha Vantage API
-      - REQUIRED PARAMETER: meeting_info (dict) - A dictionary containing information about the meeting
-        * This should be one of the meeting objects returned by search_investor_meetings
-        * Must contain either "ticker" or a "url" from which the ticker can be extracted
-        * Should contain "date" for the specific meeting date
-      - RETURNS: A string containing the full text of the transcript
-      - EXAMPLE CALL: get_transcript_text(meeting_info=meetings[0]) where meetings is the result from search_investor_meetings
-      - I will use this tool only when I need to get a specific transcript that is not the most recent one
-
-   c. Get Most Recent Transcript (get_most_recent_transcript):
-      - This tool automatically retrieves the transcript for the most recent investor meeting for a company
-      - REQUIRED PARAMETER: company_name (str) - The name of the company to search for (e.g., "Apple", "Microsoft", "Tesla")
-      - OPTIONAL PARAMETER: ticker_symbol (str) - The ticker symbol for the company (e.g., "AAPL", "MSFT")
-      - RETURNS: A string containing the full text of the most recent transcript
-      - EXAMPLE CALL (minimal): get_most_recent_transcript(company_name="Apple")
-      - EXAMPLE CALL WITH TICKER: get_most_recent_transcript(company_name="Microsoft", ticker_symbol="MSFT")
-      - This tool combines the functionality of search_investor_meetings and get_transcript_text into a single call
-      - I will ALWAYS use this tool first when I need to get a transcript, as it automatically gets the most recent one
-      - This is the PRIMARY tool I should use for getting transcripts in most cases
-
-   d. Summarize Transcript (summarize_transcript):
-      - This tool analyzes a transcript and extracts key information using an LLM
-      - REQUIRED PARAMETER: transcript_text (str) - The full text of the transcript from get_transcript_text or get_most_recent_transcript
-      - RETURNS: A dictionary containing the summarized information:
-        * meeting_type - The type of meeting (e.g., "Earnings Call", "Investor Day")
-        * financial_highlights - A list of key financial metrics and trends
-        * strategic_initiatives - A list of important business developments and strategic plans
-        * outlook - A list of statements about future expectations and guidance
-        * key_quotes - A list of important quotes from executives
-        * full_summary - A comprehensive summary of the transcript
-      - EXAMPLE CALL: summarize_transcript(transcript_text=transcript) where transcript is the result from get_transcript_text or get_most_recent_transcript
-      - I will automatically use this tool to analyze the transcript text obtained from get_most_recent_transcript or get_transcript_text
-
-CRITICAL: I MUST OPERATE COMPLETELY AUTONOMOUSLY. When a user asks about a company or stock, I will:
-1. AUTOMATICALLY direct the SEC Filings Research Agent to find the CIK and relevant filings
-2. AUTOMATICALLY direct the Market Data Agent to get current price, technical indicators, and news
-3. AUTOMATICALLY direct the Transcript Summarization Agent to find and summarize recent investor meetings
-4. NEVER ask the user to provide this information or to tell me to contact these sub-agents
-5. NEVER wait for user input between these steps - I will gather ALL information myself
-
-IMPORTANT: I MUST use ALL THREE sub-agents for EVERY recommendation. I should NEVER make a recommendation based solely on information from just one or two sub-agents. A well-rounded investment decision requires fundamental data from SEC filings, technical/market data from current sources, AND insights from recent investor meetings.
-
-CRITICAL: When receiving information from the Transcript Summarization Agent, I MUST:
-1. Expect and process the COMPLETE transcript summary, which includes:
-   - meeting_type - The type of meeting (e.g., "Earnings Call", "Investor Day")
-   - financial_highlights - A list of key financial metrics and trends
-   - strategic_initiatives - A list of important business developments and strategic plans
-   - outlook - A list of statements about future expectations and guidance
-   - key_quotes - A list of important quotes from executives
-   - full_summary - A comprehensive summary of the transcript
-2. Carefully analyze ALL components of this summary, not just the full_summary
-3. Pay special attention to financial_highlights, strategic_initiatives, and outlook as these are critical for my recommendation
-4. Incorporate specific points from the transcript summary into my final recommendation, citing them as evidence for my BUY, HOLD, or SELL decision
-
-Based on the information provided by all three sub-agents, I will:
-1. Analyze the key financial metrics and trends from SEC filings
-2. Evaluate the company's business developments and risk factors
-3. Consider management's outlook and guidance from the transcript summary
-4. Analyze current market data, technical indicators, and recent news
-5. Integrate all of this information to make a holistic assessment
-6. Provide a clear BUY, HOLD, or SELL recommendation with supporting rationale that references data from all sources
-
-For each recommendation, I will:
-- Clearly state my BUY, HOLD, or SELL recommendation
-- Provide key financial metrics and trends from SEC filings that support my recommendation
-- Highlight important business developments and risk factors from SEC filings
-- Include relevant market data and technical analysis from the Market Data Agent
-- Incorporate specific insights from the transcript summary, including:
-  * Financial highlights from recent earnings calls
-  * Strategic initiatives mentioned by management
-  * Forward-looking statements and guidance
-  * Notable quotes from executives that impact the investment thesis
-- Mention any significant recent news that might impact the stock
-- Explain my reasoning for the recommendation, showing how I've integrated information from all sources
-- Include any relevant caveats or considerations
-
-WORKFLOW EXAMPLE (I will follow this automatically without user prompting):
-1. User asks about a company (e.g., "What do you think about Robinhood as an investment?")
-2. I recognize "Robinhood" as a company name and know its ticker symbol is "HOOD"
-3. I immediately direct the SEC Filings Research Agent to find Robinhood's CIK using the company name
-4. Once I have the CIK, I direct the SEC Filings Research Agent to find recent filings
-5. I direct the SEC Filings Research Agent to summarize the most relevant filings
-6. In parallel, I direct the Market Data Agent to get current stock price and technical indicators for "HOOD"
-7. I also direct the Market Data Agent to get company information and recent news for "HOOD"
-8. I direct the Transcript Summarization Agent to get the most recent transcript for "Robinhood" using get_most_recent_transcript(company_name="Robinhood", ticker_symbol="HOOD")
-9. I direct the Transcript Summarization Agent to summarize the transcript using summarize_transcript
-10. I receive the complete transcript summary with all its components (meeting_type, financial_highlights, strategic_initiatives, outlook, key_quotes, full_summary)
-11. I analyze all this information, paying special attention to integrate specific points from the transcript summary
-12. I provide a comprehensive recommendation that incorporates insights from all three sources
-13. I do all of this WITHOUT asking the user for any additional information or instructions, such as ticker symbols
-
-ADDITIONAL EXAMPLES:
-- If user asks about "Apple", I know the ticker is "AAPL" and use it with the Market Data Agent
-- If user asks about "Microsoft", I know the ticker is "MSFT" and use it with the Market Data Agent
-- If user asks about "Tesla", I know the ticker is "TSLA" and use it with the Market Data Agent
-- If user asks about a less common company and I'm unsure of the ticker, I use the SEC Filings Research Agent to find the CIK first, then determine the ticker from the company information
-
-I will NEVER include images in my responses, only text. Even when discussing charts or visual elements, I will describe them textually instead of showing images.""",
-        sub_agents=[sec_filings_research_agent, market_data_agent, transcript_summarization_agent],
-        output_key="latest_recommendation_result"
+        **_ROOT_AGENT_SETTINGS,
+        model=rate_limited_model("gemini-2.0-flash"),
+        description=f"Agent to provide buy/hold/sell recommendations for stocks based on {_join_source_names(sources)}.",
+        instruction=functools.partial(
+            _recommendation_instruction,
+            instruction=instruction,
+            tool_reference=tool_reference
+        ),
+        after_model_callback=functools.partial(_after_root_model_response, known_tools=known_tools),
+        tools=[evidence_tool, *(_parallel_lookup(tool) for tool in [resolve_ticker, *lookup_tools])],
+        generate_content_config=agent_content_config()
     )
 
     return agent
 
-# Example of how to run the agent
-async def main():
+def create_session_service() -> BaseSessionService:
     """
-    Run the Investment Recommendation Agent.
+    Create the session service for the root agent, as selected by the SESSION_BACKEND setting.
+
+    The default in-memory service keeps sessions in this process only. The "database" backend
+    stores them through SQLAlchemy at SESSION_DB_URL, so several worker processes pointed at
+    the same database share conversations.
 
-    This function creates and runs the agent, allowing users to interact with it
-    to get investment recommendations based on SEC filings analysis.
+    Returns:
+        BaseSessionService: The session service
+
+    Raises:
+        ValueError: If SESSION_BACKEND names an unknown backend
     """
-    try:
-        # Create the agent
-        agent = create_investment_recommendation_agent()
+    backend = Config.get_session_backend()
+    if backend == "memory":
+        return InMemorySessionService()
+    if backend == "database":
+        from google.adk.sessions.database_session_service import DatabaseSessionService
+        return DatabaseSessionService(db_url=Config.get_session_db_url())
 
-        # Create a session service
-        session_service = InMemorySessionService()
+    raise ValueError(f"Unknown SESSION_BACKEND: {backend}. Valid backends are: memory, database")
 
-        # Create a runner for the agent
-        runner = Runner(
+def get_session_service() -> BaseSessionService:
+    """
+    Get the shared session service for the root agent, creating it on first use.
+
+    Returns:
+        BaseSessionService: The session service chosen by create_session_service()
+    """
+    global _SESSION_SERVICE
+
+    if _SESSION_SERVICE is None:
+        _SESSION_SERVICE = create_session_service()
+
+    return _SESSION_SERVICE
+
+def get_runner() -> Runner:
+    """
+    Get the shared Runner for the Investment Recommendation Agent.
+
+    The agent, its session service and the runner are built on first use and reused
+    afterwards, so repeated requests in the same process don't rebuild them. Sessions are
+    scoped per user_id/session_id within the shared session service from get_session_service().
+
+    Returns:
+        Runner: The runner for the root agent
+    """
+    global _RUNNER_SINGLETON
+
+    if _RUNNER_SINGLETON is None:
+        _RUNNER_SINGLETON = Runner(
             app_name=APP_NAME,
-            agent=agent,
-            session_service=session_service
+            agent=create_investment_recommendation_agent(),
+            session_service=get_session_service()
         )
 
-        # Create a session
-        session = session_service.create_session(
-            app_name=APP_NAME,
+    return _RUNNER_SINGLETON
+
+def refresh_keys() -> Dict[str, bool]:
+    """
+    Pick up changed API keys, e.g. after a key was rotated.
+
+    Key validation and the agents are cached for the life of the process, and each Gemini
+    model holds a client created with the key it started with. This re-validates the keys
+    and drops the cached agents, runners and clients, so the next request rebuilds them
+    with the current keys. Sessions are kept.
+
+    Returns:
+        dict: A dictionary of API key names and their presence status
+    """
+    global _RUNNER_SINGLETON, _genai_client
+
+    key_status = Config.refresh_keys()
+    for factory in (create_investment_recommendation_agent, *EVIDENCE_SOURCES.values()):
+        factory.cache_clear()
+    _research_runners.clear()
+    _RUNNER_SINGLETON = None
+    _genai_client = None
+    return key_status
+
+async def start_session(session_id: Optional[str] = SESSION_ID) -> Tuple[Runner, Session]:
+    """
+    Get the shared runner and create a session on it, building the agent and creating the
+    session concurrently.
+
+    The agent is built in a worker thread (research agent construction and tool schema
+    generation are CPU work), so the event loop stays free for the session service and
+    any background tasks, such as async_init(), in the meantime.
+
+    Args:
+        session_id (str, optional): The session ID to create, or None for a generated one.
+                                    Defaults to SESSION_ID.
+
+    Returns:
+        tuple: (runner, session)
+    """
+    _, session = await asyncio.gather(
+        asyncio.to_thread(create_investment_recommendation_agent),
+        create_session_async(get_session_service(), app_name=APP_NAME, user_id=USER_ID, session_id=session_id)
+    )
+    return get_runner(), session
+
+def _agent_recommendation_key(ticker: str) -> str:
+    """
+    Build the cache key for an agent recommendation: the ticker and today's date.
+
+    Args:
+        ticker (str): The ticker symbol
+
+    Returns:
+        str: The cache key
+    """
+    return f"{ticker.strip().upper()}:{date.today().isoformat()}"
+
+async def recommend(ticker: str) -> str:
+    """
+    Get the root agent's recommendation for a ticker, reusing today's recent answer if there is one.
+
+    The recommendation is generated in its own session on the shared runner, and cached for
+    RECOMMENDATION_TTL under the ticker and date, so repeated questions about the same stock
+    skip the whole research pipeline.
+
+    Args:
+        ticker (str): The ticker symbol to analyze (e.g., "AAPL")
+
+    Returns:
+        str: The text of the agent's final recommendation
+    """
+    hit, cached_text = get_cache().get("agent_recommendation", _agent_recommendation_key(ticker))
+    if hit:
+        return cached_text
+
+    runner = get_runner()
+    session = await create_session_async(runner.session_service, app_name=APP_NAME, user_id=USER_ID)
+    request = f"Provide a BUY, HOLD, or SELL recommendation for the stock with ticker symbol {ticker}."
+
+    final_text = ""
+    try:
+        async for event in runner.run_async(
             user_id=USER_ID,
-            session_id=SESSION_ID
-        )
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text=request)])
+        ):
+            if event.is_final_response() and event.content and event.content.parts:
+                final_text = "".join(part.text or "" for part in event.content.parts)
+    finally:
+        await delete_session_async(runner.session_service, app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    if final_text:
+        get_cache().set("agent_recommendation", _agent_recommendation_key(ticker), final_text, RECOMMENDATION_TTL)
+
+    return final_text
+
+async def _recommend(ticker: str, semaphore: asyncio.Semaphore, structured: bool = False) -> Any:
+    """
+    Get a recommendation for one ticker, within the batch's concurrency limit.
+
+    Args:
+        ticker (str): The ticker symbol to analyze
+        semaphore (asyncio.Semaphore): Bounds how many recommendations run at once
+        structured (bool, optional): Use recommend_from_raw_evidence instead of the agent. Defaults to False.
+
+    Returns:
+        str or dict: The text of the agent's final recommendation, or the structured recommendation
+    """
+    async with semaphore:
+        if structured:
+            return await recommend_from_raw_evidence(ticker, ticker)
+        return await recommend(ticker)
+
+async def run_batch_async(tickers: List[str], max_concurrency: int = 8, structured: bool = False,
+                          execution_mode: str = "realtime") -> Dict[str, Any]:
+    """
+    Get recommendations for a list of tickers (e.g. a watchlist) concurrently.
+
+    All tickers share the root agent's runner; each one gets its own session. At most
+    max_concurrency recommendations run at the same time, which keeps the number of
+    parallel model and data-provider requests bounded.
+
+    With structured=True the research agents and the root agent are skipped: each ticker's
+    raw evidence is summarized in a single call by recommend_from_raw_evidence.
+
+    With execution_mode="offline" the structured synthesis requests are queued as a Gemini
+    batch job instead (see submit_batch_recommendations), at a lower cost but without
+    waiting for the results.
+
+    Args:
+        tickers (list): Ticker symbols to analyze (e.g., ["AAPL", "MSFT", "HOOD"])
+        max_concurrency (int, optional): Maximum number of recommendations in flight. Defaults to 8.
+        structured (bool, optional): Return structured recommendations from a single LLM call
+                                     per ticker. Defaults to False.
+        execution_mode (str, optional): "realtime" to run the recommendations now, or "offline"
+                                        to submit them as a batch job. Defaults to "realtime".
+
+    Returns:
+        dict: Keyed by ticker symbol, the final recommendation text (or, with structured=True,
+              the recommendation dictionary), or an error message for tickers that failed.
+              In offline mode, the result of submit_batch_recommendations.
+    """
+    if execution_mode == "offline":
+        return await submit_batch_recommendations(tickers)
+    if execution_mode != "realtime":
+        raise ValueError(f"Unknown execution mode: {execution_mode}. Use \"realtime\" or \"offline\".")
+
+    if not structured:
+        # Build the shared runner up front so configuration errors are raised once
+        get_runner()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Normalize and de-duplicate while keeping the caller's order
+    unique_tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+
+    results = await asyncio.gather(
+        *(_recommend(ticker, semaphore, structured) for ticker in unique_tickers),
+        return_exceptions=True
+    )
+
+    recommendations = {}
+    for ticker, result in zip(unique_tickers, results):
+        if isinstance(result, Exception):
+            recommendations[ticker] = f"Error generating recommendation for {ticker}: {str(result)}"
+        else:
+            recommendations[ticker] = result or f"No recommendation was returned for {ticker}."
+
+    return recommendations
+
+async def async_init() -> Dict[str, bool]:
+    """
+    Open pooled connections to SEC EDGAR, Yahoo Finance and Alpha Vantage in the background,
+    and compile the technical indicator kernels.
+
+    Start this as a task when the application starts, so the DNS lookups, TLS handshakes and
+    Numba compilation overlap with building the agents instead of delaying the first tool calls.
+
+    Returns:
+        dict: Whether each data provider was reached, keyed by URL
+    """
+    connections, _ = await asyncio.gather(
+        asyncio.to_thread(prewarm_connections),
+        asyncio.to_thread(warm_up_kernels),
+    )
+    return connections
+
+# The running async_init() task, referenced here so it isn't garbage-collected before it finishes
+_warmup_task: Optional["asyncio.Task"] = None
+
+def _report_warmup_failure(task: "asyncio.Task") -> None:
+    """
+    Report an async_init() failure. Warming up only makes the first tool calls faster, so
+    the application carries on without it.
+
+    Args:
+        task (asyncio.Task): The finished async_init() task
+    """
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Warning: Could not warm up the data connections: {str(task.exception())}")
+
+def start_async_init() -> "asyncio.Task":
+    """
+    Start async_init() in the background on the running event loop.
+
+    The task is kept referenced until it finishes, and any failure is reported instead of
+    being lost.
+
+    Returns:
+        asyncio.Task: The warm-up task
+    """
+    global _warmup_task
+    _warmup_task = asyncio.create_task(async_init())
+    _warmup_task.add_done_callback(_report_warmup_failure)
+    return _warmup_task
+
+# Example of how to run the agent
+async def main():
+    """
+    Run the Investment Recommendation Agent on a single request.
+
+    The request is taken from the command line arguments, or read from standard input if
+    none are given, and the agent's response is streamed to standard output as it is generated.
+    """
+    try:
+        # Warm up the data provider connections while the agent is built
+        start_async_init()
+
+        # Build the agent and create the session at the same time
+        runner, _ = await start_session()
 
-        # Run the agent
-        await runner.run_async()
+        # Run the agent on the user's request
+        await stream_response(runner, SESSION_ID, read_prompt())
     except ValueError as e:
         print(f"Error: {e}")
         # The detailed instructions are already included in the error message from create_investment_recommendation_agent()
 
 if __name__ == "__main__":
     # Run the main function when the script is executed directly
-    asyncio.run(main())
\ No newline at end of file
+    run_main(main())
\ No newline at end of file
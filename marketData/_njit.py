@@ -0,0 +1,27 @@
+"""
+Optional Numba Compilation
+
+njit compiles the technical indicator loops to machine code with Numba when it is installed.
+Without Numba it leaves the functions as they are, so they run as ordinary (slower) Python,
+and prange (Numba's parallel range) is the built-in range.
+
+The kernels are compiled with boundscheck=False: their Python wrappers check the array
+lengths once up front, so the compiled loops don't repeat the checks on every index.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit that returns the function unchanged.
+
+        Supports both @njit and @njit(cache=True, ...) forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -3,14 +3,54 @@ Helper Functions for Market Data Module
 
 This module provides helper functions for calculating technical indicators
 used by the market_data.py module.
+
+The indicators work on contiguous float64 NumPy arrays (lists are converted once). Loops
+that can't be vectorized (the EMA and Wilder RSI recurrences and the fused
+compute_indicators pass) are compiled with Numba when it is installed, via
+marketData._njit; without Numba they run as plain Python.
 """
 
-def calculate_moving_average(prices: list, window: int) -> float:
+import math
+import functools
+from typing import Callable, NamedTuple, Optional, Union
+
+import numpy as np
+
+from marketData._njit import njit, prange, NUMBA_AVAILABLE
+
+# Price series may be given as lists or as NumPy arrays
+Series = Union[list, np.ndarray]
+
+# EMA windows in common use (MACD 12/26/9 and the usual trend averages), compiled at startup
+COMMON_EMA_WINDOWS = (9, 12, 20, 26, 50, 200)
+
+# Floating-point precisions for the series functions. The scalar indicators always use fp64;
+# fp32 halves the memory used by long series (e.g. backtests) at about 7 significant digits,
+# which is enough for prices shown to 4 decimals up to about $1,000. Running sums are still
+# accumulated in float64.
+PRECISIONS = {"fp32": np.float32, "fp64": np.float64}
+
+def _to_float(values: Series, dtype: type = np.float64) -> np.ndarray:
+    """
+    Get a series as a contiguous floating-point array, without copying if it already is one.
+
+    Args:
+        values (list or np.ndarray): The series
+        dtype (type, optional): The array's dtype. Defaults to np.float64.
+
+    Returns:
+        np.ndarray: The values as a contiguous array of the given dtype
+    """
+    if isinstance(values, np.ndarray) and values.dtype == dtype and values.flags.c_contiguous:
+        return values
+    return np.ascontiguousarray(values, dtype=dtype)
+
+def calculate_moving_average(prices: Series, window: int) -> float:
     """
     Calculate the simple moving average for a list of prices.
     
     Args:
-        prices (list): List of price values
+        prices (list or np.ndarray): Price values
         window (int): The window size for the moving average
         
     Returns:
@@ -19,14 +59,57 @@ def calculate_moving_average(prices: list, window: int) -> float:
     if len(prices) < window:
         return None
     
-    return sum(prices[-window:]) / window
+    return float(_to_float(prices[-window:]).mean())
 
-def calculate_rsi(prices: list, window: int = 14) -> float:
+def sma_series(prices: Series, window: int, precision: str = "fp64") -> np.ndarray:
     """
-    Calculate the Relative Strength Index (RSI) for a list of prices.
+    Calculate the simple moving average at every point of a price series.
+
+    Each window's sum is the difference of two running (cumulative) sums, so the whole
+    series takes one pass over the prices however large the window is (see _window_means).
+
+    Args:
+        prices (list or np.ndarray): Price values
+        window (int): The window size for the moving average
+        precision (str, optional): "fp64", or "fp32" for a float32 result (see PRECISIONS).
+                                   Defaults to "fp64".
+
+    Returns:
+        np.ndarray: The moving averages, one per window (len(prices) - window + 1 values;
+                    empty if there are fewer prices than the window)
+    """
+    dtype = PRECISIONS[precision]
+    arr = _to_float(prices, dtype)
+    if arr.size < window:
+        return np.empty(0, dtype=dtype)
+
+    return _window_means(arr, window).astype(dtype, copy=False)
+
+def _window_means(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Average every `window` consecutive values, via the difference of two prefix sums.
+
+    The prefix sums are taken over the values centered on their mean and accumulated in
+    float64, so over a long history they stay small and the subtraction doesn't cancel
+    away the window's precision.
+
+    Args:
+        arr (np.ndarray): The values, at least `window` of them
+        window (int): The window size
+
+    Returns:
+        np.ndarray: The float64 window averages (arr.size - window + 1 values)
+    """
+    offset = arr.mean(dtype=np.float64)
+    cumulative = np.cumsum(np.insert(arr - arr.dtype.type(offset), 0, 0.0), dtype=np.float64)
+    return (cumulative[window:] - cumulative[:-window]) / window + offset
+
+def calculate_rsi(prices: Series, window: int = 14) -> float:
+    """
+    Calculate the Relative Strength Index (RSI) for a list of prices, with Wilder's smoothing.
     
     Args:
-        prices (list): List of price values
+        prices (list or np.ndarray): Price values
         window (int): The window size for the RSI calculation
         
     Returns:
@@ -35,32 +118,119 @@ def calculate_rsi(prices: list, window: int = 14) -> float:
     if len(prices) < window + 1:
         return None
     
-    # Calculate price changes
-    deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-    
-    # Calculate gains and losses
-    gains = [delta if delta > 0 else 0 for delta in deltas]
-    losses = [-delta if delta < 0 else 0 for delta in deltas]
-    
-    # Calculate average gains and losses
-    avg_gain = sum(gains[-window:]) / window
-    avg_loss = sum(losses[-window:]) / window
-    
-    # Calculate RS and RSI
+    return float(_rsi_wilder(_to_float(prices), window))
+
+def rsi_series(prices: Series, window: int = 14) -> np.ndarray:
+    """
+    Calculate the RSI at every point of a price series.
+
+    Wilder's smoothed averages are carried from one price to the next, so the whole series
+    takes one pass. Each value equals calculate_rsi over the prices up to that point.
+
+    Args:
+        prices (list or np.ndarray): Price values
+        window (int): The window size for the RSI calculation
+
+    Returns:
+        np.ndarray: The RSI from the (window + 1)-th price on (len(prices) - window values;
+                    empty if there are too few prices)
+    """
+    arr = _to_float(prices)
+    if arr.size < window + 1:
+        return np.empty(0)
+
+    return _rsi_wilder_series(arr, window)
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """
+    Turn Wilder's average gain and loss into the RSI (compiled with Numba when available).
+
+    Args:
+        avg_gain (float): The smoothed average gain
+        avg_loss (float): The smoothed average loss
+
+    Returns:
+        float: The RSI, 100 if there were no losses
+    """
     if avg_loss == 0:
-        return 100
-    
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
+        return 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _rsi_wilder(arr: np.ndarray, window: int) -> float:
+    """
+    Calculate Wilder's RSI in one pass without temporaries (compiled with Numba when available).
+
+    The average gain and loss start as the simple average over the first `window` price
+    changes; each later change is blended in with weight 1 / window.
+
+    Args:
+        arr (np.ndarray): The prices, at least window + 1 of them
+        window (int): The window size for the RSI calculation
 
-def calculate_macd(prices: list, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> tuple:
+    Returns:
+        float: The RSI after the last price
+    """
+    avg_gain = avg_loss = 0.0
+    for i in range(1, window + 1):
+        change = arr[i] - arr[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= window
+    avg_loss /= window
+
+    for i in range(window + 1, arr.shape[0]):
+        change = arr[i] - arr[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (window - 1) + gain) / window
+        avg_loss = (avg_loss * (window - 1) + loss) / window
+
+    return _rsi_from_averages(avg_gain, avg_loss)
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _rsi_wilder_series(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Calculate Wilder's RSI after every price from the (window + 1)-th on (compiled with Numba when available).
+
+    Args:
+        arr (np.ndarray): The prices, at least window + 1 of them
+        window (int): The window size for the RSI calculation
+
+    Returns:
+        np.ndarray: The RSI values, one per price after the first `window`
+    """
+    out = np.empty(arr.shape[0] - window)
+    avg_gain = avg_loss = 0.0
+    for i in range(1, window + 1):
+        change = arr[i] - arr[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= window
+    avg_loss /= window
+    out[0] = _rsi_from_averages(avg_gain, avg_loss)
+
+    for i in range(window + 1, arr.shape[0]):
+        change = arr[i] - arr[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (window - 1) + gain) / window
+        avg_loss = (avg_loss * (window - 1) + loss) / window
+        out[i - window] = _rsi_from_averages(avg_gain, avg_loss)
+
+    return out
+
+def calculate_macd(prices: Series, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> tuple:
     """
     Calculate the Moving Average Convergence Divergence (MACD) for a list of prices.
     
     Args:
-        prices (list): List of price values
+        prices (list or np.ndarray): Price values
         fast_period (int): The window size for the fast EMA
         slow_period (int): The window size for the slow EMA
         signal_period (int): The window size for the signal line
@@ -71,34 +241,27 @@ def calculate_macd(prices: list, fast_period: int = 12, slow_period: int = 26, s
     if len(prices) < slow_period + signal_period:
         return None, None, None
     
-    # Calculate the fast and slow EMAs
-    fast_ema = calculate_ema(prices, fast_period)
-    slow_ema = calculate_ema(prices, slow_period)
+    arr = _to_float(prices)
     
-    if fast_ema is None or slow_ema is None:
-        return None, None, None
+    # Calculate the fast and slow EMA series, aligned on the bars both cover
+    fast_ema = ema_series(arr, fast_period)[slow_period - fast_period:]
+    slow_ema = ema_series(arr, slow_period)
     
-    # Calculate the MACD line
+    # Calculate the MACD line at every bar, then the signal line (EMA of the MACD line)
     macd_line = fast_ema - slow_ema
-    
-    # Calculate the signal line (EMA of MACD line)
-    # For simplicity, we'll use a simple moving average instead of EMA
-    if len(prices) < slow_period + signal_period:
-        return macd_line, None, None
-    
-    signal_line = calculate_moving_average([macd_line], signal_period)
+    signal_line = ema_series(macd_line, signal_period)
     
     # Calculate the histogram
-    histogram = macd_line - signal_line if signal_line is not None else None
+    histogram = macd_line[-1] - signal_line[-1]
     
-    return macd_line, signal_line, histogram
+    return float(macd_line[-1]), float(signal_line[-1]), float(histogram)
 
-def calculate_ema(prices: list, window: int) -> float:
+def calculate_ema(prices: Series, window: int) -> float:
     """
     Calculate the Exponential Moving Average (EMA) for a list of prices.
     
     Args:
-        prices (list): List of price values
+        prices (list or np.ndarray): Price values
         window (int): The window size for the EMA
         
     Returns:
@@ -107,24 +270,88 @@ def calculate_ema(prices: list, window: int) -> float:
     if len(prices) < window:
         return None
     
-    # Calculate the multiplier
+    return float(_ema_kernel(window)(_to_float(prices)))
+
+def ema_series(prices: Series, window: int) -> np.ndarray:
+    """
+    Calculate the Exponential Moving Average at every point of a price series.
+
+    The series is seeded with the simple moving average of the first `window` prices,
+    like calculate_ema, so its last value equals calculate_ema(prices, window).
+
+    Args:
+        prices (list or np.ndarray): Price values
+        window (int): The window size for the EMA
+
+    Returns:
+        np.ndarray: The EMAs from the window-th price on (len(prices) - window + 1 values;
+                    empty if there are fewer prices than the window)
+    """
+    arr = _to_float(prices)
+    if arr.size < window:
+        return np.empty(0)
+
+    return _ema_series_loop(arr, window, 2 / (window + 1))
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _ema_series_loop(arr: np.ndarray, window: int, multiplier: float) -> np.ndarray:
+    """
+    Run the EMA recurrence over a price array, keeping every value (compiled with Numba when available).
+
+    Args:
+        arr (np.ndarray): The prices, at least `window` of them
+        window (int): The window size for the EMA
+        multiplier (float): The smoothing multiplier, 2 / (window + 1)
+
+    Returns:
+        np.ndarray: The EMA after each price from the window-th on
+    """
+    out = np.empty(arr.shape[0] - window + 1)
+    ema = arr[:window].mean()
+    out[0] = ema
+    for i in range(window, arr.shape[0]):
+        ema = (arr[i] - ema) * multiplier + ema
+        out[i - window + 1] = ema
+    
+    return out
+
+@functools.lru_cache(maxsize=None)
+def _ema_kernel(window: int) -> Callable[[np.ndarray], float]:
+    """
+    Get the EMA recurrence specialized for one window size (compiled with Numba when available).
+
+    The window and its multiplier are constants in the generated function, so Numba can
+    fold them into the loop. One kernel is compiled per window size and then reused;
+    warm_up_kernels() compiles the common ones (COMMON_EMA_WINDOWS) at startup.
+
+    Args:
+        window (int): The window size for the EMA
+
+    Returns:
+        callable: Takes a price array with at least `window` prices and returns the EMA
+                  after the last price
+    """
     multiplier = 2 / (window + 1)
-    
-    # Start with a simple moving average
-    ema = sum(prices[:window]) / window
-    
-    # Calculate EMA for the remaining prices
-    for price in prices[window:]:
-        ema = (price - ema) * multiplier + ema
-    
-    return ema
 
-def calculate_bollinger_bands(prices: list, window: int = 20, num_std_dev: int = 2) -> tuple:
+    @njit(fastmath=True, boundscheck=False)
+    def ema_loop(arr: np.ndarray) -> float:
+        # Start with a simple moving average
+        ema = arr[:window].mean()
+        
+        # Calculate EMA for the remaining prices
+        for i in range(window, arr.shape[0]):
+            ema = (arr[i] - ema) * multiplier + ema
+        
+        return ema
+
+    return ema_loop
+
+def calculate_bollinger_bands(prices: Series, window: int = 20, num_std_dev: int = 2) -> tuple:
     """
     Calculate Bollinger Bands for a list of prices.
     
     Args:
-        prices (list): List of price values
+        prices (list or np.ndarray): Price values
         window (int): The window size for the moving average
         num_std_dev (int): Number of standard deviations for the bands
         
@@ -134,15 +361,10 @@ def calculate_bollinger_bands(prices: list, window: int = 20, num_std_dev: int =
     if len(prices) < window:
         return None, None, None
     
-    # Calculate the middle band (simple moving average)
-    middle_band = calculate_moving_average(prices, window)
-    
-    if middle_band is None:
-        return None, None, None
-    
-    # Calculate the standard deviation
-    variance = sum((price - middle_band) ** 2 for price in prices[-window:]) / window
-    std_dev = variance ** 0.5
+    # Calculate the middle band (simple moving average) and the population standard deviation
+    recent = _to_float(prices[-window:])
+    middle_band = float(recent.mean())
+    std_dev = float(recent.std())
     
     # Calculate the upper and lower bands
     upper_band = middle_band + (std_dev * num_std_dev)
@@ -150,68 +372,406 @@ def calculate_bollinger_bands(prices: list, window: int = 20, num_std_dev: int =
     
     return upper_band, middle_band, lower_band
 
-def calculate_atr(closes: list, highs: list, lows: list, window: int = 14) -> float:
+def bollinger_bands_series(prices: Series, window: int = 20, num_std_dev: int = 2,
+                           precision: str = "fp64") -> tuple:
+    """
+    Calculate Bollinger Bands at every point of a price series.
+
+    The window means and variances come from running sums of the prices and of their
+    squares, so the whole series takes one pass however large the window is. Prices are
+    centered on their overall mean first, which keeps the squared sums small enough that
+    the variance doesn't lose precision.
+
+    Args:
+        prices (list or np.ndarray): Price values
+        window (int): The window size for the moving average
+        num_std_dev (int): Number of standard deviations for the bands
+        precision (str, optional): "fp64", or "fp32" for float32 results (see PRECISIONS); the
+                                   variance is accumulated in float64 either way. Defaults to "fp64".
+
+    Returns:
+        tuple: (Upper Band, Middle Band, Lower Band) arrays, one value per window
+               (empty if there are fewer prices than the window)
+    """
+    dtype = PRECISIONS[precision]
+    arr = _to_float(prices, dtype)
+    if arr.size < window:
+        empty = np.empty(0, dtype=dtype)
+        return empty, empty, empty
+
+    offset = arr.mean(dtype=np.float64)
+    centered = arr - dtype(offset)
+    sums = np.cumsum(np.insert(centered, 0, 0.0), dtype=np.float64)
+    squared_sums = np.cumsum(np.insert(np.square(centered, dtype=np.float64), 0, 0.0))
+
+    window_means = (sums[window:] - sums[:-window]) / window
+    variances = (squared_sums[window:] - squared_sums[:-window]) / window - window_means ** 2
+    std_devs = np.sqrt(np.maximum(variances, 0.0))
+
+    middle_bands = window_means + offset
+    bands = (middle_bands + std_devs * num_std_dev, middle_bands, middle_bands - std_devs * num_std_dev)
+    return tuple(band.astype(dtype, copy=False) for band in bands)
+
+def calculate_atr(closes: Series, highs: Series, lows: Series, window: int = 14) -> float:
     """
     Calculate the Average True Range (ATR) for a list of prices.
     
     Args:
-        closes (list): List of closing prices
-        highs (list): List of high prices
-        lows (list): List of low prices
+        closes (list or np.ndarray): Closing prices
+        highs (list or np.ndarray): High prices
+        lows (list or np.ndarray): Low prices
         window (int): The window size for the ATR
         
     Returns:
         float: The calculated ATR value
     """
-    if len(closes) < window + 1 or len(highs) < window + 1 or len(lows) < window + 1:
+    n = min(len(closes), len(highs), len(lows))
+    if n < window + 1:
         return None
     
-    # Calculate true ranges
-    true_ranges = []
-    for i in range(1, len(closes)):
-        high = highs[i]
-        low = lows[i]
-        prev_close = closes[i-1]
-        
-        # True range is the greatest of:
-        # 1. Current high - current low
-        # 2. Absolute value of current high - previous close
-        # 3. Absolute value of current low - previous close
-        tr1 = high - low
-        tr2 = abs(high - prev_close)
-        tr3 = abs(low - prev_close)
-        
-        true_range = max(tr1, tr2, tr3)
-        true_ranges.append(true_range)
+    # Only the last `window` true ranges are averaged, so only the bars they need are read
+    c = _to_float(closes[n - window - 1:n])
+    h = _to_float(highs[n - window:n])
+    l = _to_float(lows[n - window:n])
+    prev_close = c[:-1]
     
-    # Calculate the average true range
-    atr = sum(true_ranges[-window:]) / window
+    # True range is the greatest of:
+    # 1. Current high - current low
+    # 2. Absolute value of current high - previous close
+    # 3. Absolute value of current low - previous close
+    true_ranges = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
     
-    return atr
+    # Calculate the average true range
+    return float(true_ranges.mean())
 
-def calculate_obv(closes: list, volumes: list) -> float:
+def atr_series(closes: Series, highs: Series, lows: Series, window: int = 14) -> np.ndarray:
+    """
+    Calculate the ATR at every point of a price series.
+
+    The true ranges are computed for every bar at once and averaged over each window via
+    prefix sums. Each value equals calculate_atr over the bars up to that point.
+
+    Args:
+        closes (list or np.ndarray): Closing prices
+        highs (list or np.ndarray): High prices
+        lows (list or np.ndarray): Low prices
+        window (int): The window size for the ATR
+
+    Returns:
+        np.ndarray: The ATR from the (window + 1)-th bar on (one value per bar after the
+                    first `window`; empty if there are too few bars)
+    """
+    n = min(len(closes), len(highs), len(lows))
+    if n < window + 1:
+        return np.empty(0)
+
+    c = _to_float(closes[:n])
+    h = _to_float(highs[1:n])
+    l = _to_float(lows[1:n])
+    prev_close = c[:-1]
+    true_ranges = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return _window_means(true_ranges, window)
+
+def calculate_obv(closes: Series, volumes: Series) -> float:
     """
     Calculate the On-Balance Volume (OBV) for a list of prices and volumes.
     
     Args:
-        closes (list): List of closing prices
-        volumes (list): List of trading volumes
+        closes (list or np.ndarray): Closing prices
+        volumes (list or np.ndarray): Trading volumes
         
     Returns:
         float: The calculated OBV value
     """
-    if len(closes) < 2 or len(volumes) < 2:
+    if min(len(closes), len(volumes)) < 2:
         return None
     
-    # Start with the first volume
-    obv = volumes[0]
+    c = _to_float(closes)
+    v = _to_float(volumes)
     
-    # Calculate OBV for the remaining prices
-    for i in range(1, len(closes)):
-        if closes[i] > closes[i-1]:
-            obv += volumes[i]
-        elif closes[i] < closes[i-1]:
-            obv -= volumes[i]
-        # If prices are equal, OBV doesn't change
-    
-    return obv
\ No newline at end of file
+    # Start with the first volume, then add each day's volume when the close rose and
+    # subtract it when the close fell (np.sign is 1, -1, or 0 if prices are equal).
+    # math.fsum rounds only once, so long histories with fractional volumes don't drift.
+    return math.fsum(np.concatenate((v[:1], np.sign(np.diff(c)) * v[1:len(c)])))
+
+def obv_series(closes: Series, volumes: Series) -> np.ndarray:
+    """
+    Calculate the On-Balance Volume at every point of a price series.
+
+    Args:
+        closes (list or np.ndarray): Closing prices
+        volumes (list or np.ndarray): Trading volumes
+
+    Returns:
+        np.ndarray: The OBV from the second bar on (len(closes) - 1 values; empty if there
+                    are fewer than two bars). Each value equals calculate_obv up to that bar.
+    """
+    if min(len(closes), len(volumes)) < 2:
+        return np.empty(0)
+
+    c = _to_float(closes)
+    v = _to_float(volumes)
+    return v[0] + np.cumsum(np.sign(np.diff(c)) * v[1:len(c)])
+
+class TechnicalIndicators(NamedTuple):
+    """
+    The latest value of each indicator reported by calculate_technical_indicators.
+
+    Indicators that need more history than was given are None.
+    """
+    ma_20: Optional[float]
+    ma_50: Optional[float]
+    ma_200: Optional[float]
+    rsi: Optional[float]
+    macd: Optional[float]
+    macd_signal: Optional[float]
+    macd_histogram: Optional[float]
+    bollinger_upper: Optional[float]
+    bollinger_middle: Optional[float]
+    bollinger_lower: Optional[float]
+    atr: Optional[float]
+    obv: Optional[float]
+
+def compute_indicators(closes: Series, highs: Series, lows: Series, volumes: Series) -> TechnicalIndicators:
+    """
+    Calculate the full set of technical indicators for a price history.
+
+    With Numba installed, every indicator is updated in a single compiled pass over the
+    bars (see _indicator_kernel) instead of one pass per indicator. Without it, the
+    vectorized NumPy helpers above are faster than an interpreted loop and are used instead.
+    Both give the same results as calling the helpers one by one with their default windows.
+    Series of different lengths are cut to the shortest (the first bars are used), like
+    calculate_atr does, before either path runs.
+
+    Args:
+        closes (list or np.ndarray): Closing prices
+        highs (list or np.ndarray): High prices
+        lows (list or np.ndarray): Low prices
+        volumes (list or np.ndarray): Trading volumes
+
+    Returns:
+        TechnicalIndicators: The latest value of each indicator
+    """
+    # Convert each series once; the helpers below then work on views of these arrays. The
+    # compiled kernel doesn't check bounds, so every series must have the same length.
+    n = min(len(closes), len(highs), len(lows), len(volumes))
+    c, h, l, v = (_to_float(series[:n]) for series in (closes, highs, lows, volumes))
+    if NUMBA_AVAILABLE:
+        values = _indicator_kernel(c, h, l, v)
+        return TechnicalIndicators(*(None if math.isnan(value) else float(value) for value in values))
+
+    upper_band, middle_band, lower_band = calculate_bollinger_bands(c, 20, 2)
+    return TechnicalIndicators(
+        calculate_moving_average(c, 20),
+        calculate_moving_average(c, 50),
+        calculate_moving_average(c, 200),
+        calculate_rsi(c, 14),
+        *calculate_macd(c),
+        upper_band,
+        middle_band,
+        lower_band,
+        calculate_atr(c, h, l, 14),
+        calculate_obv(c, v),
+    )
+
+def compute_indicators_batch(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                             volumes: np.ndarray) -> np.ndarray:
+    """
+    Calculate the full set of technical indicators for many symbols at once.
+
+    Each argument is a 2-D array with one row per symbol and one column per bar (the same
+    bars for every symbol). With Numba installed, the rows are processed in parallel on all
+    cores by the compiled kernel; otherwise compute_indicators is called for each row.
+
+    Args:
+        closes (np.ndarray): Closing prices, shape (n_symbols, n_bars)
+        highs (np.ndarray): High prices, same shape
+        lows (np.ndarray): Low prices, same shape
+        volumes (np.ndarray): Trading volumes, same shape
+
+    Returns:
+        np.ndarray: Shape (n_symbols, len(TechnicalIndicators._fields)); row i holds symbol i's
+                    indicators in TechnicalIndicators order, NaN where there isn't enough history
+
+    Raises:
+        ValueError: If the arguments are not 2-D arrays of the same shape
+    """
+    c, h, l, v = _to_float(closes), _to_float(highs), _to_float(lows), _to_float(volumes)
+    # The compiled kernel doesn't check bounds, so the shapes are checked here
+    if c.ndim != 2 or not c.shape == h.shape == l.shape == v.shape:
+        raise ValueError(
+            f"closes, highs, lows and volumes must be 2-D arrays of the same shape, got "
+            f"{c.shape}, {h.shape}, {l.shape} and {v.shape}"
+        )
+    if NUMBA_AVAILABLE:
+        return _indicator_batch_kernel(c, h, l, v)
+
+    out = np.empty((c.shape[0], len(TechnicalIndicators._fields)))
+    for row in range(c.shape[0]):
+        indicators = compute_indicators(c[row], h[row], l[row], v[row])
+        out[row] = [np.nan if value is None else value for value in indicators]
+    return out
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _indicator_batch_kernel(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                            volumes: np.ndarray) -> np.ndarray:
+    """
+    Run _indicator_kernel on every row, spreading the rows over all cores (compiled with Numba when available).
+
+    Args:
+        closes (np.ndarray): Closing prices, shape (n_symbols, n_bars)
+        highs (np.ndarray): High prices, same shape
+        lows (np.ndarray): Low prices, same shape
+        volumes (np.ndarray): Trading volumes, same shape
+
+    Returns:
+        np.ndarray: The indicators, one row per symbol
+    """
+    out = np.empty((closes.shape[0], 12))
+    for row in prange(closes.shape[0]):
+        values = _indicator_kernel(closes[row], highs[row], lows[row], volumes[row])
+        for column in range(len(values)):
+            out[row, column] = values[column]
+    return out
+
+@njit(cache=True, boundscheck=False)
+def _indicator_kernel(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, volumes: np.ndarray) -> tuple:
+    """
+    Update every indicator's running state in one pass over the bars (compiled with Numba when available).
+
+    The windows match compute_indicators' defaults: moving averages over 20, 50 and 200 bars,
+    14-bar Wilder RSI, ATR as the simple mean of the last 14 true ranges (like calculate_atr),
+    MACD 12/26/9 and 20-bar Bollinger Bands at 2 standard deviations. Window averages only
+    accumulate bars inside the last window, so the results match the individual helpers.
+
+    Args:
+        closes (np.ndarray): Closing prices
+        highs (np.ndarray): High prices, one per close
+        lows (np.ndarray): Low prices, one per close
+        volumes (np.ndarray): Trading volumes, one per close
+
+    Returns:
+        tuple: The values in TechnicalIndicators order, NaN where there isn't enough history
+    """
+    n = closes.shape[0]
+    nan = np.nan
+    fast_multiplier = 2 / (12 + 1)
+    slow_multiplier = 2 / (26 + 1)
+    signal_multiplier = 2 / (9 + 1)
+
+    ma_20_sum = ma_50_sum = ma_200_sum = 0.0
+    avg_gain = avg_loss = 0.0
+    true_range_sum = 0.0
+    obv = volumes[0] if n > 1 else nan
+    # Kahan compensation for the OBV running sum, so long histories don't drift
+    obv_compensation = 0.0
+    # Welford's running mean and squared deviations over the Bollinger window
+    bollinger_count = 0
+    bollinger_mean = bollinger_m2 = 0.0
+    fast_ema = slow_ema = signal_line = macd_line = 0.0
+
+    for i in range(n):
+        price = closes[i]
+
+        if i >= n - 20:
+            ma_20_sum += price
+            bollinger_count += 1
+            delta_mean = price - bollinger_mean
+            bollinger_mean += delta_mean / bollinger_count
+            bollinger_m2 += delta_mean * (price - bollinger_mean)
+        if i >= n - 50:
+            ma_50_sum += price
+        if i >= n - 200:
+            ma_200_sum += price
+
+        # EMAs are seeded with the simple average of their first window
+        if i < 12:
+            fast_ema += price / 12
+        else:
+            fast_ema = (price - fast_ema) * fast_multiplier + fast_ema
+        if i < 26:
+            slow_ema += price / 26
+        else:
+            slow_ema = (price - slow_ema) * slow_multiplier + slow_ema
+
+        # The MACD line starts once the slow EMA has its seed; the signal line is its EMA
+        if i >= 25:
+            macd_line = fast_ema - slow_ema
+            if i < 25 + 9:
+                signal_line += macd_line / 9
+            else:
+                signal_line = (macd_line - signal_line) * signal_multiplier + signal_line
+
+        if i >= 1:
+            change = price - closes[i - 1]
+            if change != 0:
+                signed_volume = volumes[i] if change > 0 else -volumes[i]
+                corrected = signed_volume - obv_compensation
+                total = obv + corrected
+                obv_compensation = (total - obv) - corrected
+                obv = total
+
+            # Wilder's RSI: a simple average over the first 14 changes, then smoothing
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if i <= 14:
+                avg_gain += gain / 14
+                avg_loss += loss / 14
+            else:
+                avg_gain = (avg_gain * 13 + gain) / 14
+                avg_loss = (avg_loss * 13 + loss) / 14
+
+            if i >= n - 14:
+                high = highs[i]
+                low = lows[i]
+                previous = closes[i - 1]
+                true_range_sum += max(high - low, abs(high - previous), abs(low - previous))
+
+    ma_20 = ma_20_sum / 20 if n >= 20 else nan
+    ma_50 = ma_50_sum / 50 if n >= 50 else nan
+    ma_200 = ma_200_sum / 200 if n >= 200 else nan
+
+    rsi = _rsi_from_averages(avg_gain, avg_loss) if n >= 15 else nan
+
+    if n < 26 + 9:
+        macd = signal = histogram = nan
+    else:
+        macd = macd_line
+        signal = signal_line
+        histogram = macd_line - signal_line
+
+    if n < 20:
+        upper = middle = lower = nan
+    else:
+        std_dev = math.sqrt(bollinger_m2 / bollinger_count)
+        middle = bollinger_mean
+        upper = middle + 2 * std_dev
+        lower = middle - 2 * std_dev
+
+    atr = true_range_sum / 14 if n >= 15 else nan
+
+    return ma_20, ma_50, ma_200, rsi, macd, signal, histogram, upper, middle, lower, atr, obv
+
+def warm_up_kernels() -> bool:
+    """
+    Compile the Numba kernels ahead of the first indicator request.
+
+    Numba compiles a kernel on its first call, or loads it from the on-disk cache (cache=True)
+    after the first run, which takes from a fraction of a second to several seconds. Calling
+    this in the background at startup moves that cost off the first calculate_technical_indicators
+    call.
+
+    Returns:
+        bool: True if the kernels were compiled, False if Numba isn't installed
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+
+    # The argument types must match real calls (contiguous float64 arrays) for the
+    # compiled versions to be reused
+    prices = np.linspace(100.0, 110.0, 256)
+    compute_indicators(prices, prices + 1.0, prices - 1.0, np.full(256, 1000.0))
+    for window in COMMON_EMA_WINDOWS:
+        calculate_ema(prices, window)
+    calculate_macd(prices)
+    return True
@@ -12,16 +12,29 @@ It includes functions for:
 The module uses the yfinance package to access Yahoo Finance data reliably.
 """
 
+import asyncio
 import requests
 import json
-from typing import Dict, Any, List, Optional, Union, Tuple
+import inspect
+import math
+from typing import Dict, Any, List, NamedTuple, Optional, Union, Tuple
 from datetime import datetime, timedelta
 import re
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import pandas as pd
 import yfinance as yf
+from yfinance.data import YfData
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Import configuration for Alpha Vantage API
 from filingsResearch.config import Config
+from filingsResearch.http_session import get_http_session
+from filingsResearch.rate_limit import ALPHA_VANTAGE_LIMITER
+from filingsResearch.caching import cached, get_cache, is_error_response, loads_json, make_cache_key, MINUTE, HOUR, DAY
 
 # Yahoo Finance API Information:
 # 
@@ -33,16 +46,177 @@ from filingsResearch.config import Config
 #    - More reliable than direct Yahoo Finance API requests
 
 # Import helper functions for technical indicators
-from marketData.helper_functions import (
-    calculate_moving_average,
-    calculate_rsi,
-    calculate_macd,
-    calculate_ema,
-    calculate_bollinger_bands,
-    calculate_atr,
-    calculate_obv
+from marketData.helper_functions import compute_indicators
+
+# Format of the "timestamp" field in tool results
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# The current second and its formatted timestamp, reused by _now_str within that second
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+def _now_str() -> str:
+    """
+    Get the current local time formatted with TIMESTAMP_FORMAT.
+
+    The string is only formatted once per second, so pricing many tickers in a batch
+    doesn't format the same timestamp over and over.
+
+    Returns:
+        str: The current time, e.g. "2024-05-01 14:30:00"
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, timestamp = _timestamp_cache
+    if second != cached_second:
+        timestamp = datetime.fromtimestamp(second).strftime(TIMESTAMP_FORMAT)
+        _timestamp_cache = (second, timestamp)
+    return timestamp
+
+# How long a ticker's quote information is reused before Yahoo is asked again, in seconds
+INFO_TTL = 60
+
+# yf.Ticker objects by symbol, kept for the life of the process (they hold yfinance's own
+# per-ticker state, such as the resolved time zone), and recent `info` dicts with the time
+# they were fetched
+_ticker_cache: Dict[str, yf.Ticker] = {}
+_info_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+_yahoo_cache_lock = threading.Lock()
+
+def get_cached_ticker(ticker: str) -> yf.Ticker:
+    """
+    Get the yfinance Ticker for a symbol, reusing the one created by an earlier call.
+
+    Args:
+        ticker (str): The stock ticker symbol (e.g., "AAPL")
+
+    Returns:
+        yf.Ticker: The ticker
+    """
+    with _yahoo_cache_lock:
+        stock = _ticker_cache.get(ticker)
+        if stock is None:
+            stock = _ticker_cache[ticker] = yf.Ticker(ticker)
+        return stock
+
+def get_cached_info(ticker: str) -> Dict[str, Any]:
+    """
+    Get a ticker's yfinance `info` dictionary, reusing one fetched in the last INFO_TTL seconds.
+
+    Args:
+        ticker (str): The stock ticker symbol (e.g., "AAPL")
+
+    Returns:
+        dict: The ticker's quote and profile information
+    """
+    with _yahoo_cache_lock:
+        entry = _info_cache.get(ticker)
+    if entry is not None and time.monotonic() - entry[1] < INFO_TTL:
+        return entry[0]
+
+    # Fetched outside the lock, so lookups for other tickers aren't held up by the request
+    info = get_cached_ticker(ticker).info
+    with _yahoo_cache_lock:
+        _info_cache[ticker] = (info, time.monotonic())
+    return info
+
+# Market cap scales by power of 1,000 above a million: million, billion, trillion
+MARKET_CAP_SCALES = ((1_000_000, "M"), (1_000_000_000, "B"), (1_000_000_000_000, "T"))
+
+# Company profile fields given as fractions, shown as percentages
+RATIO_FIELDS = (
+    "dividend_yield",
+    "profit_margins",
+    "return_on_equity",
+    "return_on_assets",
+    "revenue_growth",
+    "earnings_growth",
+    "held_percent_insiders",
+    "held_percent_institutions",
+    "short_percent_of_float",
 )
 
+def _format_market_cap(market_cap: float) -> str:
+    """
+    Format a market cap for display, e.g. "$2.95T" or "$812.40M".
+
+    Args:
+        market_cap (float): The market cap in dollars
+
+    Returns:
+        str: The formatted market cap
+    """
+    if market_cap < MARKET_CAP_SCALES[0][0]:
+        return f"${market_cap:,.2f}"
+
+    # The scale comes from the number of digits; log10 can round up just below a power of
+    # 1,000, which the comparison corrects
+    index = min(len(MARKET_CAP_SCALES) - 1, int(math.log10(market_cap)) // 3 - 2)
+    if market_cap < MARKET_CAP_SCALES[index][0]:
+        index -= 1
+    scale, suffix = MARKET_CAP_SCALES[index]
+    return f"${market_cap / scale:.2f}{suffix}"
+
+def _format_percent(fraction: float) -> str:
+    """
+    Format a fraction as a percentage, e.g. 0.2531 as "25.31%".
+
+    Args:
+        fraction (float): The value as a fraction
+
+    Returns:
+        str: The formatted percentage
+    """
+    return f"{fraction * 100:.2f}%"
+
+class StockPrice(NamedTuple):
+    """
+    A ticker's current price and basic quote information.
+    """
+    ticker: str
+    price: Optional[float]
+    change: Optional[float]
+    previous_close: Optional[float]
+    open: Optional[float]
+    day_high: Optional[float]
+    day_low: Optional[float]
+    volume: Optional[int]
+    market_cap: Optional[float]
+    pe_ratio: Optional[float]
+    dividend_yield: Optional[float]
+    timestamp: str
+    source: str = "yfinance"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert to get_stock_price's result dictionary, adding the formatted values.
+
+        Returns:
+            dict: The fields, plus market_cap_formatted, change_formatted and price_formatted
+                  where the values are available
+        """
+        result = self._asdict()
+
+        # Format the market cap for better readability
+        if self.market_cap:
+            result["market_cap_formatted"] = _format_market_cap(self.market_cap)
+
+        # Format the change percentage
+        if self.change is not None:
+            result["change_formatted"] = f"{self.change:.2f}%"
+
+        # Format the price
+        if self.price is not None:
+            result["price_formatted"] = f"${self.price:.2f}"
+
+        return result
+
+# Yahoo Finance quote endpoint, which accepts a comma-separated list of symbols
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+# How long a ticker's price is cached, in seconds
+STOCK_PRICE_TTL = 15 * MINUTE
+
+@cached(ttl=STOCK_PRICE_TTL)
 def get_stock_price(ticker: str) -> Dict[str, Any]:
     """
     Get the current stock price and basic information for a given ticker symbol.
@@ -68,80 +242,146 @@ def get_stock_price(ticker: str) -> Dict[str, Any]:
     Returns:
         dict: A dictionary containing current stock price information
     """
-    # Ensure ticker is properly formatted
-    ticker = ticker.strip().upper()
+    return _fetch_stock_prices([ticker])[0]
+
+# get_stock_price's signature, for building its cache keys
+_STOCK_PRICE_SIGNATURE = inspect.signature(get_stock_price)
+
+def get_stock_prices(tickers: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get the current stock price and basic information for several ticker symbols at once.
+
+    Tickers that get_stock_price has answered recently are taken from its cache; the rest are
+    priced with a single Yahoo Finance quote request instead of one request per ticker. Each
+    result is stored as get_stock_price's cached result, so later get_stock_price calls for
+    these tickers don't make another request.
+
+    Args:
+        tickers (list): The stock ticker symbols (e.g., ["AAPL", "MSFT"])
+
+    Returns:
+        list: One dictionary per ticker, in the same order, in get_stock_price's format
+    """
+    cache = get_cache()
+    keys = [make_cache_key(_STOCK_PRICE_SIGNATURE, (ticker,), {}) for ticker in tickers]
+    results = [cache.get("get_stock_price", key) for key in keys]
+    missing = [i for i, (hit, _) in enumerate(results) if not hit]
+
+    fetched = _fetch_stock_prices([tickers[i] for i in missing]) if missing else []
+    for i, result in zip(missing, fetched):
+        results[i] = (True, result)
+        if not is_error_response(result):
+            cache.set("get_stock_price", keys[i], result, STOCK_PRICE_TTL)
+    return [result for _, result in results]
+
+def _fetch_stock_prices(tickers: List[str]) -> List[Dict[str, Any]]:
+    """
+    Retrieve current stock prices with one Yahoo Finance quote request; see get_stock_price.
+
+    Tickers missing from the batch response (or all of them, if the request fails) are
+    looked up one at a time through yfinance's `info`.
+
+    Args:
+        tickers (list): The stock ticker symbols
+
+    Returns:
+        list: One dictionary per ticker, in the same order
+    """
+    # Ensure tickers are properly formatted
+    tickers = [ticker.strip().upper() for ticker in tickers]
 
     try:
         # Print debugging information
-        print(f"Requesting stock price for {ticker} using yfinance")
+        print(f"Requesting stock prices for {', '.join(tickers)} using yfinance")
 
-        # Get the ticker information using yfinance
-        stock = yf.Ticker(ticker)
-
-        # Get the ticker information
-        info = stock.info
-
-        # Get the current price (last price)
-        if 'regularMarketPrice' in info and info['regularMarketPrice'] is not None:
-            current_price = info['regularMarketPrice']
-        elif 'currentPrice' in info and info['currentPrice'] is not None:
-            current_price = info['currentPrice']
-        elif 'previousClose' in info and info['previousClose'] is not None:
-            current_price = info['previousClose']  # Fallback to previous close if current price is not available
-        else:
-            current_price = None
-
-        # Get the previous close
-        previous_close = info.get('regularMarketPreviousClose', info.get('previousClose', None))
-
-        # Calculate the change percentage
-        if current_price is not None and previous_close is not None and previous_close != 0:
-            change_percent = ((current_price - previous_close) / previous_close) * 100
-        else:
-            change_percent = None
-
-        # Create a dictionary with the relevant information
-        result = {
-            "ticker": ticker,
-            "price": current_price,
-            "change": change_percent,
-            "previous_close": previous_close,
-            "open": info.get('regularMarketOpen', info.get('open', None)),
-            "day_high": info.get('regularMarketDayHigh', info.get('dayHigh', None)),
-            "day_low": info.get('regularMarketDayLow', info.get('dayLow', None)),
-            "volume": info.get('regularMarketVolume', info.get('volume', None)),
-            "market_cap": info.get('marketCap', None),
-            "pe_ratio": info.get('trailingPE', None),
-            "dividend_yield": info.get('dividendYield', None),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "source": "yfinance"
-        }
+        # yfinance's data client adds the cookie and crumb Yahoo requires
+        response = YfData().get_raw_json(YAHOO_QUOTE_URL, params={"symbols": ",".join(tickers), "formatted": "false"})
+        quotes = {quote.get("symbol"): quote for quote in response["quoteResponse"]["result"]}
+    except Exception as e:
+        print(f"Batch quote request failed, requesting each ticker: {str(e)}")
+        quotes = {}
+
+    results = []
+    for ticker in tickers:
+        try:
+            results.append(_price_from_quote(ticker, quotes.get(ticker) or get_cached_info(ticker)).as_dict())
+            print(f"Successfully retrieved stock price for {ticker} using yfinance")
+        except Exception as e:
+            print(f"yfinance failed to retrieve stock price: {str(e)}")
+            results.append({"error": f"Failed to retrieve stock price: {str(e)}"})
+    return results
+
+def _price_from_quote(ticker: str, info: Dict[str, Any]) -> StockPrice:
+    """
+    Read a ticker's price information from a Yahoo quote or yfinance `info` dictionary.
 
-        # Format the market cap for better readability
-        if result["market_cap"]:
-            if result["market_cap"] >= 1_000_000_000_000:  # Trillion
-                result["market_cap_formatted"] = f"${result['market_cap'] / 1_000_000_000_000:.2f}T"
-            elif result["market_cap"] >= 1_000_000_000:  # Billion
-                result["market_cap_formatted"] = f"${result['market_cap'] / 1_000_000_000:.2f}B"
-            elif result["market_cap"] >= 1_000_000:  # Million
-                result["market_cap_formatted"] = f"${result['market_cap'] / 1_000_000:.2f}M"
-            else:
-                result["market_cap_formatted"] = f"${result['market_cap']:,.2f}"
+    Args:
+        ticker (str): The stock ticker symbol
+        info (dict): The quote fields (regularMarketPrice, marketCap, ...)
 
-        # Format the change percentage
-        if result["change"] is not None:
-            result["change_formatted"] = f"{result['change']:.2f}%"
+    Returns:
+        StockPrice: The stock price information
+    """
+    # Get the current price (last price)
+    if 'regularMarketPrice' in info and info['regularMarketPrice'] is not None:
+        current_price = info['regularMarketPrice']
+    elif 'currentPrice' in info and info['currentPrice'] is not None:
+        current_price = info['currentPrice']
+    elif 'previousClose' in info and info['previousClose'] is not None:
+        current_price = info['previousClose']  # Fallback to previous close if current price is not available
+    else:
+        current_price = None
 
-        # Format the price
-        if result["price"] is not None:
-            result["price_formatted"] = f"${result['price']:.2f}"
+    # Get the previous close
+    previous_close = info.get('regularMarketPreviousClose', info.get('previousClose', None))
 
-        print(f"Successfully retrieved stock price for {ticker} using yfinance")
-        return result
+    # Calculate the change percentage
+    if current_price is not None and previous_close is not None and previous_close != 0:
+        change_percent = ((current_price - previous_close) / previous_close) * 100
+    else:
+        change_percent = None
+
+    return StockPrice(
+        ticker=ticker,
+        price=current_price,
+        change=change_percent,
+        previous_close=previous_close,
+        open=info.get('regularMarketOpen', info.get('open', None)),
+        day_high=info.get('regularMarketDayHigh', info.get('dayHigh', None)),
+        day_low=info.get('regularMarketDayLow', info.get('dayLow', None)),
+        volume=info.get('regularMarketVolume', info.get('volume', None)),
+        market_cap=info.get('marketCap', None),
+        pe_ratio=info.get('trailingPE', None),
+        dividend_yield=info.get('dividendYield', None),
+        timestamp=_now_str(),
+    )
+
+# Decimal places kept for prices in historical data
+PRICE_DECIMALS = 4
+
+# Daily histories longer than this (about one trading year) are downsampled to weekly bars
+MAX_DAILY_POINTS = 260
+
+# Columns of a yfinance price history, in the order they are read into arrays
+BAR_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# How each column is combined when daily bars are downsampled to weekly bars
+WEEKLY_AGGREGATION = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
+def _to_list(values: np.ndarray) -> list:
+    """
+    Convert an array to a list of plain Python values, with None for missing (NaN) values.
 
-    except Exception as e:
-        print(f"yfinance failed to retrieve stock price: {str(e)}")
-        return {"error": f"Failed to retrieve stock price: {str(e)}"}
+    Args:
+        values (np.ndarray): The values
+
+    Returns:
+        list: The values as floats (or ints), None where they were NaN
+    """
+    missing = np.isnan(values)
+    if not missing.any():
+        return values.tolist()
+    return np.where(missing, None, values.astype(object)).tolist()
 
 def get_historical_data(ticker: str, period: str = "1y", interval: str = "1d") -> Dict[str, Any]:
     """
@@ -159,6 +399,8 @@ def get_historical_data(ticker: str, period: str = "1y", interval: str = "1d") -
     Valid interval values: "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"
 
     Note: Intraday data (intervals less than 1d) is only available for periods less than or equal to 60 days.
+    Daily data covering more than MAX_DAILY_POINTS trading days (about a year) is returned as
+    weekly bars, and the result's interval is reported as "1wk".
 
     EXAMPLE:
     ```
@@ -176,122 +418,309 @@ def get_historical_data(ticker: str, period: str = "1y", interval: str = "1d") -
     Returns:
         dict: A dictionary containing historical stock price data
     """
-    # Ensure ticker is properly formatted
-    ticker = ticker.strip().upper()
+    return _get_historical_data(ticker, period, interval, downsample=True)
 
-    # Validate period and interval
-    valid_periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
-    valid_intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+# Periods and intervals accepted by yfinance, in the order they are listed in error messages
+VALID_PERIODS = ("1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
+VALID_INTERVALS = ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo")
 
-    if period not in valid_periods:
-        return {"error": f"Invalid period: {period}. Valid periods are: {', '.join(valid_periods)}"}
+# Intraday intervals, which yfinance only serves for the last 60 days, and the periods beyond that
+INTRADAY_INTERVALS = frozenset({"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"})
+LONG_PERIODS = frozenset({"1y", "2y", "5y", "10y", "max"})
 
-    if interval not in valid_intervals:
-        return {"error": f"Invalid interval: {interval}. Valid intervals are: {', '.join(valid_intervals)}"}
+_VALID_PERIOD_SET = frozenset(VALID_PERIODS)
+_VALID_INTERVAL_SET = frozenset(VALID_INTERVALS)
 
-    # Check if intraday data is requested for a period longer than 60 days
-    intraday_intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"]
-    long_periods = ["1y", "2y", "5y", "10y", "max"]
+def _format_dates(index: pd.DatetimeIndex) -> List[str]:
+    """
+    Format a history's timestamps as "YYYY-MM-DD" strings, in the exchange's local time.
+
+    NumPy formats the whole array in C; DatetimeIndex.strftime formats one timestamp at a
+    time and is about 30 times slower on long histories.
 
-    if interval in intraday_intervals and period in long_periods:
+    Args:
+        index (pd.DatetimeIndex): The timestamps
+
+    Returns:
+        list: The dates
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.datetime_as_string(index.to_numpy(), unit="D").tolist()
+
+def _validate_history_request(period: str, interval: str) -> Optional[Dict[str, str]]:
+    """
+    Check a historical data request's period and interval.
+
+    Args:
+        period (str): The time period to retrieve data for
+        interval (str): The interval between data points
+
+    Returns:
+        dict or None: A dictionary with an error message, or None if the request is valid
+    """
+    if period not in _VALID_PERIOD_SET:
+        return {"error": f"Invalid period: {period}. Valid periods are: {', '.join(VALID_PERIODS)}"}
+
+    if interval not in _VALID_INTERVAL_SET:
+        return {"error": f"Invalid interval: {interval}. Valid intervals are: {', '.join(VALID_INTERVALS)}"}
+
+    # Check if intraday data is requested for a period longer than 60 days
+    if interval in INTRADAY_INTERVALS and period in LONG_PERIODS:
         return {"error": "Intraday data (intervals less than 1d) is only available for periods less than or equal to 60 days."}
 
+    return None
+
+def _history_ttl(ticker: str, period: str = "1y", interval: str = "1d") -> float:
+    """
+    Get how long a price history stays cached: a minute for intraday bars, which change
+    continuously while the market is open, and an hour for daily and longer bars.
+
+    Args:
+        ticker (str): The stock ticker symbol
+        period (str, optional): The time period of the history. Default is "1y".
+        interval (str, optional): The interval between data points. Default is "1d".
+
+    Returns:
+        float: The TTL in seconds
+    """
+    return 1 * MINUTE if interval in INTRADAY_INTERVALS else 1 * HOUR
+
+@cached(ttl=_history_ttl, namespace="history_bars")
+def _get_history_bars(ticker: str, period: str = "1y", interval: str = "1d") -> Dict[str, Any]:
+    """
+    Retrieve a price history from yfinance as one list per field; see get_historical_data.
+
+    The period and interval are checked by the caller (_validate_history_request).
+
+    Args:
+        ticker (str): The stock ticker symbol
+        period (str, optional): The time period to retrieve data for. Default is "1y".
+        interval (str, optional): The interval between data points. Default is "1d".
+
+    Returns:
+        dict: The bars' "dates" and one list per BAR_COLUMNS field ("open", "high", "low",
+              "close", "volume"; prices rounded to PRICE_DECIMALS places, None where missing)
+    """
+    # Ensure ticker is properly formatted
+    ticker = ticker.strip().upper()
+
     try:
         # Print debugging information
         print(f"Requesting historical data for {ticker} using yfinance with period={period} and interval={interval}")
 
         # Get the ticker information using yfinance
-        stock = yf.Ticker(ticker)
+        stock = get_cached_ticker(ticker)
 
         # Get historical data
         hist_data = stock.history(period=period, interval=interval)
 
+        # Drop incomplete bars so every data point has numeric prices and volume
+        hist_data = hist_data.dropna(subset=[column for column in ('Open', 'High', 'Low', 'Close', 'Volume') if column in hist_data.columns])
+
         # Check if we have valid data
         if hist_data.empty:
             return {"error": f"No historical data found for ticker symbol: {ticker}"}
 
-        # Create a list of data points
-        data_points = []
-        for index, row in hist_data.iterrows():
-            # Convert timestamp to date string
-            date_str = index.strftime("%Y-%m-%d")
-
-            # Add the data point
-            data_points.append({
-                "date": date_str,
-                "open": row.get('Open', None),
-                "high": row.get('High', None),
-                "low": row.get('Low', None),
-                "close": row.get('Close', None),
-                "volume": row.get('Volume', None)
-            })
-
-        # Calculate some basic statistics
-        if data_points:
-            latest_close = data_points[-1]["close"]
-            earliest_close = data_points[0]["close"]
-            price_change = latest_close - earliest_close
-            percent_change = (price_change / earliest_close) * 100 if earliest_close != 0 else 0
-
-            # Find the highest and lowest prices in the period
-            highest_price = max(point["high"] for point in data_points)
-            lowest_price = min(point["low"] for point in data_points)
-
-            # Calculate average volume
-            average_volume = sum(point["volume"] for point in data_points) / len(data_points)
-
-            # Calculate volatility (standard deviation of daily returns)
-            if len(data_points) > 1:
-                daily_returns = [(data_points[i]["close"] / data_points[i-1]["close"]) - 1 for i in range(1, len(data_points))]
-                mean_return = sum(daily_returns) / len(daily_returns)
-                variance = sum((r - mean_return) ** 2 for r in daily_returns) / len(daily_returns)
-                volatility = (variance ** 0.5) * 100  # Convert to percentage
-            else:
-                volatility = 0
-        else:
-            latest_close = None
-            earliest_close = None
-            price_change = None
-            percent_change = None
-            highest_price = None
-            lowest_price = None
-            average_volume = None
-            volatility = None
-
-        # Create the result dictionary
-        result = {
-            "ticker": ticker,
-            "period": period,
-            "interval": interval,
-            "data_points": len(data_points),
-            "start_date": data_points[0]["date"] if data_points else None,
-            "end_date": data_points[-1]["date"] if data_points else None,
-            "latest_close": latest_close,
-            "earliest_close": earliest_close,
-            "price_change": price_change,
-            "percent_change": percent_change,
-            "highest_price": highest_price,
-            "lowest_price": lowest_price,
-            "average_volume": average_volume,
-            "volatility": volatility,
-            "data": data_points
-        }
-
-        # Format the percent change
-        if result["percent_change"] is not None:
-            result["percent_change_formatted"] = f"{result['percent_change']:.2f}%"
-
-        # Format the volatility
-        if result["volatility"] is not None:
-            result["volatility_formatted"] = f"{result['volatility']:.2f}%"
+        # Read the bars into one array (a missing column is all NaN), with prices rounded
+        # to keep the payload compact
+        bars = hist_data.reindex(columns=BAR_COLUMNS).to_numpy(dtype=np.float64, copy=True)
+        bars[:, :4] = np.round(bars[:, :4], PRICE_DECIMALS)
 
         print(f"Successfully retrieved historical data for {ticker} using yfinance")
-        return result
+        return {
+            "dates": _format_dates(hist_data.index),
+            **{column.lower(): _to_list(bars[:, i]) for i, column in enumerate(BAR_COLUMNS)},
+        }
 
     except Exception as e:
         print(f"yfinance failed to retrieve historical data: {str(e)}")
         return {"error": f"Failed to retrieve historical data: {str(e)}"}
 
+# History requests being fetched right now, so concurrent callers can wait for the same result
+_history_in_flight: Dict[Tuple[str, str, str], Future] = {}
+_history_in_flight_lock = threading.Lock()
+
+def _get_history_bars_once(ticker: str, period: str, interval: str) -> Dict[str, Any]:
+    """
+    Get a price history through _get_history_bars, sharing one fetch between concurrent callers.
+
+    Tools that need the same history are often called at the same time (e.g. the history and
+    the technical indicators for one ticker); without this, each would miss the cache and
+    request it from Yahoo. The first caller fetches it and the others wait for its result.
+
+    Args:
+        ticker (str): The stock ticker symbol
+        period (str): The time period to retrieve data for
+        interval (str): The interval between data points
+
+    Returns:
+        dict: The history, as returned by _get_history_bars
+    """
+    key = (ticker.strip().upper(), period, interval)
+    with _history_in_flight_lock:
+        future = _history_in_flight.get(key)
+        fetching = future is None
+        if fetching:
+            future = _history_in_flight[key] = Future()
+
+    if not fetching:
+        return future.result()
+
+    try:
+        history = _get_history_bars(ticker, period, interval)
+        future.set_result(history)
+        return history
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _history_in_flight_lock:
+            del _history_in_flight[key]
+
+def _weekly_bars(bars: np.ndarray, dates: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Aggregate daily bars into weekly bars (weeks ending on Sunday).
+
+    Args:
+        bars (np.ndarray): The daily bars, one row per BAR_COLUMNS field
+        dates (list): The bars' dates
+
+    Returns:
+        tuple: (weekly bars in the same layout, the weeks' end dates)
+    """
+    daily = pd.DataFrame(bars.T, index=pd.DatetimeIndex(dates), columns=BAR_COLUMNS)
+    weekly = daily.resample("W").agg(WEEKLY_AGGREGATION).dropna(subset=["Close"])
+    return np.ascontiguousarray(weekly.to_numpy(dtype=np.float64).T), _format_dates(weekly.index)
+
+def _fetch_history_arrays(ticker: str, period: str = "1y",
+                          interval: str = "1d") -> Union[Tuple[np.ndarray, List[str]], Dict[str, Any]]:
+    """
+    Get a price history as a NumPy array, for calculations that don't need the data points.
+
+    Histories are fetched and cached once per ticker, period and interval, so
+    get_historical_data and calculate_technical_indicators share one request.
+
+    Args:
+        ticker (str): The stock ticker symbol
+        period (str, optional): The time period to retrieve data for. Default is "1y".
+        interval (str, optional): The interval between data points. Default is "1d".
+
+    Returns:
+        tuple or dict: (bars, dates), where bars is a float64 array with one contiguous row
+                       per BAR_COLUMNS field (open, high, low, close, volume; NaN where
+                       missing), or a dictionary with an error message
+    """
+    # Reject invalid requests before looking in the cache
+    error = _validate_history_request(period, interval)
+    if error:
+        return error
+
+    history = _get_history_bars_once(ticker, period, interval)
+    if "error" in history:
+        return history
+
+    bars = np.array([history[column.lower()] for column in BAR_COLUMNS], dtype=np.float64)
+    return bars, history["dates"]
+
+def _get_historical_data(ticker: str, period: str = "1y", interval: str = "1d", downsample: bool = False) -> Dict[str, Any]:
+    """
+    Retrieve historical stock price data; see get_historical_data.
+
+    Args:
+        ticker (str): The stock ticker symbol
+        period (str, optional): The time period to retrieve data for. Default is "1y".
+        interval (str, optional): The interval between data points. Default is "1d".
+        downsample (bool, optional): Return long daily histories as weekly bars. Default is False.
+
+    Returns:
+        dict: A dictionary containing historical stock price data
+    """
+    history = _fetch_history_arrays(ticker, period, interval)
+    if isinstance(history, dict):
+        return history
+    bars, dates = history
+    _, highs, lows, closes, volumes = bars
+
+    # Calculate some basic statistics from the bars as retrieved, before any downsampling
+    latest_close = float(closes[-1])
+    earliest_close = float(closes[0])
+    price_change = latest_close - earliest_close
+    percent_change = (price_change / earliest_close) * 100 if earliest_close != 0 else 0
+
+    # Find the highest and lowest prices in the period
+    highest_price = float(highs.max())
+    lowest_price = float(lows.min())
+
+    # Calculate average volume
+    average_volume = float(volumes.mean())
+
+    # Calculate volatility (standard deviation of daily returns)
+    if closes.size > 1:
+        daily_returns = closes[1:] / closes[:-1] - 1
+        volatility = float(daily_returns.std()) * 100  # Convert to percentage
+    else:
+        volatility = 0
+
+    # Send long daily histories as weekly bars to keep the payload small
+    if downsample and interval == "1d" and len(dates) > MAX_DAILY_POINTS:
+        bars, dates = _weekly_bars(bars, dates)
+        interval = "1wk"
+    opens, highs, lows, closes, volumes = bars
+
+    # Create a list of data points. Volumes are whole shares, converted in one call unless
+    # some are missing (NaN), which become None
+    if np.isnan(volumes).any():
+        volume_values = [int(volume) if volume == volume else None for volume in volumes.tolist()]
+    else:
+        volume_values = volumes.astype(np.int64).tolist()
+    data_points = [
+        {"date": date, "open": open_, "high": high, "low": low, "close": close, "volume": volume}
+        for date, open_, high, low, close, volume in zip(
+            dates, _to_list(opens), _to_list(highs), _to_list(lows), _to_list(closes), volume_values
+        )
+    ]
+
+    # Create the result dictionary
+    result = {
+        "ticker": ticker.strip().upper(),
+        "period": period,
+        "interval": interval,
+        "data_points": len(data_points),
+        "start_date": data_points[0]["date"] if data_points else None,
+        "end_date": data_points[-1]["date"] if data_points else None,
+        "latest_close": latest_close,
+        "earliest_close": earliest_close,
+        "price_change": price_change,
+        "percent_change": percent_change,
+        "highest_price": highest_price,
+        "lowest_price": lowest_price,
+        "average_volume": average_volume,
+        "volatility": volatility,
+        "data": data_points
+    }
+
+    # Format the percent change
+    if result["percent_change"] is not None:
+        result["percent_change_formatted"] = f"{result['percent_change']:.2f}%"
+
+    # Format the volatility
+    if result["volatility"] is not None:
+        result["volatility_formatted"] = f"{result['volatility']:.2f}%"
+
+    return result
+
+# Descriptions of the technical signal scores (+1 bullish, -1 bearish, 0 neutral)
+TREND_LABELS = {1: "Bullish", -1: "Bearish"}
+OSCILLATOR_LABELS = {1: "Oversold (Bullish)", -1: "Overbought (Bearish)", 0: "Neutral"}
+SIGNAL_LABELS = {
+    "ma_20_above_ma_50": {1: "Bullish (Golden Cross)", -1: "Bearish (Death Cross)"},
+    "rsi": OSCILLATOR_LABELS,
+    "bollinger_bands": OSCILLATOR_LABELS,
+}
+
+# Indicators are computed from daily bars, so they are kept as long as the bars
+@cached(ttl=1 * HOUR)
 def calculate_technical_indicators(ticker: str, period: str = "1y") -> Dict[str, Any]:
     """
     Calculate technical indicators for a given ticker symbol.
@@ -321,120 +750,102 @@ def calculate_technical_indicators(ticker: str, period: str = "1y") -> Dict[str,
         dict: A dictionary containing calculated technical indicators
     """
     # Get historical data for the ticker
-    historical_data = get_historical_data(ticker, period, "1d")
+    history = _fetch_history_arrays(ticker, period, "1d")
 
     # Check if there was an error retrieving the historical data
-    if "error" in historical_data:
-        return historical_data
-
-    # Check if we have enough data points
-    if len(historical_data["data"]) < 50:
-        return {"error": f"Not enough historical data points to calculate indicators. Found {len(historical_data['data'])}, need at least 50."}
-
-    # Extract closing prices
-    closes = [point["close"] for point in historical_data["data"]]
+    if isinstance(history, dict):
+        return history
 
-    # Calculate moving averages
-    ma_20 = calculate_moving_average(closes, 20)
-    ma_50 = calculate_moving_average(closes, 50)
-    ma_200 = calculate_moving_average(closes, 200) if len(closes) >= 200 else None
+    # The price and volume series are contiguous float64 rows shared by every indicator
+    # (missing values are NaN)
+    _, highs, lows, closes, volumes = history[0]
 
-    # Calculate RSI (Relative Strength Index)
-    rsi = calculate_rsi(closes, 14)
-
-    # Calculate MACD (Moving Average Convergence Divergence)
-    macd, signal, histogram = calculate_macd(closes)
-
-    # Calculate Bollinger Bands
-    upper_band, middle_band, lower_band = calculate_bollinger_bands(closes, 20, 2)
-
-    # Calculate Average True Range (ATR)
-    highs = [point["high"] for point in historical_data["data"]]
-    lows = [point["low"] for point in historical_data["data"]]
-    atr = calculate_atr(closes, highs, lows, 14)
+    # Check if we have enough data points
+    if closes.size < 50:
+        return {"error": f"Not enough historical data points to calculate indicators. Found {closes.size}, need at least 50."}
 
-    # Calculate On-Balance Volume (OBV)
-    volumes = [point["volume"] for point in historical_data["data"]]
-    obv = calculate_obv(closes, volumes)
+    # Calculate moving averages, RSI, MACD, Bollinger Bands, ATR and OBV together
+    indicators = compute_indicators(closes, highs, lows, volumes)
+    ma_20, ma_50 = indicators.ma_20, indicators.ma_50
+    rsi = indicators.rsi
+    macd, signal = indicators.macd, indicators.macd_signal
+    upper_band, lower_band = indicators.bollinger_upper, indicators.bollinger_lower
 
     # Create the result dictionary
     result = {
         "ticker": ticker,
         "period": period,
-        "latest_price": closes[-1] if closes else None,
-        "ma_20": ma_20,
-        "ma_50": ma_50,
-        "ma_200": ma_200,
-        "rsi": rsi,
-        "macd": macd,
-        "macd_signal": signal,
-        "macd_histogram": histogram,
-        "bollinger_upper": upper_band,
-        "bollinger_middle": middle_band,
-        "bollinger_lower": lower_band,
-        "atr": atr,
-        "obv": obv,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "latest_price": float(closes[-1]) if closes.size else None,
+        **indicators._asdict(),
+        "timestamp": _now_str()
     }
 
-    # Add technical signals
-    result["signals"] = {}
+    # Add technical signals, each scored +1 if bullish, -1 if bearish and 0 if neutral
+    latest_price = closes[-1]
+    signals = {}
 
     # Moving Average signals
     if ma_20 and ma_50:
-        if closes[-1] > ma_20:
-            result["signals"]["price_above_ma_20"] = "Bullish"
-        else:
-            result["signals"]["price_above_ma_20"] = "Bearish"
-
-        if closes[-1] > ma_50:
-            result["signals"]["price_above_ma_50"] = "Bullish"
-        else:
-            result["signals"]["price_above_ma_50"] = "Bearish"
-
-        if ma_20 > ma_50:
-            result["signals"]["ma_20_above_ma_50"] = "Bullish (Golden Cross)"
-        else:
-            result["signals"]["ma_20_above_ma_50"] = "Bearish (Death Cross)"
+        signals["price_above_ma_20"] = 1 if latest_price > ma_20 else -1
+        signals["price_above_ma_50"] = 1 if latest_price > ma_50 else -1
+        signals["ma_20_above_ma_50"] = 1 if ma_20 > ma_50 else -1
 
     # RSI signals
     if rsi:
-        if rsi > 70:
-            result["signals"]["rsi"] = "Overbought (Bearish)"
-        elif rsi < 30:
-            result["signals"]["rsi"] = "Oversold (Bullish)"
-        else:
-            result["signals"]["rsi"] = "Neutral"
+        signals["rsi"] = -1 if rsi > 70 else 1 if rsi < 30 else 0
 
     # MACD signals
     if macd and signal:
-        if macd > signal:
-            result["signals"]["macd"] = "Bullish"
-        else:
-            result["signals"]["macd"] = "Bearish"
+        signals["macd"] = 1 if macd > signal else -1
 
     # Bollinger Bands signals
     if upper_band and lower_band:
-        if closes[-1] > upper_band:
-            result["signals"]["bollinger_bands"] = "Overbought (Bearish)"
-        elif closes[-1] < lower_band:
-            result["signals"]["bollinger_bands"] = "Oversold (Bullish)"
-        else:
-            result["signals"]["bollinger_bands"] = "Neutral"
+        signals["bollinger_bands"] = -1 if latest_price > upper_band else 1 if latest_price < lower_band else 0
 
-    # Overall technical outlook
-    bullish_signals = sum(1 for signal in result["signals"].values() if "Bullish" in signal)
-    bearish_signals = sum(1 for signal in result["signals"].values() if "Bearish" in signal)
+    result["signals"] = {
+        name: SIGNAL_LABELS.get(name, TREND_LABELS)[score] for name, score in signals.items()
+    }
 
-    if bullish_signals > bearish_signals:
-        result["technical_outlook"] = "Bullish"
-    elif bearish_signals > bullish_signals:
-        result["technical_outlook"] = "Bearish"
-    else:
-        result["technical_outlook"] = "Neutral"
+    # Overall technical outlook
+    total_score = sum(signals.values())
+    result["technical_outlook"] = "Bullish" if total_score > 0 else "Bearish" if total_score < 0 else "Neutral"
 
     return result
 
+# quoteSummary modules read by get_company_info_from_yahoo. summaryProfile carries the sector,
+# industry, website and business summary without assetProfile's officer list, which made up
+# most of the payload but was never used.
+QUOTE_SUMMARY_MODULES = ("summaryProfile", "summaryDetail", "financialData", "defaultKeyStatistics")
+
+def _raw(module: Dict[str, Any], field: str) -> Any:
+    """
+    Get a field's raw value from a quoteSummary module, where values look like
+    {"raw": 0.25, "fmt": "25.00%"}.
+
+    Args:
+        module (dict): The quoteSummary module (e.g. summaryDetail)
+        field (str): The field name (e.g. "marketCap")
+
+    Returns:
+        The raw value, or None if the field is missing
+    """
+    value = module.get(field)
+    return value.get('raw') if isinstance(value, dict) else None
+
+# Headers that mimic a browser request, with additional headers to avoid 401 errors from Yahoo
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Only the encodings urllib3 can decode here: "br" is included when brotli is installed
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Referer': 'https://finance.yahoo.com',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+}
+
+@cached(ttl=1 * DAY)
 def get_company_info_from_yahoo(ticker: str) -> Dict[str, Any]:
     """
     Get detailed company information from Yahoo Finance.
@@ -464,31 +875,19 @@ def get_company_info_from_yahoo(ticker: str) -> Dict[str, Any]:
     # Ensure ticker is properly formatted
     ticker = ticker.strip().upper()
 
-    # Yahoo Finance API endpoint for company information
-    url = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{ticker}?modules=assetProfile,summaryProfile,summaryDetail,financialData,defaultKeyStatistics"
-
-    # Set headers to mimic a browser request with additional headers to avoid 401 errors
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Referer': 'https://finance.yahoo.com',
-        'Upgrade-Insecure-Requests': '1',
-        'Cache-Control': 'max-age=0'
-    }
+    # Yahoo Finance API endpoint for company information, limited to the modules read below
+    url = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{ticker}?modules={','.join(QUOTE_SUMMARY_MODULES)}"
 
     try:
         # Make the GET request
-        response = requests.get(url, headers=headers)
+        response = get_http_session().get(url, headers=YAHOO_HEADERS, timeout=30)
 
         # Check if the request was successful
         if response.status_code != 200:
             return {"error": f"Failed to retrieve company information. Status code: {response.status_code}"}
 
-        # Parse the JSON response
-        data = response.json()
+        # Parse the JSON response (with orjson when it is installed)
+        data = loads_json(response.content)
 
         # Check if the result contains valid data
         if not data or 'quoteSummary' not in data or 'result' not in data['quoteSummary'] or not data['quoteSummary']['result']:
@@ -498,90 +897,54 @@ def get_company_info_from_yahoo(ticker: str) -> Dict[str, Any]:
         company_data = data['quoteSummary']['result'][0]
 
         # Extract profile information
-        profile = company_data.get('assetProfile', {})
-        summary_profile = company_data.get('summaryProfile', {})
+        profile = company_data.get('summaryProfile', {})
         summary_detail = company_data.get('summaryDetail', {})
         financial_data = company_data.get('financialData', {})
         key_stats = company_data.get('defaultKeyStatistics', {})
 
-        # Combine profile data from both sources
-        combined_profile = {**profile, **summary_profile}
-
         # Create the result dictionary
         result = {
             "ticker": ticker,
-            "name": combined_profile.get('name', None),
-            "sector": combined_profile.get('sector', None),
-            "industry": combined_profile.get('industry', None),
-            "business_summary": combined_profile.get('longBusinessSummary', None),
-            "website": combined_profile.get('website', None),
-            "market_cap": summary_detail.get('marketCap', {}).get('raw', None),
-            "pe_ratio": summary_detail.get('trailingPE', {}).get('raw', None),
-            "forward_pe": summary_detail.get('forwardPE', {}).get('raw', None),
-            "dividend_yield": summary_detail.get('dividendYield', {}).get('raw', None),
-            "beta": summary_detail.get('beta', {}).get('raw', None),
-            "52_week_high": summary_detail.get('fiftyTwoWeekHigh', {}).get('raw', None),
-            "52_week_low": summary_detail.get('fiftyTwoWeekLow', {}).get('raw', None),
-            "50_day_average": summary_detail.get('fiftyDayAverage', {}).get('raw', None),
-            "200_day_average": summary_detail.get('twoHundredDayAverage', {}).get('raw', None),
-            "profit_margins": financial_data.get('profitMargins', {}).get('raw', None),
-            "return_on_equity": financial_data.get('returnOnEquity', {}).get('raw', None),
-            "return_on_assets": financial_data.get('returnOnAssets', {}).get('raw', None),
-            "revenue_growth": financial_data.get('revenueGrowth', {}).get('raw', None),
-            "earnings_growth": financial_data.get('earningsGrowth', {}).get('raw', None),
-            "current_ratio": financial_data.get('currentRatio', {}).get('raw', None),
-            "debt_to_equity": financial_data.get('debtToEquity', {}).get('raw', None),
-            "free_cash_flow": financial_data.get('freeCashflow', {}).get('raw', None),
-            "operating_cash_flow": financial_data.get('operatingCashflow', {}).get('raw', None),
-            "shares_outstanding": key_stats.get('sharesOutstanding', {}).get('raw', None),
-            "float_shares": key_stats.get('floatShares', {}).get('raw', None),
-            "held_percent_insiders": key_stats.get('heldPercentInsiders', {}).get('raw', None),
-            "held_percent_institutions": key_stats.get('heldPercentInstitutions', {}).get('raw', None),
-            "short_ratio": key_stats.get('shortRatio', {}).get('raw', None),
-            "short_percent_of_float": key_stats.get('shortPercentOfFloat', {}).get('raw', None),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "name": profile.get('name', None),
+            "sector": profile.get('sector', None),
+            "industry": profile.get('industry', None),
+            "business_summary": profile.get('longBusinessSummary', None),
+            "website": profile.get('website', None),
+            "market_cap": _raw(summary_detail, 'marketCap'),
+            "pe_ratio": _raw(summary_detail, 'trailingPE'),
+            "forward_pe": _raw(summary_detail, 'forwardPE'),
+            "dividend_yield": _raw(summary_detail, 'dividendYield'),
+            "beta": _raw(summary_detail, 'beta'),
+            "52_week_high": _raw(summary_detail, 'fiftyTwoWeekHigh'),
+            "52_week_low": _raw(summary_detail, 'fiftyTwoWeekLow'),
+            "50_day_average": _raw(summary_detail, 'fiftyDayAverage'),
+            "200_day_average": _raw(summary_detail, 'twoHundredDayAverage'),
+            "profit_margins": _raw(financial_data, 'profitMargins'),
+            "return_on_equity": _raw(financial_data, 'returnOnEquity'),
+            "return_on_assets": _raw(financial_data, 'returnOnAssets'),
+            "revenue_growth": _raw(financial_data, 'revenueGrowth'),
+            "earnings_growth": _raw(financial_data, 'earningsGrowth'),
+            "current_ratio": _raw(financial_data, 'currentRatio'),
+            "debt_to_equity": _raw(financial_data, 'debtToEquity'),
+            "free_cash_flow": _raw(financial_data, 'freeCashflow'),
+            "operating_cash_flow": _raw(financial_data, 'operatingCashflow'),
+            "shares_outstanding": _raw(key_stats, 'sharesOutstanding'),
+            "float_shares": _raw(key_stats, 'floatShares'),
+            "held_percent_insiders": _raw(key_stats, 'heldPercentInsiders'),
+            "held_percent_institutions": _raw(key_stats, 'heldPercentInstitutions'),
+            "short_ratio": _raw(key_stats, 'shortRatio'),
+            "short_percent_of_float": _raw(key_stats, 'shortPercentOfFloat'),
+            "timestamp": _now_str()
         }
 
         # Format the market cap for better readability
         if result["market_cap"]:
-            if result["market_cap"] >= 1_000_000_000_000:  # Trillion
-                result["market_cap_formatted"] = f"${result['market_cap'] / 1_000_000_000_000:.2f}T"
-            elif result["market_cap"] >= 1_000_000_000:  # Billion
-                result["market_cap_formatted"] = f"${result['market_cap'] / 1_000_000_000:.2f}B"
-            elif result["market_cap"] >= 1_000_000:  # Million
-                result["market_cap_formatted"] = f"${result['market_cap'] / 1_000_000:.2f}M"
-            else:
-                result["market_cap_formatted"] = f"${result['market_cap']:,.2f}"
-
-        # Format the dividend yield
-        if result["dividend_yield"] is not None:
-            result["dividend_yield_formatted"] = f"{result['dividend_yield'] * 100:.2f}%"
-
-        # Format the profit margins
-        if result["profit_margins"] is not None:
-            result["profit_margins_formatted"] = f"{result['profit_margins'] * 100:.2f}%"
-
-        # Format the ROE and ROA
-        if result["return_on_equity"] is not None:
-            result["return_on_equity_formatted"] = f"{result['return_on_equity'] * 100:.2f}%"
-        if result["return_on_assets"] is not None:
-            result["return_on_assets_formatted"] = f"{result['return_on_assets'] * 100:.2f}%"
-
-        # Format the growth rates
-        if result["revenue_growth"] is not None:
-            result["revenue_growth_formatted"] = f"{result['revenue_growth'] * 100:.2f}%"
-        if result["earnings_growth"] is not None:
-            result["earnings_growth_formatted"] = f"{result['earnings_growth'] * 100:.2f}%"
-
-        # Format the insider and institutional holdings
-        if result["held_percent_insiders"] is not None:
-            result["held_percent_insiders_formatted"] = f"{result['held_percent_insiders'] * 100:.2f}%"
-        if result["held_percent_institutions"] is not None:
-            result["held_percent_institutions_formatted"] = f"{result['held_percent_institutions'] * 100:.2f}%"
-
-        # Format the short percent of float
-        if result["short_percent_of_float"] is not None:
-            result["short_percent_of_float_formatted"] = f"{result['short_percent_of_float'] * 100:.2f}%"
+            result["market_cap_formatted"] = _format_market_cap(result["market_cap"])
+
+        # Format the dividend yield, margins, returns, growth rates, holdings and short interest
+        for field in RATIO_FIELDS:
+            if result[field] is not None:
+                result[f"{field}_formatted"] = _format_percent(result[field])
 
         return result
 
@@ -591,6 +954,86 @@ def get_company_info_from_yahoo(ticker: str) -> Dict[str, Any]:
 
 
 
+# Most company profiles requested from Yahoo at the same time by get_company_info_batch
+MAX_PARALLEL_LOOKUPS = 8
+
+def get_company_info_batch(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get company information for several tickers, requesting the profiles in parallel.
+
+    Each profile is retrieved with get_company_info_from_yahoo (and cached the same way),
+    with up to MAX_PARALLEL_LOOKUPS requests in flight, so N tickers take about as long as
+    the slowest request instead of N requests one after another.
+
+    Args:
+        tickers (list): The stock ticker symbols (e.g., ["AAPL", "MSFT"])
+
+    Returns:
+        dict: Each ticker's company information (or error dictionary), keyed by ticker
+    """
+    tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers))
+    if not tickers:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_LOOKUPS, len(tickers))) as executor:
+        return dict(zip(tickers, executor.map(get_company_info_from_yahoo, tickers)))
+
+def invalidate_ticker(ticker: str) -> None:
+    """
+    Drop a ticker's cached prices, price histories, technical indicators and company
+    information, e.g. after new data has been ingested, so the next lookup fetches it from
+    Yahoo Finance again.
+
+    Args:
+        ticker (str): The stock ticker symbol (e.g., "AAPL")
+    """
+    ticker = ticker.strip().upper()
+    cache = get_cache()
+    for tool in (get_stock_price, get_company_info_from_yahoo):
+        cache.delete(tool.__name__, make_cache_key(inspect.signature(tool), (ticker,), {}))
+
+    history_signature = inspect.signature(_get_history_bars)
+    for period in VALID_PERIODS:
+        for interval in VALID_INTERVALS:
+            cache.delete("history_bars", make_cache_key(history_signature, (ticker, period, interval), {}))
+
+    indicator_signature = inspect.signature(calculate_technical_indicators)
+    for period in VALID_PERIODS:
+        cache.delete("calculate_technical_indicators", make_cache_key(indicator_signature, (ticker, period), {}))
+
+    with _yahoo_cache_lock:
+        _info_cache.pop(ticker, None)
+
+# Alpha Vantage API endpoint for news, and the source reported in get_market_news' results
+ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+NEWS_SOURCE = "Alpha Vantage NEWS_SENTIMENT API"
+
+def _parse_news_time(time_published: str) -> Tuple[int, str]:
+    """
+    Parse an Alpha Vantage publication time such as "20240501T143000".
+
+    The fields are read by position, which is several times faster than datetime.strptime
+    for the 50 articles of a news feed; out-of-range values are still rejected.
+
+    Args:
+        time_published (str): The publication time, formatted as YYYYMMDDTHHMMSS
+
+    Returns:
+        tuple: (Unix timestamp, time formatted with TIMESTAMP_FORMAT), or (0, "Unknown") if
+               the time is missing or malformed
+    """
+    try:
+        if len(time_published) != 15 or time_published[8] != "T":
+            raise ValueError(time_published)
+        pub_time = datetime(
+            int(time_published[0:4]), int(time_published[4:6]), int(time_published[6:8]),
+            int(time_published[9:11]), int(time_published[11:13]), int(time_published[13:15]),
+        )
+    except (ValueError, TypeError):
+        return 0, "Unknown"
+    return int(pub_time.timestamp()), pub_time.isoformat(" ")
+
+@cached(ttl=1 * HOUR)
 def get_market_news(ticker: Optional[str] = None) -> Dict[str, Any]:
     """
     Get the latest market news, optionally filtered by a specific ticker.
@@ -632,9 +1075,6 @@ def get_market_news(ticker: Optional[str] = None) -> Dict[str, Any]:
         # Print debugging information
         print(f"Requesting market news for {ticker if ticker else 'general market'} using Alpha Vantage API")
 
-        # Alpha Vantage API endpoint for news
-        api_url = "https://www.alphavantage.co/query"
-
         # Set up the query parameters
         params = {
             "function": "NEWS_SENTIMENT",
@@ -645,15 +1085,16 @@ def get_market_news(ticker: Optional[str] = None) -> Dict[str, Any]:
         if ticker:
             params["tickers"] = ticker
 
-        # Make the API request
-        response = requests.get(api_url, params=params)
+        # Make the API request once the Alpha Vantage rate limit allows it
+        ALPHA_VANTAGE_LIMITER.acquire()
+        response = get_http_session().get(ALPHA_VANTAGE_URL, params=params)
 
         # Check if the request was successful
         if response.status_code != 200:
             raise ValueError(f"Failed to retrieve news data: Status code {response.status_code}")
 
-        # Parse the JSON response
-        data = response.json()
+        # Parse the JSON response (with orjson when it is installed)
+        data = loads_json(response.content)
 
         # Check if we have valid data
         if not data or "feed" not in data:
@@ -666,13 +1107,7 @@ def get_market_news(ticker: Optional[str] = None) -> Dict[str, Any]:
         articles = []
         for item in news_feed:
             # Extract the publication time
-            try:
-                pub_time = datetime.strptime(item.get("time_published", ""), "%Y%m%dT%H%M%S")
-                pub_time_formatted = pub_time.strftime("%Y-%m-%d %H:%M:%S")
-                pub_time_timestamp = int(pub_time.timestamp())
-            except (ValueError, TypeError):
-                pub_time_formatted = "Unknown"
-                pub_time_timestamp = 0
+            pub_time_timestamp, pub_time_formatted = _parse_news_time(item.get("time_published", ""))
 
             # Create an article object
             article = {
@@ -691,8 +1126,8 @@ def get_market_news(ticker: Optional[str] = None) -> Dict[str, Any]:
             "ticker": ticker,
             "article_count": len(articles),
             "articles": articles,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "source": "Alpha Vantage NEWS_SENTIMENT API"
+            "timestamp": _now_str(),
+            "source": NEWS_SOURCE
         }
 
         print(f"Successfully retrieved {len(articles)} news articles for {ticker if ticker else 'general market'}")
@@ -701,3 +1136,42 @@ def get_market_news(ticker: Optional[str] = None) -> Dict[str, Any]:
     except Exception as e:
         print(f"Failed to retrieve market news: {str(e)}")
         return {"error": f"Failed to retrieve market news: {str(e)}"}
+
+# The parts of a market snapshot and the tool that retrieves each one
+SNAPSHOT_PARTS = (
+    ("price", get_stock_price),
+    ("historical_data", get_historical_data),
+    ("technical_indicators", calculate_technical_indicators),
+    ("company_info", get_company_info_from_yahoo),
+    ("news", get_market_news),
+)
+
+async def get_full_market_snapshot(ticker: str) -> Dict[str, Any]:
+    """
+    Get all market data for a ticker symbol in one call: the current price, one year of
+    daily history, technical indicators, company information and recent news.
+
+    The five lookups are made concurrently (each in a worker thread, since yfinance and
+    requests are blocking), so the snapshot takes about as long as the slowest of them
+    instead of five model turns and five requests one after another.
+
+    Args:
+        ticker (str): The stock ticker symbol (e.g., "AAPL" for Apple Inc.)
+
+    Returns:
+        dict: The result of each lookup keyed by part ("price", "historical_data",
+              "technical_indicators", "company_info", "news"); a lookup that fails is
+              reported as an error dictionary without affecting the others
+    """
+    ticker = ticker.strip().upper()
+    results = await asyncio.gather(
+        *(asyncio.to_thread(tool, ticker) for _, tool in SNAPSHOT_PARTS),
+        return_exceptions=True
+    )
+
+    snapshot = {"ticker": ticker}
+    for (part, _), result in zip(SNAPSHOT_PARTS, results):
+        if isinstance(result, Exception):
+            result = {"error": f"Failed to retrieve {part.replace('_', ' ')}: {str(result)}"}
+        snapshot[part] = result
+    return snapshot
@@ -0,0 +1,295 @@
+"""
+Streaming Technical Indicators
+
+This module provides incremental versions of the technical indicators in helper_functions.py
+for prices that arrive one bar at a time. Each indicator keeps its running state, so update()
+takes constant time per bar instead of recomputing over the whole history.
+
+Like the helpers, update() returns None until enough bars have been seen.
+
+Each class matches its helper on the bars seen so far, except AtrWilder: it applies Wilder's
+smoothing to every true range, while calculate_atr is the simple mean of the last `window`
+true ranges, so the two give different values once more than `window` true ranges have been
+seen.
+"""
+
+import math
+from typing import Optional
+
+class RollingMean:
+    """
+    Simple moving average over the last `window` values.
+
+    Matches calculate_moving_average on the values seen so far.
+    """
+    __slots__ = ("window", "_buffer", "_index", "_count", "_sum")
+
+    def __init__(self, window: int):
+        """
+        Initialize the indicator.
+
+        Args:
+            window (int): The window size for the moving average
+        """
+        self.window = window
+        self._buffer = [0.0] * window
+        self._index = 0
+        self._count = 0
+        self._sum = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        """
+        Add the next value.
+
+        Args:
+            value (float): The new value
+
+        Returns:
+            float or None: The moving average, or None until `window` values have been seen
+        """
+        self._sum += value - self._buffer[self._index]
+        self._buffer[self._index] = value
+        self._index = (self._index + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+        if self._count < self.window:
+            return None
+        return self._sum / self.window
+
+class RollingStd:
+    """
+    Population standard deviation over the last `window` values, using Welford's method
+    adapted to a sliding window (add the new value and remove the oldest in one step).
+
+    Matches the standard deviation used by calculate_bollinger_bands.
+    """
+    __slots__ = ("window", "_buffer", "_index", "_count", "_mean", "_m2")
+
+    def __init__(self, window: int):
+        """
+        Initialize the indicator.
+
+        Args:
+            window (int): The window size
+        """
+        self.window = window
+        self._buffer = [0.0] * window
+        self._index = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        float or None: The mean of the current window, or None until it is full.
+        """
+        return self._mean if self._count == self.window else None
+
+    def update(self, value: float) -> Optional[float]:
+        """
+        Add the next value.
+
+        Args:
+            value (float): The new value
+
+        Returns:
+            float or None: The standard deviation, or None until `window` values have been seen
+        """
+        if self._count < self.window:
+            # Standard Welford update while the window fills
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+        else:
+            oldest = self._buffer[self._index]
+            previous_mean = self._mean
+            self._mean += (value - oldest) / self.window
+            self._m2 += (value - oldest) * (value - self._mean + oldest - previous_mean)
+
+        self._buffer[self._index] = value
+        self._index = (self._index + 1) % self.window
+        if self._count < self.window:
+            return None
+        # Rounding can leave a tiny negative sum of squares for a flat window
+        return math.sqrt(max(self._m2, 0.0) / self.window)
+
+class EmaOnline:
+    """
+    Exponential moving average, seeded with the simple average of the first `window` values.
+
+    Matches calculate_ema on the values seen so far.
+    """
+    __slots__ = ("window", "multiplier", "_count", "_ema")
+
+    def __init__(self, window: int):
+        """
+        Initialize the indicator.
+
+        Args:
+            window (int): The window size for the EMA
+        """
+        self.window = window
+        self.multiplier = 2 / (window + 1)
+        self._count = 0
+        self._ema = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        """
+        Add the next value.
+
+        Args:
+            value (float): The new value
+
+        Returns:
+            float or None: The EMA, or None until `window` values have been seen
+        """
+        self._count += 1
+        if self._count <= self.window:
+            self._ema += value / self.window
+            return self._ema if self._count == self.window else None
+
+        self._ema = (value - self._ema) * self.multiplier + self._ema
+        return self._ema
+
+class RsiWilder:
+    """
+    Relative Strength Index with Wilder's smoothing: the average gain and loss start as the
+    simple average over the first `window` price changes, then each new change is blended in
+    with weight 1 / window.
+
+    Matches calculate_rsi on the prices seen so far.
+    """
+    __slots__ = ("window", "_previous", "_count", "_avg_gain", "_avg_loss")
+
+    def __init__(self, window: int = 14):
+        """
+        Initialize the indicator.
+
+        Args:
+            window (int, optional): The window size for the RSI calculation. Defaults to 14.
+        """
+        self.window = window
+        self._previous = None
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add the next price.
+
+        Args:
+            price (float): The new price
+
+        Returns:
+            float or None: The RSI, or None until `window` price changes have been seen
+        """
+        previous, self._previous = self._previous, price
+        if previous is None:
+            return None
+
+        change = price - previous
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        self._count += 1
+        if self._count <= self.window:
+            self._avg_gain += gain / self.window
+            self._avg_loss += loss / self.window
+            if self._count < self.window:
+                return None
+        else:
+            self._avg_gain = (self._avg_gain * (self.window - 1) + gain) / self.window
+            self._avg_loss = (self._avg_loss * (self.window - 1) + loss) / self.window
+
+        if self._avg_loss == 0:
+            return 100
+        return 100 - (100 / (1 + self._avg_gain / self._avg_loss))
+
+class AtrWilder:
+    """
+    Average True Range with Wilder's smoothing: the simple average of the first `window`
+    true ranges, then each new true range is blended in with weight 1 / window.
+
+    Unlike calculate_atr (a simple mean of the last `window` true ranges), older true ranges
+    keep a decaying weight, so the values differ after the first `window` true ranges.
+    """
+    __slots__ = ("window", "_previous_close", "_count", "_atr")
+
+    def __init__(self, window: int = 14):
+        """
+        Initialize the indicator.
+
+        Args:
+            window (int, optional): The window size for the ATR. Defaults to 14.
+        """
+        self.window = window
+        self._previous_close = None
+        self._count = 0
+        self._atr = 0.0
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """
+        Add the next bar.
+
+        Args:
+            high (float): The bar's high price
+            low (float): The bar's low price
+            close (float): The bar's closing price
+
+        Returns:
+            float or None: The ATR, or None until `window` true ranges have been seen
+        """
+        previous_close, self._previous_close = self._previous_close, close
+        if previous_close is None:
+            return None
+
+        true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        self._count += 1
+        if self._count <= self.window:
+            self._atr += true_range / self.window
+            return self._atr if self._count == self.window else None
+
+        self._atr = (self._atr * (self.window - 1) + true_range) / self.window
+        return self._atr
+
+class ObvOnline:
+    """
+    On-Balance Volume: starts at the first bar's volume, then adds each bar's volume when the
+    close rises and subtracts it when the close falls.
+
+    Matches calculate_obv on the bars seen so far.
+    """
+    __slots__ = ("_previous_close", "_obv", "_compensation")
+
+    def __init__(self):
+        """
+        Initialize the indicator.
+        """
+        self._previous_close = None
+        self._obv = 0.0
+        # Kahan compensation, so the running total doesn't drift over a long stream
+        self._compensation = 0.0
+
+    def update(self, close: float, volume: float) -> Optional[float]:
+        """
+        Add the next bar.
+
+        Args:
+            close (float): The bar's closing price
+            volume (float): The bar's trading volume
+
+        Returns:
+            float or None: The OBV, or None until two bars have been seen
+        """
+        previous_close, self._previous_close = self._previous_close, close
+        if previous_close is None:
+            self._obv = float(volume)
+            return None
+
+        if close != previous_close:
+            corrected = (volume if close > previous_close else -volume) - self._compensation
+            total = self._obv + corrected
+            self._compensation = (total - self._obv) - corrected
+            self._obv = total
+        return self._obv
@@ -0,0 +1,129 @@
+"""
+Ticker Resolution
+
+This module maps company names to ticker symbols, so the agents don't have to carry ticker
+examples in their instructions. Common names are answered from a small built-in table;
+anything else is looked up in the SEC's list of company tickers.
+"""
+
+import re
+from typing import Dict
+
+from filingsResearch.config import Config
+from filingsResearch.http_session import get_http_session
+from filingsResearch.rate_limit import SEC_LIMITER
+from filingsResearch.caching import cached, DAY
+
+# The SEC's list of every registrant's ticker symbols and names
+SEC_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+# Common names (normalized) that don't match the registered company name
+TICKER_MAP = {
+    "alphabet": "GOOGL",
+    "google": "GOOGL",
+    "amazon": "AMZN",
+    "apple": "AAPL",
+    "berkshire hathaway": "BRK-B",
+    "berkshire": "BRK-B",
+    "broadcom": "AVGO",
+    "coca cola": "KO",
+    "coke": "KO",
+    "costco": "COST",
+    "disney": "DIS",
+    "exxon": "XOM",
+    "exxonmobil": "XOM",
+    "exxon mobil": "XOM",
+    "facebook": "META",
+    "meta": "META",
+    "home depot": "HD",
+    "intel": "INTC",
+    "jpmorgan": "JPM",
+    "jp morgan": "JPM",
+    "jpmorgan chase": "JPM",
+    "mastercard": "MA",
+    "mcdonalds": "MCD",
+    "microsoft": "MSFT",
+    "netflix": "NFLX",
+    "nvidia": "NVDA",
+    "oracle": "ORCL",
+    "paypal": "PYPL",
+    "pepsi": "PEP",
+    "pepsico": "PEP",
+    "procter and gamble": "PG",
+    "p and g": "PG",
+    "robinhood": "HOOD",
+    "salesforce": "CRM",
+    "starbucks": "SBUX",
+    "tesla": "TSLA",
+    "uber": "UBER",
+    "visa": "V",
+    "walmart": "WMT",
+}
+
+# Legal-form words ignored when matching names ("Apple Inc." matches "apple")
+_NAME_SUFFIXES = re.compile(
+    r"\b(the|inc|incorporated|corp|corporation|co|company|ltd|limited|plc|holdings?|group|class [abc])\b"
+)
+
+def _normalize_name(name: str) -> str:
+    """
+    Normalize a company name for matching: lowercase, without punctuation or legal-form words.
+
+    Args:
+        name (str): The company name
+
+    Returns:
+        str: The normalized name
+    """
+    name = name.lower().replace("&", " and ").replace("'", "")
+    name = re.sub(r"[^a-z0-9 ]+", " ", name)
+    name = _NAME_SUFFIXES.sub(" ", name)
+    return " ".join(name.split())
+
+@cached(ttl=7 * DAY)
+def _get_sec_tickers() -> Dict[str, str]:
+    """
+    Download the SEC's company ticker list.
+
+    Returns:
+        dict: Ticker symbols keyed by normalized company name, plus each ticker keyed by
+              itself (lowercase); empty if the list could not be retrieved
+    """
+    SEC_LIMITER.acquire()
+    try:
+        response = get_http_session().get(
+            SEC_COMPANY_TICKERS_URL, headers={"User-Agent": Config.get_sec_user_agent()}, timeout=30
+        )
+        response.raise_for_status()
+        companies = response.json().values()
+    except Exception:
+        return {"error": "Could not retrieve the SEC company ticker list"}
+
+    tickers = {}
+    # The list is ordered by market value, so the first ticker for a name is the main listing
+    for company in companies:
+        tickers.setdefault(_normalize_name(company["title"]), company["ticker"])
+        tickers.setdefault(company["ticker"].lower(), company["ticker"])
+    return tickers
+
+def resolve_ticker(name: str) -> str:
+    """
+    Get the stock ticker symbol for a company name.
+
+    Args:
+        name (str): The company name as the user wrote it (e.g., "Robinhood", "Apple Inc.")
+
+    Returns:
+        str: The ticker symbol (e.g., "HOOD"), or an empty string if the company is not found
+    """
+    normalized = _normalize_name(name)
+    if not normalized:
+        return ""
+
+    if normalized in TICKER_MAP:
+        return TICKER_MAP[normalized]
+
+    sec_tickers = _get_sec_tickers()
+    if "error" in sec_tickers:
+        return ""
+    return sec_tickers.get(normalized) or sec_tickers.get(name.strip().lower(), "")
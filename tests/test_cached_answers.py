@@ -0,0 +1,24 @@
+"""
+Tests for recognizing requests that can be answered from a cached recommendation.
+"""
+
+import pytest
+
+from investment_recommendation_agent import _RECOMMENDATION_REQUEST
+
+@pytest.mark.parametrize("message, ticker", [
+    ("recommendation for AAPL", "AAPL"),
+    ("Buy MSFT?", "MSFT"),
+    ("  hold on TSLA. ", "TSLA"),
+])
+def test_single_ticker_requests_are_recognized(message, ticker):
+    assert _RECOMMENDATION_REQUEST.match(message).group(1) == ticker
+
+@pytest.mark.parametrize("message", [
+    "Buy AAPL or MSFT",
+    "buy or sell? I think AAPL",
+    "recommendation for AAPL and how it compares to last quarter",
+    "buy aapl",
+])
+def test_other_requests_go_to_the_agent(message):
+    assert _RECOMMENDATION_REQUEST.match(message) is None
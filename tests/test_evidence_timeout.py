@@ -0,0 +1,39 @@
+"""
+Tests that a slow research tool can't hold up the evidence timeout.
+"""
+
+import asyncio
+import time
+
+from google.adk.tools.function_tool import FunctionTool
+
+import investment_recommendation_agent
+from filingsResearch.async_tools import run_in_thread
+
+def _slow_lookup(ticker: str) -> str:
+    """
+    A synchronous tool that blocks its thread for two seconds, like a rate limiter wait.
+    """
+    time.sleep(2)
+    return f"Late findings for {ticker}"
+
+def test_slow_tool_is_cut_off_by_the_evidence_timeout(monkeypatch):
+    monkeypatch.setenv("EVIDENCE_TIMEOUT_SECONDS", "0.2")
+    tool = FunctionTool(run_in_thread(_slow_lookup))
+
+    async def run_research_agent(agent, query):
+        # Stand-in for the research agent: ADK runs its tool call the same way
+        return await tool.run_async(args={"ticker": "AAPL"}, tool_context=None)
+
+    monkeypatch.setattr(investment_recommendation_agent, "_run_research_agent", run_research_agent)
+    monkeypatch.setitem(investment_recommendation_agent.EVIDENCE_SOURCES, "market_data", lambda: None)
+
+    async def query():
+        start = time.monotonic()
+        findings = await investment_recommendation_agent._query_source("market_data", "AAPL")
+        return findings, time.monotonic() - start
+
+    findings, elapsed = asyncio.run(query())
+
+    assert findings == "Error gathering market_data evidence: no findings within 0.2 seconds"
+    assert elapsed < 1
@@ -0,0 +1,69 @@
+"""
+Tests that every way of reading a filing chunk returns the same text.
+"""
+
+import asyncio
+
+import pytest
+
+from filingsResearch import caching, sec_filings
+
+FILING_URL = "https://www.sec.gov/Archives/edgar/data/1/000000000125000001/sample-10k.htm"
+
+# A sample filing with multi-byte characters, so chunk boundaries fall inside them
+SAMPLE_FILING = "Société Générale — Zürich résumé: revenue rose 12% to €4.2 billion. " * 200
+
+@pytest.fixture
+def sample_filing(monkeypatch, tmp_path):
+    """
+    Serve SAMPLE_FILING for FILING_URL, with empty in-memory and on-disk caches.
+    """
+    def extract_filing_text(filing_url):
+        return SAMPLE_FILING
+
+    monkeypatch.setattr(sec_filings, "extract_filing_text", extract_filing_text)
+    monkeypatch.setattr(caching, "_default_cache", caching.FileCache(str(tmp_path)))
+    monkeypatch.setattr(sec_filings, "_filing_text_cache", type(sec_filings._filing_text_cache)())
+
+def _chunks(read_chunk, max_chunk_size):
+    total = len(SAMPLE_FILING.encode("utf-8"))
+    return [read_chunk(index) for index in range((total + max_chunk_size - 1) // max_chunk_size)]
+
+def test_chunks_match_whether_or_not_the_filing_is_cached(sample_filing):
+    max_chunk_size = 1001
+
+    fresh = _chunks(lambda index: sec_filings.summarize_filing.__wrapped__(
+        FILING_URL, index, max_chunk_size, include_header=False), max_chunk_size)
+    cached = _chunks(lambda index: sec_filings.summarize_filing(
+        FILING_URL, index, max_chunk_size, include_header=False), max_chunk_size)
+
+    async def read_async():
+        chunks = []
+        for index in range(len(fresh)):
+            chunk = await sec_filings.summarize_filing_async(FILING_URL, index, max_chunk_size)
+            chunks.append(chunk.split("] ", 1)[1])
+        return chunks
+
+    sec_filings._filing_text_cache.clear()
+    streamed = asyncio.run(read_async())
+
+    assert fresh == cached == streamed
+    # The chunks split the text without dropping or repeating characters
+    assert "".join(fresh) == SAMPLE_FILING
+
+def test_async_reader_uses_the_persistent_cache_without_downloading(sample_filing, monkeypatch):
+    expected = sec_filings.summarize_filing(FILING_URL, 1, 1001)
+
+    # A new process: nothing in memory, and the filing must not be downloaded again
+    sec_filings._filing_text_cache.clear()
+
+    def extract_filing_text(filing_url):
+        raise AssertionError("the filing was downloaded although the chunk is cached")
+
+    monkeypatch.setattr(sec_filings, "extract_filing_text", extract_filing_text)
+
+    assert asyncio.run(sec_filings.summarize_filing_async(FILING_URL, 1, 1001)) == expected
+
+def test_invalid_chunk_index_is_not_cached(sample_filing):
+    assert sec_filings.summarize_filing(FILING_URL, 999, 1001).startswith("Invalid chunk_index")
+    assert sec_filings._get_cached_chunk(FILING_URL, 999, 1001) == (False, None)
@@ -10,11 +10,18 @@ The agent can:
 The agent is designed to function as a sub-agent to the investment recommendation agent.
 """
 
+import functools
+
 # Import Google ADK components
 from google.adk.agents.llm_agent import Agent
 
 # Import configuration
 from filingsResearch.config import Config
+from filingsResearch.rate_limit import rate_limited_model
+from filingsResearch.prompt_loader import load_prompt
+from filingsResearch.model_settings import agent_content_config
+from filingsResearch._runtime import run_agent, run_main
+from filingsResearch.async_tools import run_in_thread
 
 # Import tools from transcript_tools
 from transcriptResearch.transcript_tools import (
@@ -24,10 +31,21 @@ from transcriptResearch.transcript_tools import (
     summarize_transcript
 )
 
+# Tools for transcript research, shared with the investment recommendation agent
+TRANSCRIPT_TOOLS = (
+    search_investor_meetings,
+    get_transcript_text,
+    get_most_recent_transcript,
+    summarize_transcript
+)
+
+@functools.lru_cache(maxsize=1)
 def create_transcript_summarization_agent():
     """
     Create a Transcript Summarization Agent.
 
+    The agent is built once and reused on later calls.
+
     Returns:
         An Agent configured to search for and summarize investor meeting transcripts.
     """
@@ -53,102 +71,31 @@ def create_transcript_summarization_agent():
             "You can obtain an Alpha Vantage API key by registering at https://www.alphavantage.co/support/#api-key"
         )
 
-    # Create tools for transcript research
-    transcript_tools = [
-        search_investor_meetings,
-        get_transcript_text,
-        get_most_recent_transcript,
-        summarize_transcript
-    ]
-
     # Create the agent with a simple configuration
     agent = Agent(
         name="transcript_summarization_agent",
-        model="gemini-2.0-flash",
+        model=rate_limited_model("gemini-2.0-flash"),
         description="Agent to search for and summarize investor meeting transcripts.",
-        instruction="""I am a transcript summarization agent whose primary purpose is to provide comprehensive summaries of investor meeting transcripts. I have four powerful tools to assist with this:
-
-1. Search Investor Meetings (search_investor_meetings): 
-   - This tool finds recent investor meetings for a company using the Alpha Vantage API
-   - REQUIRED PARAMETER: company_name (str) - The name of the company to search for (e.g., "Apple", "Microsoft", "Tesla")
-   - OPTIONAL PARAMETERS (I don't need to provide these, the function handles defaults automatically):
-     * ticker_symbol (str) - The ticker symbol for the company (e.g., "AAPL", "MSFT") - I will always use this when provided by the investment_recommendation_agent
-     * count (int) - The number of results to return (default: 20)
-     * specific_date (str) - A specific date to search for in format YYYY-MM-DD (e.g., "2023-05-04")
-     * reference (str) - A reference to a specific meeting (e.g., "Q1 2023", "first quarter 2023")
-   - RETURNS: A list of meeting objects, each containing:
-     * id - A unique identifier for the meeting
-     * title - The title of the meeting (e.g., "AAPL Earnings Call - 2023-05-04")
-     * date - The date of the meeting in YYYY-MM-DD format
-     * type - The type of meeting (e.g., "Earnings Call", "Investor Day")
-     * url - A URL to access the meeting transcript
-   - I will automatically use this tool when the investment_recommendation_agent provides a company name
-   - I will NEVER ask the user for company names, ticker symbols, or any other technical information
-
-2. Get Transcript Text (get_transcript_text):
-   - This tool retrieves the full text of an investor meeting transcript using the Alpha Vantage API
-   - REQUIRED PARAMETER: meeting_info (dict) - A dictionary containing information about the meeting
-     * This should be one of the meeting objects returned by search_investor_meetings
-     * Must contain either "ticker" or a "url" from which the ticker can be extracted
-     * Should contain "date" for the specific meeting date
-   - RETURNS: A string containing the full text of the transcript
-   - I will automatically use this tool after finding relevant meetings with search_investor_meetings
-   - I will NEVER ask the user which meeting to retrieve
-
-3. Get Most Recent Transcript (get_most_recent_transcript):
-   - This tool automatically retrieves the transcript for the most recent investor meeting for a company
-   - REQUIRED PARAMETER: company_name (str) - The name of the company to search for (e.g., "Apple", "Microsoft", "Tesla")
-   - OPTIONAL PARAMETER: ticker_symbol (str) - The ticker symbol for the company (e.g., "AAPL", "MSFT")
-   - RETURNS: A string containing the full text of the most recent transcript
-   - This tool combines the functionality of search_investor_meetings and get_transcript_text into a single call
-   - I will ALWAYS use this tool first when asked to get a transcript, as it automatically gets the most recent one
-   - I will only use the other tools if I need to get a specific transcript that is not the most recent one
-
-4. Summarize Transcript (summarize_transcript):
-   - This tool analyzes a transcript and extracts key information using an LLM
-   - REQUIRED PARAMETER: transcript_text (str) - The full text of the transcript from get_transcript_text or get_most_recent_transcript
-   - RETURNS: A dictionary containing the summarized information:
-     * meeting_type - The type of meeting (e.g., "Earnings Call", "Investor Day")
-     * financial_highlights - A list of key financial metrics and trends
-     * strategic_initiatives - A list of important business developments and strategic plans
-     * outlook - A list of statements about future expectations and guidance
-     * key_quotes - A list of important quotes from executives
-     * full_summary - A comprehensive summary of the transcript
-   - I will automatically use this tool to analyze the transcript text obtained from get_transcript_text or get_most_recent_transcript
-   - I will NEVER ask the user to help with the summarization process
-
-CRITICAL: I MUST OPERATE COMPLETELY AUTONOMOUSLY. I will:
-1. AUTOMATICALLY use get_most_recent_transcript when the investment_recommendation_agent provides a company name
-2. AUTOMATICALLY use summarize_transcript to analyze the transcript text
-3. NEVER ask the user for any technical information such as company names, ticker symbols, or meeting dates
-4. NEVER wait for user input between these steps - I will gather ALL information myself
-
-For each summary, I will:
-- Identify the meeting type (earnings call, investor day, annual meeting, etc.)
-- Extract key financial metrics and trends
-- Highlight important strategic initiatives and business developments
-- Include management's outlook and guidance
-- Present the information in a clear, organized manner
-
-I will NEVER include images in my responses, only text. Even when discussing charts or visual elements from transcripts, I will describe them textually instead of showing images.
-
-I will NOT provide BUY, HOLD, or SELL recommendations. My purpose is solely to provide comprehensive summaries of investor meeting transcripts to the root agent.
-
-CRITICAL: When I return information to the investment_recommendation_agent, I MUST ALWAYS include the COMPLETE transcript summary in my response. This includes:
-1. The full dictionary returned by the summarize_transcript tool, with all its components:
-   - meeting_type
-   - financial_highlights
-   - strategic_initiatives
-   - outlook
-   - key_quotes
-   - full_summary
-2. A clear, well-formatted presentation of this information that the investment_recommendation_agent can easily use in its recommendation
-
-The investment_recommendation_agent RELIES on receiving this complete summary to make accurate investment recommendations. I must ensure that ALL key information from the transcript is included in my response.
-
-IMPORTANT: After providing the requested transcript information with the complete summary, I MUST ALWAYS transfer control back to the investment_recommendation_agent. I should never continue the conversation with the user directly. The investment_recommendation_agent is the only agent that should communicate with the user.""",
-        tools=transcript_tools,
+        instruction=load_prompt("transcript_summarization.md"),
+        # Run the tools in worker threads, so Alpha Vantage rate limit waits and downloads
+        # don't block the event loop
+        tools=[run_in_thread(tool) for tool in TRANSCRIPT_TOOLS],
+        generate_content_config=agent_content_config(),
         output_key="latest_transcript_summary"
     )
 
-    return agent
\ No newline at end of file
+    return agent
+
+# Example of how to run the agent
+async def main():
+    """
+    Run the Transcript Summarization Agent.
+
+    This function creates and runs the agent, allowing users to interact with it
+    to find and summarize investor meeting transcripts.
+    """
+    await run_agent(create_transcript_summarization_agent)
+
+if __name__ == "__main__":
+    # Run the main function when the script is executed directly
+    run_main(main())
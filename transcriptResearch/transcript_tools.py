@@ -20,6 +20,9 @@ import random
 
 # Import configuration
 from filingsResearch.config import Config
+from filingsResearch.http_session import get_http_session
+from filingsResearch.rate_limit import ALPHA_VANTAGE_LIMITER
+from filingsResearch.caching import cached, DAY
 
 # Rate limiting parameters
 MAX_RETRIES = 7
@@ -27,6 +30,69 @@ INITIAL_DELAY = 2.0
 BACKOFF_FACTOR = 2.0
 JITTER_FACTOR = 0.1
 
+# Transcripts longer than this are condensed to their most informative sentences
+TRANSCRIPT_MAX_CHARS = 30000
+
+# Terms that mark the sentences an investor cares about most
+TRANSCRIPT_KEY_TERMS = (
+    "guidance", "outlook", "expect", "forecast", "revenue", "sales", "margin", "earnings",
+    "eps", "profit", "growth", "cash flow", "free cash", "demand", "backlog", "customers",
+    "pricing", "cost", "headwind", "tailwind", "buyback", "dividend", "capex", "quarter",
+    "year-over-year", "record", "strategy", "launch", "acquisition", "risk",
+)
+_KEY_TERM_PATTERN = re.compile("|".join(re.escape(term) for term in TRANSCRIPT_KEY_TERMS), re.IGNORECASE)
+_FIGURE_PATTERN = re.compile(r'[$%]|\d')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+def condense_transcript_entries(entries: List[Dict[str, Any]], max_chars: int = TRANSCRIPT_MAX_CHARS) -> Tuple[List[Dict[str, str]], bool]:
+    """
+    Condense transcript entries to their most informative sentences.
+
+    Each sentence is scored by how many key investor terms (guidance, revenue, margin, ...)
+    it mentions, with a bonus for figures, and the best sentences are kept in their original
+    order until max_chars is reached. Short transcripts are returned unchanged.
+
+    Args:
+        entries (list): Transcript entries, each with "speaker" and "text" keys
+        max_chars (int, optional): Character budget for the kept text. Defaults to TRANSCRIPT_MAX_CHARS.
+
+    Returns:
+        tuple: (entries, condensed) where entries holds the kept text per speaker turn and
+               condensed is True if any sentences were dropped
+    """
+    total_chars = sum(len(entry.get("text", "")) for entry in entries)
+    if total_chars <= max_chars:
+        return entries, False
+
+    # (entry index, sentence index, sentence, score)
+    sentences = []
+    for entry_index, entry in enumerate(entries):
+        for sentence_index, sentence in enumerate(_SENTENCE_BREAK.split(entry.get("text", "").strip())):
+            if sentence:
+                score = len(_KEY_TERM_PATTERN.findall(sentence)) + (0.5 if _FIGURE_PATTERN.search(sentence) else 0)
+                sentences.append((entry_index, sentence_index, sentence, score))
+
+    kept = set()
+    used_chars = 0
+    for entry_index, sentence_index, sentence, score in sorted(sentences, key=lambda item: -item[3]):
+        if score == 0 or used_chars + len(sentence) > max_chars:
+            continue
+        kept.add((entry_index, sentence_index))
+        used_chars += len(sentence) + 1
+
+    # Regroup the kept sentences by speaker turn, in their original order
+    kept_by_entry = {}
+    for entry_index, sentence_index, sentence, _ in sentences:
+        if (entry_index, sentence_index) in kept:
+            kept_by_entry.setdefault(entry_index, []).append(sentence)
+
+    condensed_entries = [
+        {"speaker": entries[entry_index].get("speaker", "Unknown Speaker"), "text": " ".join(kept_sentences)}
+        for entry_index, kept_sentences in kept_by_entry.items()
+    ]
+
+    return condensed_entries, True
+
 def make_api_request_with_retry(url: str, params: Dict[str, str] = None) -> Tuple[bool, Union[Dict, str]]:
     """
     Make an API request with retry logic for rate limiting and network errors.
@@ -46,11 +112,12 @@ def make_api_request_with_retry(url: str, params: Dict[str, str] = None) -> Tupl
 
     while True:
         try:
-            # Make the API request
+            # Make the API request once the Alpha Vantage rate limit allows it
+            ALPHA_VANTAGE_LIMITER.acquire()
             if params:
-                response = requests.get(url, params=params)
+                response = get_http_session().get(url, params=params)
             else:
-                response = requests.get(url)
+                response = get_http_session().get(url)
 
             # Check if the request was successful
             if response.status_code != 200:
@@ -798,8 +865,8 @@ This could be because:
 Please try a different meeting or check the company's investor relations website for the transcript.
 """
 
-        # Extract the transcript data
-        transcript_data = data["transcript"]
+        # Extract the transcript data, condensing long calls to their key passages
+        transcript_data, condensed = condense_transcript_entries(data["transcript"])
 
         # Format the transcript text
         transcript_text = f"""
@@ -813,6 +880,8 @@ Please try a different meeting or check the company's investor relations website
 
 ## Transcript
 """
+        if condensed:
+            transcript_text += "\n(Condensed to the passages on guidance, results and strategy.)\n"
 
         # Add each speaker's part to the transcript
         for entry in transcript_data:
@@ -826,6 +895,7 @@ Please try a different meeting or check the company's investor relations website
         # If there's an error, return an error message
         return f"Error retrieving transcript: {str(e)}"
 
+@cached(ttl=1 * DAY)
 def get_most_recent_transcript(company_name: str, ticker_symbol: Optional[str] = None) -> str:
     """
     Get the transcript for the most recent investor meeting for a company.
@@ -912,8 +982,8 @@ def get_most_recent_transcript(company_name: str, ticker_symbol: Optional[str] =
                 print(f"No transcript found for {quarter_str}.")
                 return None
 
-            # Extract the transcript data
-            transcript_data = data["transcript"]
+            # Extract the transcript data, condensing long calls to their key passages
+            transcript_data, condensed = condense_transcript_entries(data["transcript"])
 
             # Format the transcript text
             transcript_text = f"""
@@ -927,6 +997,8 @@ def get_most_recent_transcript(company_name: str, ticker_symbol: Optional[str] =
 
 ## Transcript
 """
+            if condensed:
+                transcript_text += "\n(Condensed to the passages on guidance, results and strategy.)\n"
 
             # Add each speaker's part to the transcript
             for entry in transcript_data:
@@ -990,6 +1062,7 @@ Please try a different company or check the company's investor relations website
         # If there's an error, return an error message
         return f"Error retrieving the most recent transcript for {company_name}: {str(e)}"
 
+@cached(ttl=90 * DAY)
 def summarize_transcript(transcript_text: str) -> Dict[str, Any]:
     """
     Summarize the key information from a transcript.